@@ -9,6 +9,7 @@ e vantagens da alocação dinâmica.
 import sys
 import time
 import random
+from collections import deque
 
 
 class No:
@@ -24,29 +25,103 @@ class No:
         return str(self.valor)
 
 
+class PoolNos:
+    """
+    Pool de nós (free-list) que reaproveita nós desligados de uma estrutura.
+    Em vez de alocar um novo nó a cada inserção e deixar o nó removido para o
+    garbage collector, os nós removidos ficam guardados numa lista encadeada de
+    nós livres (usando o próprio campo 'proximo') e são reutilizados.
+    Um mesmo pool pode ser compartilhado por várias estruturas.
+    """
+    def __init__(self, limite=1000):
+        self.limite = limite  # Quantidade máxima de nós livres guardados
+        self.livres = None
+        self.quantidade_livres = 0
+        self.acertos = 0      # Alocações atendidas com um nó reaproveitado
+        self.falhas = 0       # Alocações que precisaram criar um nó novo
+        self.descartes = 0    # Nós devolvidos com o pool cheio
+    
+    def alocar(self, valor):
+        """Retorna um nó com o valor informado, reaproveitando um nó livre se houver."""
+        no = self.livres
+        if no is None:
+            self.falhas += 1
+            return No(valor)  # Pool vazio: alocação dinâmica normal
+        
+        self.livres = no.proximo
+        self.quantidade_livres -= 1
+        self.acertos += 1
+        no.valor = valor
+        no.proximo = None
+        return no
+    
+    def liberar(self, no):
+        """Devolve um nó desligado da estrutura para o pool."""
+        no.valor = None  # Não mantém o valor antigo vivo na memória
+        if self.quantidade_livres >= self.limite:
+            self.descartes += 1
+            return  # Pool cheio: o nó fica para o garbage collector
+        
+        no.proximo = self.livres
+        self.livres = no
+        self.quantidade_livres += 1
+    
+    def taxa_acerto(self):
+        """Retorna a fração de alocações atendidas pelo pool."""
+        total = self.acertos + self.falhas
+        if total == 0:
+            return 0.0
+        return self.acertos / total
+
+
 class ListaEncadeada:
     """
     Implementação simples de uma lista encadeada.
     Demonstra a alocação dinâmica de memória à medida que novos nós são adicionados.
+    Opcionalmente recebe um PoolNos para reaproveitar os nós removidos.
+    Com indexar=True, mantém um índice (dicionário) de valor -> deque dos nós com
+    esse valor, na ordem da lista, e um dicionário de nó -> nó anterior. Juntos,
+    eles tornam buscar, contem e remover(valor) O(1) em média, mesmo com valores
+    repetidos.
     """
-    def __init__(self):
+    def __init__(self, pool=None, indexar=False):
         self.cabeca = None
         self.tamanho = 0
+        self.pool = pool
+        self.indice = None
+        self.anteriores = None
+        if indexar:
+            self.ativar_indice()
+    
+    def _novo_no(self, valor):
+        if self.pool is None:
+            return No(valor)  # Alocação dinâmica de memória para o novo nó
+        return self.pool.alocar(valor)
     
     def esta_vazia(self):
         return self.cabeca is None
     
     def inserir_inicio(self, valor):
         """Insere um novo nó no início da lista."""
-        novo_no = No(valor)  # Alocação dinâmica de memória para o novo nó
+        if self.indice is not None:
+            hash(valor)  # Um valor sem hash levanta TypeError antes de alterar a lista
+        novo_no = self._novo_no(valor)
         novo_no.proximo = self.cabeca
+        if self.indice is not None:
+            self.indice.setdefault(valor, deque()).appendleft(novo_no)
+            self.anteriores[novo_no] = None
+            if self.cabeca is not None:
+                self.anteriores[self.cabeca] = novo_no
         self.cabeca = novo_no
         self.tamanho += 1
     
     def inserir_fim(self, valor):
         """Insere um novo nó no fim da lista."""
-        novo_no = No(valor)  # Alocação dinâmica de memória para o novo nó
+        if self.indice is not None:
+            hash(valor)  # Um valor sem hash levanta TypeError antes de alterar a lista
+        novo_no = self._novo_no(valor)
         
+        atual = None
         if self.esta_vazia():
             self.cabeca = novo_no
         else:
@@ -55,6 +130,9 @@ class ListaEncadeada:
                 atual = atual.proximo
             atual.proximo = novo_no
         
+        if self.indice is not None:
+            self.indice.setdefault(valor, deque()).append(novo_no)
+            self.anteriores[novo_no] = atual
         self.tamanho += 1
     
     def remover(self, valor):
@@ -62,9 +140,14 @@ class ListaEncadeada:
         if self.esta_vazia():
             return False
         
+        if self.indice is not None:
+            return self._remover_indexado(valor)
+        
         # Caso especial: remover o primeiro nó
         if self.cabeca.valor == valor:
-            self.cabeca = self.cabeca.proximo  # A memória do nó removido será coletada pelo garbage collector
+            removido = self.cabeca
+            self.cabeca = removido.proximo  # O nó removido vai para o pool ou para o garbage collector
+            self._descartar_no(removido)
             self.tamanho -= 1
             return True
         
@@ -75,12 +158,113 @@ class ListaEncadeada:
         
         # Se encontrou o nó
         if atual.proximo:
-            atual.proximo = atual.proximo.proximo  # Desreferencia o nó, que será coletado pelo garbage collector
+            removido = atual.proximo
+            atual.proximo = removido.proximo  # Desreferencia o nó (pool ou garbage collector)
+            self._descartar_no(removido)
             self.tamanho -= 1
             return True
         
         return False
     
+    def remover_inicio(self):
+        """Remove e retorna o valor do primeiro nó."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        
+        removido = self.cabeca
+        valor = removido.valor
+        if self.indice is not None:
+            self._desindexar_primeiro(valor)  # O primeiro nó é a primeira ocorrência do valor
+            self._desligar(removido)
+        else:
+            self.cabeca = removido.proximo
+        self._descartar_no(removido)
+        self.tamanho -= 1
+        return valor
+    
+    def buscar(self, valor):
+        """Retorna o primeiro nó com o valor, ou None - O(1) em média com índice, O(n) sem."""
+        if self.indice is not None:
+            nos = self.indice.get(valor)
+            return nos[0] if nos else None
+        
+        atual = self.cabeca
+        while atual and atual.valor != valor:
+            atual = atual.proximo
+        return atual
+    
+    def contem(self, valor):
+        """Verifica se o valor está na lista."""
+        return self.buscar(valor) is not None
+    
+    def ativar_indice(self):
+        """Constrói os índices (valor -> nós e nó -> anterior) percorrendo a lista - O(n)."""
+        # Os índices só são instalados no fim: um valor sem hash deixa a lista sem índice
+        indice = {}
+        anteriores = {}
+        anterior = None
+        atual = self.cabeca
+        while atual:
+            indice.setdefault(atual.valor, deque()).append(atual)
+            anteriores[atual] = anterior
+            anterior = atual
+            atual = atual.proximo
+        self.indice = indice
+        self.anteriores = anteriores
+    
+    def desativar_indice(self):
+        """Descarta o índice (útil em cargas só de inserção, que não precisam dele)."""
+        self.indice = None
+        self.anteriores = None
+    
+    def memoria_indice(self):
+        """Retorna os bytes ocupados pelo índice (dicionários e deques de nós)."""
+        if self.indice is None:
+            return 0
+        return (sys.getsizeof(self.indice) + sys.getsizeof(self.anteriores)
+                + sum(sys.getsizeof(nos) for nos in self.indice.values()))
+    
+    def _desindexar_primeiro(self, valor):
+        """Retira do índice o primeiro nó com o valor e o retorna - O(1)."""
+        nos = self.indice[valor]
+        no = nos.popleft()
+        if not nos:
+            del self.indice[valor]
+        return no
+    
+    def _desligar(self, no):
+        """Desliga o nó da lista usando o nó anterior guardado no índice - O(1)."""
+        anterior = self.anteriores.pop(no)
+        seguinte = no.proximo
+        if anterior is None:
+            self.cabeca = seguinte
+        else:
+            anterior.proximo = seguinte
+        if seguinte is not None:
+            self.anteriores[seguinte] = anterior
+    
+    def _remover_indexado(self, valor):
+        """
+        Remove a primeira ocorrência do valor usando o índice - O(1) em média.
+        O índice entrega o próprio nó, e o dicionário de anteriores entrega o nó
+        que aponta para ele, então o nó é desligado sem percorrer a lista. Os
+        outros nós não são alterados: um nó retornado por buscar() continua com o
+        mesmo valor enquanto estiver na lista.
+        """
+        if valor not in self.indice:
+            return False
+        
+        no = self._desindexar_primeiro(valor)
+        self._desligar(no)
+        self._descartar_no(no)
+        self.tamanho -= 1
+        return True
+    
+    def _descartar_no(self, no):
+        """Entrega o nó removido ao pool, se houver; senão, ao garbage collector."""
+        if self.pool is not None:
+            self.pool.liberar(no)
+    
     def imprimir(self):
         """Imprime todos os elementos da lista."""
         if self.esta_vazia():
@@ -200,26 +384,110 @@ def demonstrar_aplicacao_pratica():
     print(f"Hoje chegaram {num_transacoes} transações para processar.")
     
     # Em um sistema real, estas transações viriam de uma fonte externa (arquivo, banco de dados, etc.)
-    transacoes = []  # Lista dinamicamente alocada
+    def receber_transacoes():
+        # Gerador: cada transação é produzida somente quando for processada
+        for _ in range(num_transacoes):
+            # Gerando uma transação aleatória entre R$10 e R$1000
+            yield round(random.uniform(10, 1000), 2)
     
-    # Processando cada transação
-    valor_total = 0
-    for i in range(num_transacoes):
-        # Gerando uma transação aleatória entre R$10 e R$1000
-        valor = round(random.uniform(10, 1000), 2)
-        transacoes.append(valor)
-        valor_total += valor
-    
-    # Mostrando as transações processadas
+    # Processando cada transação à medida que chega, sem guardar todas na memória
     print("\nTransações processadas:")
-    for i, valor in enumerate(transacoes, 1):
+    valor_total = 0
+    for i, valor in enumerate(receber_transacoes(), 1):
         print(f"Transação {i}: R$ {valor:.2f}")
+        valor_total += valor
     
     print(f"\nValor total: R$ {valor_total:.2f}")
     print(f"Valor médio: R$ {valor_total/num_transacoes:.2f}")
     
     print("\nNeste exemplo, a alocação dinâmica permite processar qualquer número de transações")
     print("sem precisar definir um limite máximo antecipadamente.")
+    print("Para arquivos com milhões de transações, veja exemplo_transacoes_streaming.py.")
+
+
+def comparar_pool_nos(operacoes=1000000, profundidade=100):
+    """
+    Compara a lista encadeada com e sem pool de nós em uma carga de "churn":
+    a lista oscila em torno de um tamanho pequeno, com milhões de inserções
+    e remoções que, sem o pool, alocam e descartam um nó a cada operação.
+    """
+    print("\n5. POOL DE NÓS: REAPROVEITANDO A MEMÓRIA DOS NÓS REMOVIDOS")
+    print("-" * 50)
+    
+    def executar_churn(lista):
+        # Mantém 'profundidade' nós vivos e faz inserção + remoção repetidamente
+        for i in range(profundidade):
+            lista.inserir_inicio(i)
+        inicio = time.perf_counter()
+        for i in range(operacoes):
+            lista.inserir_inicio(i)
+            lista.remover_inicio()
+        return time.perf_counter() - inicio
+    
+    tempo_sem_pool = executar_churn(ListaEncadeada())
+    print(f"Sem pool: {tempo_sem_pool:.3f} segundos para {operacoes} inserções/remoções")
+    
+    pool = PoolNos(limite=profundidade)
+    tempo_com_pool = executar_churn(ListaEncadeada(pool=pool))
+    print(f"Com pool: {tempo_com_pool:.3f} segundos para {operacoes} inserções/remoções")
+    
+    print(f"\nMétricas do pool: {pool.acertos} acertos, {pool.falhas} falhas, "
+          f"{pool.descartes} descartes")
+    print(f"Taxa de acerto: {pool.taxa_acerto() * 100:.2f}%")
+    print(f"Razão de tempo (sem pool / com pool): {tempo_sem_pool / tempo_com_pool:.2f}x")
+    
+    # Um pool compartilhado atende várias estruturas ao mesmo tempo
+    compartilhado = PoolNos(limite=10)
+    origem = ListaEncadeada(pool=compartilhado)
+    destino = ListaEncadeada(pool=compartilhado)
+    for i in range(5):
+        origem.inserir_fim(i)
+    while not origem.esta_vazia():
+        destino.inserir_fim(origem.remover_inicio())
+    print(f"\nPool compartilhado entre duas listas: {compartilhado.acertos} de "
+          f"{compartilhado.acertos + compartilhado.falhas} nós reaproveitados")
+    
+    print("\nObservações:")
+    print("- Em CPython a alocação de objetos pequenos já é rápida, então o ganho")
+    print("  vem principalmente de evitar a criação/destruição de objetos e o GC")
+    print("- O limite do pool impede que ele retenha memória demais após picos")
+
+
+def comparar_indice_hash(tamanho=10000, consultas=5000):
+    """Compara buscas e remoções por valor com e sem o índice de valor -> nós."""
+    print("\n6. ÍNDICE HASH PARA BUSCAS POR VALOR")
+    print("-" * 50)
+    
+    gerador = random.Random(5)
+    valores = [gerador.randrange(tamanho // 2) for _ in range(tamanho)]  # Com repetições
+    procurados = [gerador.randrange(tamanho) for _ in range(consultas)]
+    
+    for indexar in (False, True):
+        lista = ListaEncadeada(indexar=indexar)
+        for valor in valores:
+            lista.inserir_inicio(valor)
+        
+        inicio = time.perf_counter()
+        encontrados = sum(1 for valor in procurados if lista.contem(valor))
+        tempo_busca = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        removidos = sum(1 for valor in procurados[:consultas // 10] if lista.remover(valor))
+        tempo_remocao = time.perf_counter() - inicio
+        
+        descricao = "Com índice" if indexar else "Sem índice"
+        print(f"{descricao}: {consultas} buscas em {tempo_busca:.4f} s ({encontrados} encontrados) | "
+              f"{consultas // 10} remoções em {tempo_remocao:.4f} s ({removidos} removidos)")
+        if indexar:
+            memoria_nos = lista.tamanho * (sys.getsizeof(lista.cabeca) + sys.getsizeof(lista.cabeca.__dict__))
+            print(f"Memória do índice: {lista.memoria_indice()} bytes "
+                  f"(os próprios nós ocupam cerca de {memoria_nos} bytes)")
+    
+    print("\nObservações:")
+    print("- O índice é atualizado a cada inserção e remoção, sem reconstrução")
+    print("- Valores repetidos ficam em uma deque de nós, na mesma ordem da lista encadeada;")
+    print("  com o nó anterior de cada nó guardado, remover não percorre a lista")
+    print("- Em cargas só de inserção o índice é custo sem benefício: use indexar=False")
 
 
 if __name__ == "__main__":
@@ -232,6 +500,8 @@ if __name__ == "__main__":
     demonstrar_lista_encadeada()
     comparar_com_arrays_estaticos()
     demonstrar_aplicacao_pratica()
+    comparar_pool_nos()
+    comparar_indice_hash()
     
     print("\nCONCLUSÃO:")
     print("A alocação dinâmica de memória permite que programas utilizem memória")
@@ -0,0 +1,224 @@
+"""
+Exemplo de Vetor Dinâmico com Políticas de Crescimento
+
+Este script implementa explicitamente o que a lista do Python faz por baixo dos panos:
+um vetor com capacidade fixa que é realocado (e copiado) quando fica cheio.
+As políticas de crescimento e de encolhimento são configuráveis e contadores
+registram quantas realocações ocorreram, quantos bytes foram copiados e qual
+foi a maior folga (espaço reservado e não usado).
+"""
+
+import sys
+import time
+
+
+TAMANHO_REFERENCIA = 8  # Bytes por posição (uma referência em CPython 64 bits)
+
+
+def crescimento_multiplicativo(fator):
+    """Política que multiplica a capacidade pelo fator (ex.: 1.5 ou 2)."""
+    def politica(capacidade, necessario):
+        nova = max(capacidade, 1)
+        while nova < necessario:
+            nova = max(int(nova * fator), nova + 1)
+        return nova
+    politica.nome = f"{fator}x"
+    return politica
+
+
+def crescimento_fixo(incremento):
+    """Política que soma um incremento fixo à capacidade."""
+    def politica(capacidade, necessario):
+        nova = capacidade
+        while nova < necessario:
+            nova += incremento
+        return nova
+    politica.nome = f"+{incremento}"
+    return politica
+
+
+class VetorDinamico:
+    """
+    Vetor dinâmico construído sobre um buffer de tamanho fixo.
+    Quando o buffer enche, um novo buffer maior é alocado e os elementos são copiados.
+    Quando a ocupação cai abaixo de 'ocupacao_minima', o buffer é reduzido para o
+    dobro do tamanho atual. Como a redução só acontece bem abaixo do ponto de
+    crescimento (histerese), inserir e remover alternadamente na fronteira não
+    provoca realocações sucessivas.
+    """
+    
+    def __init__(self, politica=None, ocupacao_minima=0.25, capacidade_minima=4):
+        self.politica = politica or crescimento_multiplicativo(2)
+        self.ocupacao_minima = ocupacao_minima
+        self.capacidade_minima = capacidade_minima
+        self._buffer = [None] * capacidade_minima
+        self._tamanho = 0
+        
+        # Contadores
+        self.redimensionamentos = 0
+        self.bytes_copiados = 0
+        self.folga_maxima = capacidade_minima
+    
+    def capacidade(self):
+        """Retorna o número de posições alocadas no buffer."""
+        return len(self._buffer)
+    
+    def __len__(self):
+        return self._tamanho
+    
+    def _realocar(self, nova_capacidade):
+        """Aloca um novo buffer e copia os elementos existentes para ele."""
+        novo_buffer = [None] * nova_capacidade
+        novo_buffer[:self._tamanho] = self._buffer[:self._tamanho]  # Cópia de bloco (como um memcpy)
+        self._buffer = novo_buffer
+        self.redimensionamentos += 1
+        self.bytes_copiados += self._tamanho * TAMANHO_REFERENCIA
+    
+    def _registrar_folga(self):
+        folga = len(self._buffer) - self._tamanho
+        if folga > self.folga_maxima:
+            self.folga_maxima = folga
+    
+    def reservar(self, n):
+        """Garante capacidade para pelo menos n elementos sem novas realocações."""
+        if n > len(self._buffer):
+            self._realocar(n)
+            self._registrar_folga()
+    
+    def anexar(self, item):
+        """Adiciona um item ao final - O(1) amortizado."""
+        if self._tamanho == len(self._buffer):
+            self._realocar(self.politica(len(self._buffer), self._tamanho + 1))
+        self._buffer[self._tamanho] = item
+        self._tamanho += 1
+        self._registrar_folga()
+    
+    def remover_ultimo(self):
+        """Remove e retorna o último item, encolhendo o buffer se a ocupação ficar baixa."""
+        if self._tamanho == 0:
+            raise IndexError("Vetor vazio")
+        
+        self._tamanho -= 1
+        item = self._buffer[self._tamanho]
+        self._buffer[self._tamanho] = None
+        
+        capacidade = len(self._buffer)
+        if (capacidade > self.capacidade_minima and
+                self._tamanho < capacidade * self.ocupacao_minima):
+            self._realocar(max(self.capacidade_minima, self._tamanho * 2))
+        self._registrar_folga()
+        return item
+    
+    def obter(self, indice):
+        """Retorna o item na posição indicada - O(1)."""
+        if indice < 0 or indice >= self._tamanho:
+            raise IndexError("Índice inválido")
+        return self._buffer[indice]
+    
+    def definir(self, indice, item):
+        """Substitui o item na posição indicada - O(1)."""
+        if indice < 0 or indice >= self._tamanho:
+            raise IndexError("Índice inválido")
+        self._buffer[indice] = item
+    
+    def __getitem__(self, indice):
+        return self.obter(indice)
+    
+    def estatisticas(self):
+        """Retorna um dicionário com os contadores do vetor."""
+        return {
+            "tamanho": self._tamanho,
+            "capacidade": len(self._buffer),
+            "redimensionamentos": self.redimensionamentos,
+            "bytes_copiados": self.bytes_copiados,
+            "folga_maxima": self.folga_maxima,
+        }
+
+
+def demonstrar_vetor_dinamico():
+    """Mostra o vetor crescendo e encolhendo passo a passo."""
+    print("\n1. VETOR DINÂMICO PASSO A PASSO")
+    print("-" * 50)
+    
+    vetor = VetorDinamico(crescimento_multiplicativo(2))
+    for i in range(10):
+        capacidade_antes = vetor.capacidade()
+        vetor.anexar(i)
+        if vetor.capacidade() != capacidade_antes:
+            print(f"Ao anexar o elemento {i}, a capacidade passou de "
+                  f"{capacidade_antes} para {vetor.capacidade()}")
+    
+    print(f"\nEstatísticas após 10 inserções: {vetor.estatisticas()}")
+    
+    print("\nRemovendo elementos:")
+    while len(vetor) > 1:
+        capacidade_antes = vetor.capacidade()
+        vetor.remover_ultimo()
+        if vetor.capacidade() != capacidade_antes:
+            print(f"Com {len(vetor)} elementos, a capacidade foi reduzida de "
+                  f"{capacidade_antes} para {vetor.capacidade()}")
+    
+    print("\nCom reservar(n), o espaço é alocado uma única vez:")
+    vetor = VetorDinamico()
+    vetor.reservar(1000)
+    for i in range(1000):
+        vetor.anexar(i)
+    print(f"Estatísticas: {vetor.estatisticas()}")
+
+
+def comparar_politicas(quantidade=200000):
+    """Compara o custo amortizado e a folga de memória de cada política de crescimento."""
+    print("\n2. COMPARAÇÃO DE POLÍTICAS DE CRESCIMENTO")
+    print("-" * 50)
+    print(f"Anexando {quantidade} elementos:\n")
+    
+    politicas = [
+        crescimento_multiplicativo(1.5),
+        crescimento_multiplicativo(2),
+        crescimento_fixo(1024),
+    ]
+    
+    print(f"{'Política':>10} | {'Realocações':>11} | {'Cópias/elemento':>15} | "
+          f"{'Folga máxima':>12} | {'Tempo (s)':>9}")
+    for politica in politicas:
+        vetor = VetorDinamico(politica)
+        inicio = time.perf_counter()
+        for i in range(quantidade):
+            vetor.anexar(i)
+        tempo = time.perf_counter() - inicio
+        copias = vetor.bytes_copiados / TAMANHO_REFERENCIA / quantidade
+        print(f"{politica.nome:>10} | {vetor.redimensionamentos:>11} | {copias:>15.2f} | "
+              f"{vetor.folga_maxima:>12} | {tempo:>9.4f}")
+    
+    # A lista nativa só pode ser observada indiretamente pelo sys.getsizeof
+    lista = []
+    redimensionamentos = 0
+    tamanho_anterior = sys.getsizeof(lista)
+    for i in range(quantidade):
+        lista.append(i)
+        tamanho_atual = sys.getsizeof(lista)
+        if tamanho_atual != tamanho_anterior:
+            redimensionamentos += 1
+            tamanho_anterior = tamanho_atual
+    
+    lista = []
+    inicio = time.perf_counter()
+    for i in range(quantidade):
+        lista.append(i)
+    tempo = time.perf_counter() - inicio
+    print(f"\nLista nativa: {redimensionamentos} realocações observadas via sys.getsizeof, "
+          f"{tempo:.4f} segundos")
+    
+    print("\nObservações:")
+    print("- Crescimento multiplicativo mantém o custo amortizado de anexar em O(1)")
+    print("- Fator 2 copia menos, mas pode deixar até metade do buffer sem uso")
+    print("- Fator 1.5 desperdiça menos memória em troca de mais realocações")
+    print("- Incremento fixo tem pouca folga, mas o custo de anexar vira O(n) amortizado")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE VETOR DINÂMICO COM POLÍTICAS DE CRESCIMENTO")
+    print("=" * 70)
+    
+    demonstrar_vetor_dinamico()
+    comparar_politicas()
@@ -54,20 +54,74 @@ class No:
         self.proximo = None
 
 
+class PoolNos:
+    """
+    Pool de nós (free-list) que reaproveita os nós removidos da fila.
+    Um mesmo pool pode ser compartilhado por várias estruturas.
+    """
+    
+    def __init__(self, limite=1000):
+        self.limite = limite  # Quantidade máxima de nós livres guardados
+        self.livres = None
+        self.quantidade_livres = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+    
+    def alocar(self, valor):
+        """Retorna um nó reaproveitado do pool ou, se ele estiver vazio, um nó novo."""
+        no = self.livres
+        if no is None:
+            self.falhas += 1
+            return No(valor)
+        
+        self.livres = no.proximo
+        self.quantidade_livres -= 1
+        self.acertos += 1
+        no.valor = valor
+        no.proximo = None
+        return no
+    
+    def liberar(self, no):
+        """Devolve ao pool um nó que já foi desligado da estrutura."""
+        no.valor = None
+        if self.quantidade_livres >= self.limite:
+            self.descartes += 1
+            return
+        
+        no.proximo = self.livres
+        self.livres = no
+        self.quantidade_livres += 1
+    
+    def taxa_acerto(self):
+        """Retorna a fração de alocações atendidas pelo pool."""
+        total = self.acertos + self.falhas
+        if total == 0:
+            return 0.0
+        return self.acertos / total
+
+
 class FilaEncadeada:
-    """Implementação de uma fila usando lista encadeada."""
+    """
+    Implementação de uma fila usando lista encadeada.
+    Opcionalmente recebe um PoolNos para reaproveitar os nós desenfileirados.
+    """
     
-    def __init__(self):
+    def __init__(self, pool=None):
         self.inicio = None
         self.fim = None
         self._tamanho = 0
+        self.pool = pool
     
     def esta_vazia(self):
         return self.inicio is None
     
     def enfileirar(self, item):
         """Adiciona um item ao final da fila."""
-        novo_no = No(item)
+        if self.pool is None:
+            novo_no = No(item)
+        else:
+            novo_no = self.pool.alocar(item)
         
         if self.esta_vazia():
             self.inicio = novo_no
@@ -82,12 +136,15 @@ class FilaEncadeada:
         if self.esta_vazia():
             raise Exception("Fila vazia")
         
-        valor = self.inicio.valor
-        self.inicio = self.inicio.proximo
+        removido = self.inicio
+        valor = removido.valor
+        self.inicio = removido.proximo
         
         if self.inicio is None:
             self.fim = None
         
+        if self.pool is not None:
+            self.pool.liberar(removido)
         self._tamanho -= 1
         return valor
     
@@ -0,0 +1,311 @@
+"""
+Benchmark Completo das Implementações de Listas
+
+Este arquivo executa todas as operações (inserir e remover no início, no fim e no
+meio; obter; buscar; percorrer) em todas as implementações de lista da pasta, para
+uma sequência de tamanhos. A partir das curvas de tempo, estima o expoente de
+complexidade empírico de cada combinação (tempo por operação ~ n^k) e grava um
+relatório em Markdown.
+
+Combinações lentas não são puladas: cada medição tem um limite de tempo e, quando
+ele é atingido, o tempo por operação é calculado com as operações já executadas.
+"""
+
+import gc
+import importlib.util
+import math
+import os
+import time
+
+from exemplo_lista import ListaEncadeada, gc_suspenso
+from exemplo_lista_compacta import ListaEncadeadaCompacta
+from exemplo_lista_desenrolada import ListaDesenrolada
+from exemplo_lista_dupla import ListaDuplamenteEncadeada
+from exemplo_skip_list import SkipListIndexavel
+from exemplo_lista_arvore import ListaArvore
+from exemplo_lista_ordenada import ListaOrdenada
+
+
+def _importar_arquivo(nome, *partes):
+    """Importa um módulo de outra pasta do repositório pelo caminho do arquivo."""
+    caminho = os.path.join(os.path.dirname(os.path.abspath(__file__)), *partes)
+    especificacao = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+# A lista encadeada de Conceitos-Fundamentais/Alocacao-Dinamica fica em outra pasta
+ListaEncadeadaDinamica = _importar_arquivo(
+    "exemplo_dinamica", "..", "..", "Conceitos-Fundamentais", "Alocacao-Dinamica",
+    "exemplo_dinamica.py").ListaEncadeada
+
+
+OPERACOES = [
+    "inserir_inicio", "inserir_fim", "inserir_meio",
+    "remover_inicio", "remover_fim", "remover_meio",
+    "obter", "buscar", "percorrer",
+]
+
+
+def _posicao(i, n):
+    """Posição pseudoaleatória e reproduzível entre 0 e n - 1."""
+    return (i * 7919) % n
+
+
+def _percorrer(estrutura):
+    for _ in estrutura:
+        pass
+
+
+def _operacoes_nativa():
+    return {
+        "inserir_inicio": lambda l, n, i: l.insert(0, i),
+        "inserir_fim": lambda l, n, i: l.append(i),
+        "inserir_meio": lambda l, n, i: l.insert(len(l) // 2, i),
+        "remover_inicio": lambda l, n, i: l.pop(0),
+        "remover_fim": lambda l, n, i: l.pop(),
+        "remover_meio": lambda l, n, i: l.pop(len(l) // 2),
+        "obter": lambda l, n, i: l[_posicao(i, n)],
+        "buscar": lambda l, n, i: l.index(_posicao(i, n)),
+        "percorrer": lambda l, n, i: _percorrer(l),
+    }
+
+
+def _operacoes_padrao():
+    """Operações das listas da pasta, que compartilham os mesmos nomes de métodos."""
+    return {
+        "inserir_inicio": lambda l, n, i: l.inserir_inicio(i),
+        "inserir_fim": lambda l, n, i: l.inserir_fim(i),
+        "inserir_meio": lambda l, n, i: l.inserir_posicao(l.tamanho // 2, i),
+        "remover_inicio": lambda l, n, i: l.remover_inicio(),
+        "remover_fim": lambda l, n, i: l.remover_fim(),
+        "remover_meio": lambda l, n, i: l.remover_posicao(l.tamanho // 2),
+        "obter": lambda l, n, i: l.obter(_posicao(i, n)),
+        "buscar": lambda l, n, i: l.buscar(_posicao(i, n)),
+        "percorrer": lambda l, n, i: _percorrer(l),
+    }
+
+
+def _operacoes_compacta():
+    """A lista compacta não tem operações por posição."""
+    operacoes = _operacoes_padrao()
+    for nome in ("inserir_meio", "remover_inicio", "remover_fim", "remover_meio", "obter"):
+        del operacoes[nome]
+    return operacoes
+
+
+def _operacoes_ordenada():
+    """
+    A lista ordenada escolhe a posição de cada elemento pelo valor, então não tem
+    inserção por posição; as remoções são por posição e a busca usa 'in'.
+    """
+    return {
+        "remover_inicio": lambda l, n, i: l.remover_posicao(0),
+        "remover_fim": lambda l, n, i: l.remover_posicao(-1),
+        "remover_meio": lambda l, n, i: l.remover_posicao(l.tamanho // 2),
+        "obter": lambda l, n, i: l[_posicao(i, n)],
+        "buscar": lambda l, n, i: _posicao(i, n) in l,
+        "percorrer": lambda l, n, i: _percorrer(l),
+    }
+
+
+def _percorrer_nos(lista):
+    atual = lista.cabeca
+    while atual:
+        atual = atual.proximo
+
+
+def _operacoes_dinamica():
+    """
+    A lista de exemplo_dinamica.py só insere no início e no fim e só remove o
+    primeiro nó; a busca é por valor e o percurso segue os nós a partir da cabeça.
+    """
+    return {
+        "inserir_inicio": lambda l, n, i: l.inserir_inicio(i),
+        "inserir_fim": lambda l, n, i: l.inserir_fim(i),
+        "remover_inicio": lambda l, n, i: l.remover_inicio(),
+        "buscar": lambda l, n, i: l.buscar(_posicao(i, n)),
+        "percorrer": lambda l, n, i: _percorrer_nos(l),
+    }
+
+
+def _construir_dinamica(valores, indexar=False):
+    # inserir_fim percorre a lista inteira, então a construção é feita pelo início
+    lista = ListaEncadeadaDinamica(indexar=indexar)
+    for valor in reversed(valores):
+        lista.inserir_inicio(valor)
+    return lista
+
+
+def _construir_dupla(valores):
+    lista = ListaDuplamenteEncadeada()
+    for valor in valores:
+        lista.inserir_fim(valor)
+    return lista
+
+
+def _construir_compacta(valores):
+    lista = ListaEncadeadaCompacta()
+    for valor in valores:
+        lista.inserir_fim(valor)
+    return lista
+
+
+def _construir_desenrolada(valores):
+    lista = ListaDesenrolada()
+    for valor in valores:
+        lista.inserir_fim(valor)
+    return lista
+
+
+# Nome -> (função que constrói a estrutura a partir de um iterável, operações suportadas)
+IMPLEMENTACOES = {
+    "Lista nativa": (list, _operacoes_nativa()),
+    "ListaEncadeada": (ListaEncadeada.de_iteravel, _operacoes_padrao()),
+    "ListaEncadeadaCompacta": (_construir_compacta, _operacoes_compacta()),
+    "ListaDuplamenteEncadeada": (_construir_dupla, _operacoes_padrao()),
+    "ListaDesenrolada": (_construir_desenrolada, _operacoes_padrao()),
+    "SkipListIndexavel": (lambda valores: SkipListIndexavel.de_iteravel(valores, semente=1),
+                          _operacoes_padrao()),
+    "ListaArvore": (ListaArvore.de_iteravel, _operacoes_padrao()),
+    "ListaOrdenada": (ListaOrdenada, _operacoes_ordenada()),
+    "ListaEncadeada (Alocacao-Dinamica)": (_construir_dinamica, _operacoes_dinamica()),
+    "ListaEncadeada indexada (Alocacao-Dinamica)": (
+        lambda valores: _construir_dinamica(valores, indexar=True), _operacoes_dinamica()),
+}
+
+
+def medir(construir, operacao, tamanho, repeticoes, limite):
+    """
+    Executa a operação até 'repeticoes' vezes sobre uma estrutura com 'tamanho'
+    elementos, parando ao atingir 'limite' segundos.
+    O garbage collector fica suspenso durante a medição, para que as coletas
+    disparadas pela construção da estrutura não apareçam como ruído nos tempos.
+    Retorna (segundos por operação, operações executadas).
+    """
+    estrutura = construir(range(tamanho))
+    repeticoes = max(1, min(repeticoes, tamanho // 2))  # Remoções não esvaziam a estrutura
+    gc.collect()
+    
+    relogio = time.perf_counter
+    with gc_suspenso():
+        inicio = relogio()
+        feitas = 0
+        while feitas < repeticoes:
+            operacao(estrutura, tamanho, feitas)
+            feitas += 1
+            if relogio() - inicio > limite:
+                break
+        decorrido = relogio() - inicio
+    return decorrido / feitas, feitas
+
+
+def ajustar_expoente(tamanhos, tempos):
+    """
+    Ajusta log(tempo) = k * log(n) + c por mínimos quadrados e retorna k,
+    o expoente de complexidade empírico do tempo por operação.
+    """
+    xs = [math.log(n) for n in tamanhos]
+    ys = [math.log(max(t, 1e-12)) for t in tempos]
+    media_x = sum(xs) / len(xs)
+    media_y = sum(ys) / len(ys)
+    numerador = sum((x - media_x) * (y - media_y) for x, y in zip(xs, ys))
+    denominador = sum((x - media_x) ** 2 for x in xs)
+    return numerador / denominador
+
+
+def classificar(expoente):
+    """Traduz o expoente em uma classe de complexidade aproximada."""
+    if expoente < 0.3:
+        return "O(1) ou O(log n)"
+    if expoente < 0.7:
+        return "sublinear"
+    if expoente < 1.3:
+        return "O(n)"
+    return "superlinear"
+
+
+def executar_benchmark(tamanhos=(1000, 4000, 16000, 64000), repeticoes=2000, limite=0.2):
+    """
+    Mede todas as combinações de implementação, operação e tamanho.
+    Retorna um dicionário {(implementação, operação): [(tamanho, s/op, feitas), ...]}.
+    """
+    resultados = {}
+    for nome, (construir, operacoes) in IMPLEMENTACOES.items():
+        print(f"Medindo {nome}...")
+        for operacao in OPERACOES:
+            if operacao not in operacoes:
+                continue
+            medidas = []
+            for tamanho in tamanhos:
+                por_operacao, feitas = medir(construir, operacoes[operacao], tamanho,
+                                             repeticoes, limite)
+                medidas.append((tamanho, por_operacao, feitas))
+            resultados[(nome, operacao)] = medidas
+    return resultados
+
+
+def gerar_relatorio(resultados, tamanhos, repeticoes):
+    """Monta o relatório em Markdown: uma tabela por operação, com o expoente ajustado."""
+    linhas = [
+        "# Benchmark das Implementações de Listas",
+        "",
+        "Tempo por operação em microssegundos. Valores com * atingiram o limite de",
+        f"tempo antes de completar {repeticoes} operações. O expoente k é o ajuste de",
+        "tempo por operação ~ n^k; '—' indica operação não suportada.",
+    ]
+    for operacao in OPERACOES:
+        linhas += ["", f"## {operacao}", ""]
+        cabecalho = "| Implementação | " + " | ".join(f"n = {n}" for n in tamanhos)
+        linhas.append(cabecalho + " | k | Classe |")
+        linhas.append("|---" * (len(tamanhos) + 3) + "|")
+        for nome in IMPLEMENTACOES:
+            medidas = resultados.get((nome, operacao))
+            if medidas is None:
+                linhas.append(f"| {nome} | " + " | ".join("—" for _ in tamanhos) + " | — | — |")
+                continue
+            celulas = []
+            for tamanho, por_operacao, feitas in medidas:
+                marca = "*" if feitas < min(repeticoes, tamanho // 2) else ""
+                celulas.append(f"{por_operacao * 1e6:.2f}{marca}")
+            expoente = ajustar_expoente([m[0] for m in medidas], [m[1] for m in medidas])
+            linhas.append(f"| {nome} | " + " | ".join(celulas) +
+                          f" | {expoente:.2f} | {classificar(expoente)} |")
+    return "\n".join(linhas) + "\n"
+
+
+def imprimir_resumo(resultados):
+    """Imprime o expoente de cada combinação em uma matriz implementação x operação."""
+    largura = max(len(nome) for nome in IMPLEMENTACOES)
+    print(f"\n{'Expoente k':<{largura}} | " + " | ".join(f"{operacao:>14}" for operacao in OPERACOES))
+    for nome in IMPLEMENTACOES:
+        celulas = []
+        for operacao in OPERACOES:
+            medidas = resultados.get((nome, operacao))
+            if medidas is None:
+                celulas.append(f"{'—':>14}")
+            else:
+                expoente = ajustar_expoente([m[0] for m in medidas], [m[1] for m in medidas])
+                celulas.append(f"{expoente:>14.2f}")
+        print(f"{nome:<{largura}} | " + " | ".join(celulas))
+
+
+if __name__ == "__main__":
+    print("BENCHMARK DAS IMPLEMENTAÇÕES DE LISTAS")
+    print("=" * 50)
+    
+    tamanhos = (1000, 4000, 16000, 64000)
+    repeticoes = 2000
+    inicio = time.perf_counter()
+    resultados = executar_benchmark(tamanhos, repeticoes)
+    print(f"\nBenchmark concluído em {time.perf_counter() - inicio:.1f} segundos")
+    
+    imprimir_resumo(resultados)
+    
+    caminho = "relatorio_benchmark_listas.md"
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write(gerar_relatorio(resultados, tamanhos, repeticoes))
+    print(f"\nRelatório gravado em {caminho}")
+    print("\nComo ler o expoente: ~0 indica custo constante ou logarítmico por operação,")
+    print("~1 indica custo linear (a operação percorre ou desloca a estrutura).")
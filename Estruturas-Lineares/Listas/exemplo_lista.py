@@ -5,10 +5,18 @@ Este arquivo demonstra:
 1. Uso das listas nativas do Python
 2. Implementação de uma lista encadeada simples
 3. Comparação das operações entre diferentes tipos de listas
+4. Construção em lote de listas grandes sem pausas do garbage collector
+5. Acesso sequencial em O(1) amortizado com dedo e cursor
+6. Concatenação, divisão, splice e inversão religando os nós
+7. Ordenação no lugar com merge sort natural
 """
 
+import gc
 import time
 import sys
+import random
+import tracemalloc
+from contextlib import contextmanager
 
 
 def demonstrar_lista_nativa():
@@ -72,6 +80,25 @@ def demonstrar_lista_nativa():
     print("- Operações no meio da lista são O(n)")
 
 
+# Cópia idêntica em Pilhas/exemplo_pilha.py: altere as duas juntas
+@contextmanager
+def gc_suspenso():
+    """
+    Suspende o garbage collector cíclico durante a construção de estruturas grandes.
+    Objetos criados nesse período só são percorridos a partir da primeira coleta
+    depois do bloco. Para tirá-los também das coletas seguintes, a aplicação pode
+    chamar gc.freeze(), mas ele move para a geração permanente todos os objetos
+    do processo, e não apenas a estrutura construída.
+    """
+    estava_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if estava_ativo:
+            gc.enable()
+
+
 class No:
     """Representação de um nó na lista encadeada."""
     def __init__(self, dado):
@@ -82,11 +109,99 @@ class No:
         return str(self.dado)
 
 
+class PoolNos:
+    """
+    Pool de nós (free-list) que reaproveita os nós removidos da lista.
+    Um mesmo pool pode ser compartilhado por várias estruturas.
+    """
+    def __init__(self, limite=1000):
+        self.limite = limite  # Quantidade máxima de nós livres guardados
+        self.livres = None
+        self.quantidade_livres = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+    
+    def alocar(self, dado):
+        """Retorna um nó reaproveitado do pool ou, se ele estiver vazio, um nó novo."""
+        no = self.livres
+        if no is None:
+            self.falhas += 1
+            return No(dado)
+        
+        self.livres = no.proximo
+        self.quantidade_livres -= 1
+        self.acertos += 1
+        no.dado = dado
+        no.proximo = None
+        return no
+    
+    def liberar(self, no):
+        """Devolve ao pool um nó que já foi desligado da estrutura."""
+        no.dado = None
+        if self.quantidade_livres >= self.limite:
+            self.descartes += 1
+            return
+        
+        no.proximo = self.livres
+        self.livres = no
+        self.quantidade_livres += 1
+    
+    def taxa_acerto(self):
+        """Retorna a fração de alocações atendidas pelo pool."""
+        total = self.acertos + self.falhas
+        if total == 0:
+            return 0.0
+        return self.acertos / total
+
+
 class ListaEncadeada:
-    """Implementação de uma lista encadeada simples."""
-    def __init__(self):
+    """
+    Implementação de uma lista encadeada simples.
+    Opcionalmente recebe um PoolNos para reaproveitar os nós removidos.
+    
+    A lista guarda um "dedo": a última posição acessada e o seu nó. Acessos por
+    posição iguais ou posteriores ao dedo continuam a partir dele, então percorrer
+    as posições em sequência custa O(1) amortizado por acesso em vez de O(n).
+    Também guarda o último nó ('fim'), o que torna inserir_fim e concatenar O(1).
+    """
+    def __init__(self, pool=None):
         self.inicio = None
+        self.fim = None
         self.tamanho = 0
+        self.pool = pool
+        self._dedo_no = None
+        self._dedo_posicao = 0
+    
+    def _novo_no(self, dado):
+        if self.pool is None:
+            return No(dado)
+        return self.pool.alocar(dado)
+    
+    def _descartar_no(self, no):
+        if self.pool is not None:
+            self.pool.liberar(no)
+    
+    def _no_na_posicao(self, posicao):
+        """Retorna o nó da posição, partindo do dedo se ele estiver antes dela."""
+        if self._dedo_no is not None and self._dedo_posicao <= posicao:
+            atual = self._dedo_no
+            contador = self._dedo_posicao
+        else:
+            atual = self.inicio
+            contador = 0
+        
+        while contador < posicao:
+            atual = atual.proximo
+            contador += 1
+        
+        self._dedo_no = atual
+        self._dedo_posicao = posicao
+        return atual
+    
+    def _invalidar_dedo(self):
+        self._dedo_no = None
+        self._dedo_posicao = 0
     
     def esta_vazia(self):
         """Verifica se a lista está vazia."""
@@ -94,22 +209,23 @@ class ListaEncadeada:
     
     def inserir_inicio(self, dado):
         """Insere um elemento no início da lista - O(1)."""
-        novo_no = No(dado)
+        novo_no = self._novo_no(dado)
         novo_no.proximo = self.inicio
+        if self.inicio is None:
+            self.fim = novo_no
         self.inicio = novo_no
+        self._dedo_posicao += 1  # O nó do dedo continua o mesmo, uma posição adiante
         self.tamanho += 1
     
     def inserir_fim(self, dado):
-        """Insere um elemento no fim da lista - O(n)."""
-        novo_no = No(dado)
+        """Insere um elemento no fim da lista - O(1), pois guarda o último nó."""
+        novo_no = self._novo_no(dado)
         
         if self.esta_vazia():
             self.inicio = novo_no
         else:
-            atual = self.inicio
-            while atual.proximo:
-                atual = atual.proximo
-            atual.proximo = novo_no
+            self.fim.proximo = novo_no
+        self.fim = novo_no
         
         self.tamanho += 1
     
@@ -122,16 +238,15 @@ class ListaEncadeada:
             self.inserir_inicio(dado)
             return
         
-        novo_no = No(dado)
-        atual = self.inicio
-        contador = 0
-        
-        while contador < posicao - 1:
-            atual = atual.proximo
-            contador += 1
+        novo_no = self._novo_no(dado)
+        atual = self._no_na_posicao(posicao - 1)
         
         novo_no.proximo = atual.proximo
         atual.proximo = novo_no
+        if atual is self.fim:
+            self.fim = novo_no
+        self._dedo_no = novo_no
+        self._dedo_posicao = posicao
         self.tamanho += 1
     
     def remover_inicio(self):
@@ -139,8 +254,16 @@ class ListaEncadeada:
         if self.esta_vazia():
             raise Exception("Lista vazia")
         
-        valor = self.inicio.dado
-        self.inicio = self.inicio.proximo
+        removido = self.inicio
+        valor = removido.dado
+        self.inicio = removido.proximo
+        if self.inicio is None:
+            self.fim = None
+        if self._dedo_no is removido:
+            self._invalidar_dedo()
+        else:
+            self._dedo_posicao -= 1
+        self._descartar_no(removido)
         self.tamanho -= 1
         return valor
     
@@ -152,17 +275,21 @@ class ListaEncadeada:
         # Se houver apenas um elemento
         if self.inicio.proximo is None:
             valor = self.inicio.dado
+            self._descartar_no(self.inicio)
             self.inicio = None
+            self.fim = None
+            self._invalidar_dedo()
             self.tamanho -= 1
             return valor
         
         # Navegando até o penúltimo elemento
-        atual = self.inicio
-        while atual.proximo.proximo:
-            atual = atual.proximo
+        atual = self._no_na_posicao(self.tamanho - 2)
         
-        valor = atual.proximo.dado
+        removido = atual.proximo
+        valor = removido.dado
         atual.proximo = None
+        self.fim = atual
+        self._descartar_no(removido)
         self.tamanho -= 1
         return valor
     
@@ -177,15 +304,14 @@ class ListaEncadeada:
         if posicao == 0:
             return self.remover_inicio()
         
-        atual = self.inicio
-        contador = 0
-        
-        while contador < posicao - 1:
-            atual = atual.proximo
-            contador += 1
+        atual = self._no_na_posicao(posicao - 1)
         
-        valor = atual.proximo.dado
-        atual.proximo = atual.proximo.proximo
+        removido = atual.proximo
+        valor = removido.dado
+        atual.proximo = removido.proximo
+        if removido is self.fim:
+            self.fim = atual
+        self._descartar_no(removido)
         self.tamanho -= 1
         return valor
     
@@ -203,18 +329,304 @@ class ListaEncadeada:
         return -1  # Não encontrado
     
     def obter(self, posicao):
-        """Recupera o elemento em uma posição específica - O(n)."""
+        """
+        Recupera o elemento em uma posição específica.
+        O(n) no pior caso; O(1) amortizado em acessos sequenciais, graças ao dedo.
+        """
         if posicao < 0 or posicao >= self.tamanho:
             raise IndexError("Posição inválida")
         
+        return self._no_na_posicao(posicao).dado
+    
+    def cursor(self, posicao=0):
+        """Retorna um cursor posicionado na posição indicada."""
+        return CursorLista(self, posicao)
+    
+    def __len__(self):
+        return self.tamanho
+    
+    def __iter__(self):
         atual = self.inicio
-        contador = 0
+        while atual:
+            yield atual.dado
+            atual = atual.proximo
+    
+    def __getitem__(self, posicao):
+        if posicao < 0:
+            posicao += self.tamanho
+        return self.obter(posicao)
+    
+    @classmethod
+    def de_iteravel(cls, iteravel, pool=None):
+        """Constrói uma lista com os elementos do iterável, na mesma ordem - O(n)."""
+        lista = cls(pool)
+        lista.estender(iteravel)
+        return lista
+    
+    def estender(self, iteravel):
+        """
+        Insere todos os elementos do iterável no fim da lista - O(k).
+        Os novos nós são ligados em uma única passagem, com o garbage collector
+        suspenso durante a construção. Se o iterável levantar uma exceção no meio,
+        a lista fica com os elementos inseridos até ali.
+        """
+        ultimo = self.fim
         
-        while contador < posicao:
+        quantidade = 0
+        try:
+            with gc_suspenso():
+                for dado in iteravel:
+                    novo_no = self._novo_no(dado)
+                    if ultimo is None:
+                        self.inicio = novo_no
+                    else:
+                        ultimo.proximo = novo_no
+                    ultimo = novo_no
+                    quantidade += 1
+        finally:
+            self.fim = ultimo
+            self.tamanho += quantidade
+    
+    def _esvaziar(self):
+        """Deixa a lista vazia sem tocar nos nós (eles passaram para outra lista)."""
+        self.inicio = None
+        self.fim = None
+        self.tamanho = 0
+        self._invalidar_dedo()
+    
+    def concatenar(self, outra):
+        """
+        Move todos os nós de 'outra' para o fim desta lista - O(1).
+        Os nós são religados, não copiados; 'outra' fica vazia.
+        """
+        if outra is self:
+            raise ValueError("Não é possível concatenar uma lista com ela mesma")
+        if outra.esta_vazia():
+            return
+        
+        if self.esta_vazia():
+            self.inicio = outra.inicio
+        else:
+            self.fim.proximo = outra.inicio
+        self.fim = outra.fim
+        self.tamanho += outra.tamanho
+        outra._esvaziar()
+    
+    def dividir(self, posicao):
+        """
+        Separa a lista na posição indicada - O(posicao).
+        Esta lista fica com os elementos [0, posicao) e a nova lista retornada
+        recebe os nós de 'posicao' em diante, sem cópias.
+        """
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        nova = ListaEncadeada(self.pool)
+        if posicao == self.tamanho:
+            return nova
+        if posicao == 0:
+            nova.concatenar(self)
+            return nova
+        
+        anterior = self._no_na_posicao(posicao - 1)
+        nova.inicio = anterior.proximo
+        nova.fim = self.fim
+        nova.tamanho = self.tamanho - posicao
+        anterior.proximo = None
+        self.fim = anterior
+        self.tamanho = posicao
+        return nova
+    
+    def splice(self, posicao, outra):
+        """
+        Insere todos os nós de 'outra' a partir da posição indicada - O(posicao).
+        Localizada a posição, a ligação é O(1), qualquer que seja o tamanho de 'outra',
+        que fica vazia ao final.
+        """
+        if outra is self:
+            raise ValueError("Não é possível inserir uma lista nela mesma")
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição inválida")
+        if outra.esta_vazia():
+            return
+        
+        if posicao == self.tamanho:
+            self.concatenar(outra)
+            return
+        
+        if posicao == 0:
+            outra.fim.proximo = self.inicio
+            self.inicio = outra.inicio
+            self._dedo_posicao += outra.tamanho
+        else:
+            anterior = self._no_na_posicao(posicao - 1)
+            outra.fim.proximo = anterior.proximo
+            anterior.proximo = outra.inicio
+        self.tamanho += outra.tamanho
+        outra._esvaziar()
+    
+    def inverter(self):
+        """Inverte a ordem dos elementos religando os nós em uma única passagem - O(n)."""
+        anterior = None
+        atual = self.inicio
+        while atual is not None:
+            proximo = atual.proximo
+            atual.proximo = anterior
+            anterior = atual
+            atual = proximo
+        self.inicio, self.fim = self.fim, self.inicio
+        self._invalidar_dedo()
+    
+    @staticmethod
+    def _sequencia(inicio):
+        """
+        Separa a sequência ordenada (run) que começa em 'inicio' e retorna
+        (primeiro, último, seguinte). Uma sequência estritamente decrescente é
+        invertida no lugar; exigir a ordem estrita mantém a ordenação estável.
+        """
+        atual = inicio
+        seguinte = atual.proximo
+        if seguinte is None:
+            return inicio, atual, None
+        
+        if seguinte.dado < atual.dado:
+            # Sequência decrescente: os nós são invertidos enquanto são percorridos
+            anterior = None
+            while True:
+                atual.proximo = anterior
+                anterior = atual
+                atual = seguinte
+                seguinte = atual.proximo
+                if seguinte is None or not seguinte.dado < atual.dado:
+                    break
+            atual.proximo = anterior
+            return atual, inicio, seguinte
+        
+        while True:
+            atual = seguinte
+            seguinte = atual.proximo
+            if seguinte is None or seguinte.dado < atual.dado:
+                break
+        atual.proximo = None
+        return inicio, atual, seguinte
+    
+    @staticmethod
+    def _intercalar(a, b):
+        """Intercala duas sequências ordenadas religando os nós; retorna (primeiro, último)."""
+        if b.dado < a.dado:
+            primeiro = ultimo = b
+            b = b.proximo
+        else:
+            primeiro = ultimo = a
+            a = a.proximo
+        
+        while a is not None and b is not None:
+            if b.dado < a.dado:  # Em caso de empate, 'a' vem primeiro (estável)
+                ultimo.proximo = b
+                ultimo = b
+                b = b.proximo
+            else:
+                ultimo.proximo = a
+                ultimo = a
+                a = a.proximo
+        
+        resto = a if a is not None else b
+        ultimo.proximo = resto
+        while ultimo.proximo is not None:
+            ultimo = ultimo.proximo
+        return primeiro, ultimo
+    
+    def _ordenar_nos(self):
+        """Merge sort natural dos nós, comparando diretamente o campo 'dado'."""
+        while True:
+            primeiro = ultimo = None
+            sequencias = 0
+            atual = self.inicio
+            while atual is not None:
+                inicio_a, fim_a, atual = self._sequencia(atual)
+                sequencias += 1
+                if atual is None:
+                    inicio_intercalado, fim_intercalado = inicio_a, fim_a
+                else:
+                    inicio_b, _, atual = self._sequencia(atual)
+                    sequencias += 1
+                    inicio_intercalado, fim_intercalado = self._intercalar(inicio_a, inicio_b)
+                
+                if primeiro is None:
+                    primeiro = inicio_intercalado
+                else:
+                    ultimo.proximo = inicio_intercalado
+                ultimo = fim_intercalado
+            
+            self.inicio = primeiro
+            self.fim = ultimo
+            if sequencias <= 2:
+                return
+    
+    def ordenar(self, key=None, reverse=False):
+        """
+        Ordena a lista no lugar com um merge sort natural e estável - O(n log n).
+        Nenhum nó é criado ou copiado: os nós existentes são religados. Cada
+        passagem separa as sequências já ordenadas (runs) e as intercala duas a
+        duas, então uma lista já ordenada custa O(n).
+        Como em list.sort, 'key' é chamada uma única vez por elemento, e a lista
+        volta à ordem original se 'key' ou uma comparação levantar uma exceção.
+        Para isso, os nós são guardados em uma lista auxiliar (O(n) referências)
+        e, durante a ordenação, cada nó guarda a sua chave no lugar do dado.
+        """
+        if self.tamanho < 2:
+            return
+        if reverse:
+            # Inverter, ordenar de forma estável e inverter de novo produz a ordem
+            # decrescente mantendo a ordem original dos elementos iguais
+            self.inverter()
+            try:
+                self.ordenar(key)
+            finally:
+                self.inverter()
+            return
+        
+        nos = []
+        atual = self.inicio
+        while atual is not None:
+            nos.append(atual)
             atual = atual.proximo
-            contador += 1
+        dados = None
+        if key is not None:
+            chaves = [key(no.dado) for no in nos]  # Uma exceção aqui não altera nada
+            dados = [no.dado for no in nos]
+            for no, chave in zip(nos, chaves):
+                no.dado = chave
         
-        return atual.dado
+        self._invalidar_dedo()
+        try:
+            self._ordenar_nos()
+        except BaseException:
+            # Religa os nós na ordem original
+            for anterior, no in zip(nos, nos[1:]):
+                anterior.proximo = no
+            nos[-1].proximo = None
+            self.inicio = nos[0]
+            self.fim = nos[-1]
+            raise
+        finally:
+            if dados is not None:
+                for no, dado in zip(nos, dados):
+                    no.dado = dado
+    
+    def limpar(self):
+        """
+        Remove todos os elementos - O(n).
+        Os nós são desligados um a um em um laço, em vez de deixar a destruição
+        de uma cadeia longa acontecer em cascata quando o início é descartado.
+        """
+        atual = self.inicio
+        self._esvaziar()
+        while atual is not None:
+            proximo = atual.proximo
+            atual.proximo = None
+            self._descartar_no(atual)
+            atual = proximo
     
     def imprimir(self):
         """Imprime todos os elementos da lista."""
@@ -231,6 +643,76 @@ class ListaEncadeada:
         print(" -> ".join(elementos))
 
 
+class CursorLista:
+    """
+    Cursor sobre uma ListaEncadeada: aponta para uma posição e guarda o nó anterior,
+    de modo que avançar, inserir e remover na posição atual são O(1).
+    Alterações feitas na lista por outros meios invalidam o cursor.
+    """
+    def __init__(self, lista, posicao=0):
+        if posicao < 0 or posicao > lista.tamanho:
+            raise IndexError("Posição inválida")
+        self.lista = lista
+        self.posicao = posicao
+        self.anterior = None if posicao == 0 else lista._no_na_posicao(posicao - 1)
+    
+    def _no_atual(self):
+        if self.anterior is None:
+            return self.lista.inicio
+        return self.anterior.proximo
+    
+    def esta_no_fim(self):
+        """Verifica se o cursor já passou do último elemento."""
+        return self._no_atual() is None
+    
+    def valor(self):
+        """Retorna o elemento na posição do cursor."""
+        atual = self._no_atual()
+        if atual is None:
+            raise IndexError("Cursor no fim da lista")
+        return atual.dado
+    
+    def avancar(self):
+        """Move o cursor para a próxima posição - O(1)."""
+        atual = self._no_atual()
+        if atual is None:
+            raise IndexError("Cursor no fim da lista")
+        self.anterior = atual
+        self.posicao += 1
+    
+    def inserir(self, dado):
+        """Insere um elemento na posição do cursor, que passa a apontar para ele - O(1)."""
+        lista = self.lista
+        novo_no = lista._novo_no(dado)
+        novo_no.proximo = self._no_atual()
+        if self.anterior is None:
+            lista.inicio = novo_no
+        else:
+            self.anterior.proximo = novo_no
+        if novo_no.proximo is None:
+            lista.fim = novo_no
+        lista._invalidar_dedo()
+        lista.tamanho += 1
+    
+    def remover(self):
+        """Remove o elemento na posição do cursor; o cursor passa ao seguinte - O(1)."""
+        lista = self.lista
+        removido = self._no_atual()
+        if removido is None:
+            raise IndexError("Cursor no fim da lista")
+        if self.anterior is None:
+            lista.inicio = removido.proximo
+        else:
+            self.anterior.proximo = removido.proximo
+        if removido is lista.fim:
+            lista.fim = self.anterior
+        valor = removido.dado
+        lista._invalidar_dedo()
+        lista._descartar_no(removido)
+        lista.tamanho -= 1
+        return valor
+
+
 def demonstrar_lista_encadeada():
     """Demonstra as operações com a lista encadeada implementada."""
     print("\n2. LISTA ENCADEADA")
@@ -330,7 +812,7 @@ def comparar_desempenho():
     else:
         print(f"Lista nativa foi {tempo_encadeada/tempo_nativa:.2f}x mais rápida para inserções no início")
     
-    # Acesso a elementos (somente para lista nativa, pois é muito lento para lista encadeada)
+    # Acesso a elementos
     print("\nAcesso a elementos aleatórios:")
     
     inicio = time.time()
@@ -340,7 +822,15 @@ def comparar_desempenho():
     fim = time.time()
     tempo_nativa = fim - inicio
     print(f"Lista nativa: {tempo_nativa:.6f} segundos para 1.000 acessos")
-    print("Lista encadeada: tempo muito longo para executar")
+    
+    inicio = time.time()
+    for i in range(1000):
+        indice = (i * 7919) % tamanho  # Saltos grandes: o dedo quase nunca ajuda
+        valor = lista_encadeada.obter(indice)
+    fim = time.time()
+    tempo_encadeada = fim - inicio
+    print(f"Lista encadeada: {tempo_encadeada:.6f} segundos para 1.000 acessos")
+    print("(Para todas as operações e tamanhos, execute benchmark_listas.py)")
     
     print("\nConclusão:")
     print("- Listas encadeadas são melhores para inserções/remoções no início")
@@ -348,6 +838,224 @@ def comparar_desempenho():
     print("- A escolha depende do padrão de uso da aplicação")
 
 
+def comparar_construcao_em_lote(tamanho=1000000):
+    """Mede o tempo e as pausas do garbage collector ao construir e destruir listas grandes."""
+    print("\n4. CONSTRUÇÃO EM LOTE E PAUSAS DO GARBAGE COLLECTOR")
+    print("-" * 50)
+    
+    pausas = []
+    
+    def registrar_pausa(fase, info):
+        # Chamado pelo gc no início e no fim de cada coleta
+        if fase == "start":
+            registrar_pausa.inicio = time.perf_counter()
+        else:
+            pausas.append(time.perf_counter() - registrar_pausa.inicio)
+    
+    def medir(operacao):
+        pausas.clear()
+        gc.collect()
+        gc.callbacks.append(registrar_pausa)
+        try:
+            inicio = time.perf_counter()
+            resultado = operacao()
+            tempo = time.perf_counter() - inicio
+        finally:
+            gc.callbacks.remove(registrar_pausa)
+        return resultado, tempo, len(pausas), max(pausas, default=0.0)
+    
+    def construir_um_a_um():
+        lista = ListaEncadeada()
+        for i in range(tamanho - 1, -1, -1):
+            lista.inserir_inicio(i)
+        return lista
+    
+    def construir_em_lote():
+        return ListaEncadeada.de_iteravel(range(tamanho))
+    
+    print(f"Construindo listas com {tamanho} elementos:")
+    lista, tempo, coletas, maior = medir(construir_um_a_um)
+    print(f"Um a um (inserir_inicio): {tempo:.3f} s | {coletas} coletas do GC | "
+          f"maior pausa: {maior * 1000:.1f} ms")
+    
+    def descartar():
+        nonlocal lista
+        lista = None  # A cadeia inteira é destruída em cascata
+    _, tempo, coletas, maior = medir(descartar)
+    print(f"Destruição ao descartar a referência: {tempo:.3f} s")
+    
+    lista, tempo, coletas, maior = medir(construir_em_lote)
+    print(f"\nEm lote (de_iteravel):    {tempo:.3f} s | {coletas} coletas do GC | "
+          f"maior pausa: {maior * 1000:.1f} ms")
+    _, tempo, coletas, maior = medir(lista.limpar)
+    print(f"Destruição com limpar(): {tempo:.3f} s")
+    
+    print("\nObservações:")
+    print("- Cada nó é um objeto rastreado pelo GC; durante a construção, as coletas")
+    print("  percorrem repetidamente o grafo de nós que não para de crescer")
+    print("- A construção em lote suspende o GC e o reativa ao final; a primeira coleta")
+    print("  depois disso ainda percorre os nós novos (gc.freeze evitaria isso, mas congela")
+    print("  todos os objetos do processo, não só a lista)")
+    print("- limpar() não é mais rápido que a destruição em cascata do CPython, mas não")
+    print("  depende da profundidade da cadeia e devolve os nós ao pool, se houver")
+
+
+def comparar_acesso_sequencial(tamanho=5000):
+    """Compara o laço 'for i in range(n): lista.obter(i)' com e sem o dedo."""
+    print("\n5. ACESSO SEQUENCIAL COM DEDO E CURSOR")
+    print("-" * 50)
+    
+    lista = ListaEncadeada.de_iteravel(range(tamanho))
+    
+    # Sem o dedo: cada acesso recomeça do início, como na versão original de obter
+    inicio = time.perf_counter()
+    for i in range(tamanho):
+        lista._invalidar_dedo()
+        lista.obter(i)
+    tempo_sem_dedo = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    for i in range(tamanho):
+        lista.obter(i)
+    tempo_com_dedo = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    for valor in lista:
+        pass
+    tempo_iterador = time.perf_counter() - inicio
+    
+    print(f"Percorrendo {tamanho} posições:")
+    print(f"obter(i) recomeçando do início: {tempo_sem_dedo:.4f} segundos")
+    print(f"obter(i) continuando do dedo:   {tempo_com_dedo:.4f} segundos")
+    print(f"for valor in lista:             {tempo_iterador:.4f} segundos")
+    
+    print("\nUsando um cursor para remover os números pares em uma única passagem:")
+    pequena = ListaEncadeada.de_iteravel(range(10))
+    cursor = pequena.cursor()
+    while not cursor.esta_no_fim():
+        if cursor.valor() % 2 == 0:
+            cursor.remover()
+        else:
+            cursor.avancar()
+    pequena.imprimir()
+    print(f"len(lista) = {len(pequena)} | lista[-1] = {pequena[-1]}")
+    
+    print("\nObservações:")
+    print("- O dedo guarda a última posição acessada e o seu nó")
+    print("- Acessos na mesma posição ou adiante continuam a partir do dedo")
+    print("- Sempre que possível, prefira iterar com 'for' ou com um cursor")
+
+
+def comparar_operacoes_estruturais(tamanho=200000):
+    """Compara juntar e separar listas religando nós com a cópia elemento a elemento."""
+    print("\n6. CONCATENAR, DIVIDIR, SPLICE E INVERTER")
+    print("-" * 50)
+    
+    a = ListaEncadeada.de_iteravel(range(1, 4))
+    b = ListaEncadeada.de_iteravel(range(10, 13))
+    a.splice(1, b)
+    print("Após a.splice(1, [10, 11, 12]): ", end="")
+    a.imprimir()
+    resto = a.dividir(4)
+    print("Após resto = a.dividir(4): a = ", end="")
+    a.imprimir()
+    print("                           resto = ", end="")
+    resto.imprimir()
+    resto.inverter()
+    a.concatenar(resto)
+    print("Após inverter o resto e concatenar: ", end="")
+    a.imprimir()
+    
+    print(f"\nJuntando duas listas de {tamanho} elementos:")
+    a = ListaEncadeada.de_iteravel(range(tamanho))
+    b = ListaEncadeada.de_iteravel(range(tamanho))
+    inicio = time.perf_counter()
+    for valor in b:
+        a.inserir_fim(valor)
+    tempo_copia = time.perf_counter() - inicio
+    
+    a = ListaEncadeada.de_iteravel(range(tamanho))
+    b = ListaEncadeada.de_iteravel(range(tamanho))
+    inicio = time.perf_counter()
+    a.concatenar(b)
+    tempo_concatenar = time.perf_counter() - inicio
+    print(f"Reinserindo com inserir_fim: {tempo_copia:.6f} segundos")
+    print(f"concatenar (religa o fim):   {tempo_concatenar:.6f} segundos")
+    
+    inicio = time.perf_counter()
+    a.inverter()
+    tempo_inverter = time.perf_counter() - inicio
+    print(f"\ninverter {a.tamanho} elementos em uma passagem: {tempo_inverter:.6f} segundos")
+    
+    print("\nObservações:")
+    print("- Nenhum nó é criado ou copiado: apenas referências são trocadas")
+    print("- concatenar é O(1) porque a lista guarda o último nó")
+    print("- dividir e splice só percorrem a lista até a posição do corte")
+    print("- A lista de origem fica vazia, pois seus nós passam a pertencer à outra")
+
+
+def comparar_ordenacao(tamanho=1000000):
+    """Compara ordenar() no lugar com copiar para uma lista nativa, ordenar e reconstruir."""
+    print("\n7. ORDENAÇÃO NO LUGAR (MERGE SORT NATURAL)")
+    print("-" * 50)
+    
+    pequena = ListaEncadeada.de_iteravel([5, 3, 8, 1, 9, 2, 7])
+    pequena.ordenar()
+    print("ordenar():             ", end="")
+    pequena.imprimir()
+    pequena.ordenar(reverse=True)
+    print("ordenar(reverse=True): ", end="")
+    pequena.imprimir()
+    
+    gerador = random.Random(42)
+    valores = [gerador.random() for _ in range(tamanho)]
+    
+    def copiar_ordenar_reconstruir(lista):
+        copia = list(lista)
+        copia.sort()
+        lista.limpar()
+        lista.estender(copia)
+    
+    print(f"\nOrdenando {tamanho} elementos:")
+    print(f"{'Entrada':>22} | {'ordenar() (s)':>13} | {'Copiar e reconstruir (s)':>24}")
+    entradas = [
+        ("aleatória", valores),
+        ("já ordenada", sorted(valores)),
+        ("10 blocos ordenados", [v for i in range(10) for v in sorted(valores[i::10])]),
+    ]
+    for nome, dados in entradas:
+        lista = ListaEncadeada.de_iteravel(dados)
+        inicio = time.perf_counter()
+        lista.ordenar()
+        tempo_ordenar = time.perf_counter() - inicio
+        
+        lista = ListaEncadeada.de_iteravel(dados)
+        inicio = time.perf_counter()
+        copiar_ordenar_reconstruir(lista)
+        tempo_copia = time.perf_counter() - inicio
+        print(f"{nome:>22} | {tempo_ordenar:>13.4f} | {tempo_copia:>24.4f}")
+    
+    # Pico de memória alocada durante a ordenação, medido com tracemalloc
+    amostra = valores[:tamanho // 10]
+    picos = []
+    for ordenar in (ListaEncadeada.ordenar, copiar_ordenar_reconstruir):
+        lista = ListaEncadeada.de_iteravel(amostra)
+        tracemalloc.start()
+        ordenar(lista)
+        picos.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    print(f"\nPico de memória extra com {len(amostra)} elementos: "
+          f"ordenar() {picos[0] / 1024:.1f} KB | copiar e reconstruir {picos[1] / 1024:.1f} KB")
+    
+    print("\nObservações:")
+    print("- ordenar() não cria nós: guarda apenas uma lista com n referências aos nós")
+    print("  (para restaurar a ordem em caso de exceção), contra uma lista auxiliar e n nós")
+    print("  novos na cópia com reconstrução")
+    print("- Sequências já ordenadas são detectadas, e uma lista ordenada custa uma passagem")
+    print("- O sort nativo (Timsort) roda em C e costuma vencer em tempo para dados aleatórios;")
+    print("  a vantagem de ordenar() está na memória e em listas já ordenadas ou quase")
+
+
 if __name__ == "__main__":
     print("DEMONSTRAÇÃO DE LISTAS EM PYTHON")
     print("=" * 50)
@@ -355,3 +1063,7 @@ if __name__ == "__main__":
     demonstrar_lista_nativa()
     demonstrar_lista_encadeada()
     comparar_desempenho()
+    comparar_construcao_em_lote()
+    comparar_acesso_sequencial()
+    comparar_operacoes_estruturais()
+    comparar_ordenacao()
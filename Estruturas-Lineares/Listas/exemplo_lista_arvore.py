@@ -0,0 +1,429 @@
+"""
+Exemplo de Lista Baseada em Árvore (B+-tree de blocos)
+
+Este arquivo demonstra:
+1. Uma sequência guardada em uma árvore balanceada com o tamanho de cada subárvore
+2. Inserção, remoção e acesso por posição em O(log n), e fatias em O(k + log n)
+3. Comparação com a lista nativa e com a lista encadeada em uma carga de edição
+"""
+
+import time
+import random
+
+from exemplo_lista import ListaEncadeada, gc_suspenso
+
+
+class NoFolha:
+    """Folha da árvore: guarda um bloco de elementos e aponta para a próxima folha."""
+    folha = True
+    
+    def __init__(self, itens=None):
+        self.itens = itens if itens is not None else []
+        self.proxima = None
+    
+    def __str__(self):
+        return str(self.itens)
+
+
+class NoInterno:
+    """Nó interno: guarda os filhos e a quantidade de elementos de cada subárvore."""
+    folha = False
+    
+    def __init__(self, filhos, tamanhos):
+        self.filhos = filhos
+        self.tamanhos = tamanhos
+
+
+def _dividir_em_grupos(quantidade, capacidade):
+    """Retorna os tamanhos de grupos o mais iguais possível, com no máximo 'capacidade' cada."""
+    grupos = -(-quantidade // capacidade)
+    base, resto = divmod(quantidade, grupos)
+    return [base + 1 if i < resto else base for i in range(grupos)]
+
+
+class ListaArvore:
+    """
+    Sequência construída sobre uma B+-tree.
+    Os elementos ficam nas folhas, em blocos de até 'capacidade_folha' elementos,
+    e as folhas são encadeadas entre si. Cada nó interno guarda o número de
+    elementos de cada subárvore, então localizar uma posição é descer da raiz
+    até a folha subtraindo tamanhos - O(log n).
+    Tem os mesmos métodos da ListaEncadeada.
+    """
+    def __init__(self, capacidade_folha=64, ordem=32):
+        if capacidade_folha < 4 or ordem < 4:
+            raise ValueError("A capacidade das folhas e a ordem devem ser pelo menos 4")
+        self.capacidade_folha = capacidade_folha
+        self.ordem = ordem  # Número máximo de filhos de um nó interno
+        self.raiz = NoFolha()
+        self.tamanho = 0
+    
+    @classmethod
+    def de_iteravel(cls, iteravel, capacidade_folha=64, ordem=32):
+        """Constrói a árvore de baixo para cima a partir de um iterável - O(n)."""
+        lista = cls(capacidade_folha, ordem)
+        itens = list(iteravel)
+        if not itens:
+            return lista
+        
+        with gc_suspenso():
+            nivel = []
+            tamanhos = []
+            inicio = 0
+            for quantidade in _dividir_em_grupos(len(itens), capacidade_folha):
+                folha = NoFolha(itens[inicio:inicio + quantidade])
+                if nivel:
+                    nivel[-1].proxima = folha
+                nivel.append(folha)
+                tamanhos.append(quantidade)
+                inicio += quantidade
+            
+            while len(nivel) > 1:
+                proximo_nivel = []
+                proximos_tamanhos = []
+                inicio = 0
+                for quantidade in _dividir_em_grupos(len(nivel), ordem):
+                    grupo = tamanhos[inicio:inicio + quantidade]
+                    proximo_nivel.append(NoInterno(nivel[inicio:inicio + quantidade], grupo))
+                    proximos_tamanhos.append(sum(grupo))
+                    inicio += quantidade
+                nivel = proximo_nivel
+                tamanhos = proximos_tamanhos
+        
+        lista.raiz = nivel[0]
+        lista.tamanho = len(itens)
+        return lista
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.tamanho == 0
+    
+    def __len__(self):
+        return self.tamanho
+    
+    def altura(self):
+        """Retorna o número de níveis da árvore."""
+        niveis = 1
+        no = self.raiz
+        while not no.folha:
+            no = no.filhos[0]
+            niveis += 1
+        return niveis
+    
+    def _tamanho_no(self, no):
+        if no.folha:
+            return len(no.itens)
+        return sum(no.tamanhos)
+    
+    def _localizar(self, posicao):
+        """Desce da raiz até a folha da posição e retorna (folha, deslocamento) - O(log n)."""
+        no = self.raiz
+        while not no.folha:
+            tamanhos = no.tamanhos
+            i = 0
+            while posicao >= tamanhos[i]:
+                posicao -= tamanhos[i]
+                i += 1
+            no = no.filhos[i]
+        return no, posicao
+    
+    def _primeira_folha(self):
+        no = self.raiz
+        while not no.folha:
+            no = no.filhos[0]
+        return no
+    
+    def _dividir(self, no):
+        """Divide um nó cheio ao meio e retorna a nova metade direita."""
+        if no.folha:
+            meio = len(no.itens) // 2
+            novo = NoFolha(no.itens[meio:])
+            del no.itens[meio:]
+            novo.proxima = no.proxima
+            no.proxima = novo
+        else:
+            meio = len(no.filhos) // 2
+            novo = NoInterno(no.filhos[meio:], no.tamanhos[meio:])
+            del no.filhos[meio:]
+            del no.tamanhos[meio:]
+        return novo
+    
+    def _inserir(self, no, posicao, dado):
+        """Insere na subárvore e retorna o novo irmão se o nó precisou ser dividido."""
+        if no.folha:
+            no.itens.insert(posicao, dado)
+            if len(no.itens) > self.capacidade_folha:
+                return self._dividir(no)
+            return None
+        
+        tamanhos = no.tamanhos
+        ultimo = len(tamanhos) - 1
+        i = 0
+        while i < ultimo and posicao > tamanhos[i]:
+            posicao -= tamanhos[i]
+            i += 1
+        tamanhos[i] += 1
+        
+        novo = self._inserir(no.filhos[i], posicao, dado)
+        if novo is not None:
+            tamanho_novo = self._tamanho_no(novo)
+            tamanhos[i] -= tamanho_novo
+            no.filhos.insert(i + 1, novo)
+            tamanhos.insert(i + 1, tamanho_novo)
+            if len(no.filhos) > self.ordem:
+                return self._dividir(no)
+        return None
+    
+    def inserir_posicao(self, posicao, dado):
+        """Insere um elemento em uma posição específica - O(log n)."""
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        novo = self._inserir(self.raiz, posicao, dado)
+        if novo is not None:
+            # A raiz foi dividida: a árvore ganha um nível
+            antiga = self.raiz
+            self.raiz = NoInterno([antiga, novo],
+                                  [self._tamanho_no(antiga), self._tamanho_no(novo)])
+        self.tamanho += 1
+    
+    def inserir_inicio(self, dado):
+        """Insere um elemento no início da lista - O(log n)."""
+        self.inserir_posicao(0, dado)
+    
+    def inserir_fim(self, dado):
+        """Insere um elemento no fim da lista - O(log n)."""
+        self.inserir_posicao(self.tamanho, dado)
+    
+    def _corrigir(self, pai, i):
+        """Junta ou redistribui o filho i, que ficou com menos da metade da capacidade."""
+        if len(pai.filhos) < 2:
+            return
+        esquerda = i - 1 if i > 0 else i
+        a = pai.filhos[esquerda]
+        b = pai.filhos[esquerda + 1]
+        
+        if a.folha:
+            itens = a.itens + b.itens
+            juntar = len(itens) <= self.capacidade_folha
+            if juntar:
+                a.itens = itens
+                a.proxima = b.proxima
+            else:
+                meio = len(itens) // 2
+                a.itens, b.itens = itens[:meio], itens[meio:]
+        else:
+            filhos = a.filhos + b.filhos
+            tamanhos = a.tamanhos + b.tamanhos
+            juntar = len(filhos) <= self.ordem
+            if juntar:
+                a.filhos = filhos
+                a.tamanhos = tamanhos
+            else:
+                meio = len(filhos) // 2
+                a.filhos, b.filhos = filhos[:meio], filhos[meio:]
+                a.tamanhos, b.tamanhos = tamanhos[:meio], tamanhos[meio:]
+        
+        pai.tamanhos[esquerda] = self._tamanho_no(a)
+        if juntar:
+            # Os dois irmãos viraram um só nó
+            del pai.filhos[esquerda + 1]
+            del pai.tamanhos[esquerda + 1]
+        else:
+            pai.tamanhos[esquerda + 1] = self._tamanho_no(b)
+    
+    def _remover(self, no, posicao):
+        """Remove da subárvore, corrigindo os filhos que ficarem pequenos demais."""
+        if no.folha:
+            return no.itens.pop(posicao)
+        
+        tamanhos = no.tamanhos
+        i = 0
+        while posicao >= tamanhos[i]:
+            posicao -= tamanhos[i]
+            i += 1
+        tamanhos[i] -= 1
+        
+        filho = no.filhos[i]
+        valor = self._remover(filho, posicao)
+        if filho.folha:
+            pequeno = len(filho.itens) < self.capacidade_folha // 2
+        else:
+            pequeno = len(filho.filhos) < self.ordem // 2
+        if pequeno:
+            self._corrigir(no, i)
+        return valor
+    
+    def remover_posicao(self, posicao):
+        """Remove o elemento em uma posição específica - O(log n)."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        valor = self._remover(self.raiz, posicao)
+        self.tamanho -= 1
+        while not self.raiz.folha and len(self.raiz.filhos) == 1:
+            # A raiz ficou com um único filho: a árvore perde um nível
+            self.raiz = self.raiz.filhos[0]
+        return valor
+    
+    def remover_inicio(self):
+        """Remove o elemento no início da lista - O(log n)."""
+        return self.remover_posicao(0)
+    
+    def remover_fim(self):
+        """Remove o elemento no fim da lista - O(log n)."""
+        return self.remover_posicao(self.tamanho - 1)
+    
+    def obter(self, posicao):
+        """Recupera o elemento em uma posição específica - O(log n)."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        folha, deslocamento = self._localizar(posicao)
+        return folha.itens[deslocamento]
+    
+    def fatia(self, inicio, fim):
+        """
+        Retorna os elementos das posições [inicio, fim) - O(k + log n).
+        Desce até a folha do início uma única vez e segue o encadeamento das folhas.
+        """
+        if inicio < 0 or fim > self.tamanho or inicio > fim:
+            raise IndexError("Posição inválida")
+        
+        resultado = []
+        if inicio == fim:
+            return resultado
+        folha, deslocamento = self._localizar(inicio)
+        faltam = fim - inicio
+        while faltam > 0:
+            pedaco = folha.itens[deslocamento:deslocamento + faltam]
+            resultado.extend(pedaco)
+            faltam -= len(pedaco)
+            folha = folha.proxima
+            deslocamento = 0
+        return resultado
+    
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            inicio, fim, passo = posicao.indices(self.tamanho)
+            if passo == 1:
+                return self.fatia(inicio, max(inicio, fim))
+            return [self.obter(i) for i in range(inicio, fim, passo)]
+        if posicao < 0:
+            posicao += self.tamanho
+        return self.obter(posicao)
+    
+    def buscar(self, dado):
+        """Busca um elemento na lista - O(n), com a busca em cada folha feita em C."""
+        base = 0
+        folha = self._primeira_folha()
+        while folha is not None:
+            if dado in folha.itens:
+                return base + folha.itens.index(dado)
+            base += len(folha.itens)
+            folha = folha.proxima
+        return -1
+    
+    def __iter__(self):
+        folha = self._primeira_folha()
+        while folha is not None:
+            yield from folha.itens
+            folha = folha.proxima
+    
+    def imprimir(self):
+        """Imprime todos os elementos da lista."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        print(" -> ".join(str(item) for item in self))
+
+
+def demonstrar_lista_arvore():
+    """Demonstra as operações da lista em árvore com blocos pequenos."""
+    print("\n1. LISTA BASEADA EM ÁRVORE")
+    print("-" * 50)
+    
+    lista = ListaArvore(capacidade_folha=4, ordem=4)
+    print("Lista criada com folhas de até 4 elementos e nós internos de até 4 filhos")
+    
+    for i in range(1, 21):
+        lista.inserir_fim(i * 10)
+    print(f"\nApós inserir 20 elementos no fim (altura {lista.altura()}):")
+    lista.imprimir()
+    
+    lista.inserir_posicao(5, 55)
+    lista.inserir_inicio(5)
+    print("\nApós inserir_posicao(5, 55) e inserir_inicio(5): ", end="")
+    lista.imprimir()
+    
+    print(f"\nValor na posição 10: {lista.obter(10)}")
+    print(f"Fatia [3, 9): {lista.fatia(3, 9)}")
+    print(f"Posição do valor 150: {lista.buscar(150)}")
+    
+    print("\nRemovendo 15 elementos do meio:")
+    for _ in range(15):
+        lista.remover_posicao(lista.tamanho // 2)
+    lista.imprimir()
+    print(f"Altura após as remoções: {lista.altura()}")
+
+
+def comparar_desempenho(tamanhos=(10**4, 10**5, 10**6), operacoes=10000):
+    """Compara uma carga de edição: inserções, remoções e leituras em posições aleatórias."""
+    print("\n2. COMPARAÇÃO DE DESEMPENHO (EDIÇÕES E LEITURAS NO MEIO)")
+    print("-" * 50)
+    
+    def executar(inserir_posicao, remover_posicao, obter, tamanho):
+        gerador = random.Random(42)
+        inicio = time.perf_counter()
+        for i in range(operacoes):
+            escolha = i % 3
+            if escolha == 0:
+                inserir_posicao(gerador.randrange(tamanho), i)
+            elif escolha == 1:
+                remover_posicao(gerador.randrange(tamanho))
+            else:
+                obter(gerador.randrange(tamanho))
+        return time.perf_counter() - inicio
+    
+    print(f"{operacoes} operações (1/3 inserções, 1/3 remoções, 1/3 leituras):\n")
+    print(f"{'Tamanho':>10} | {'Árvore (s)':>10} | {'Nativa (s)':>10} | {'Encadeada (s)':>13}")
+    for tamanho in tamanhos:
+        arvore = ListaArvore.de_iteravel(range(tamanho))
+        tempo_arvore = executar(arvore.inserir_posicao, arvore.remover_posicao,
+                                arvore.obter, tamanho)
+        
+        nativa = list(range(tamanho))
+        tempo_nativa = executar(nativa.insert, nativa.pop, nativa.__getitem__, tamanho)
+        
+        if tamanho <= 10**4:
+            encadeada = ListaEncadeada.de_iteravel(range(tamanho))
+            tempo_encadeada = executar(encadeada.inserir_posicao, encadeada.remover_posicao,
+                                       encadeada.obter, tamanho)
+            texto_encadeada = f"{tempo_encadeada:>13.4f}"
+        else:
+            texto_encadeada = f"{'(omitida)':>13}"
+        
+        print(f"{tamanho:>10} | {tempo_arvore:>10.4f} | {tempo_nativa:>10.4f} | {texto_encadeada}")
+    
+    arvore = ListaArvore.de_iteravel(range(10**6))
+    inicio = time.perf_counter()
+    for i in range(1000):
+        arvore.fatia(i * 997, i * 997 + 100)
+    tempo_fatias = time.perf_counter() - inicio
+    print(f"\n1000 fatias de 100 elementos em 10^6 elementos: {tempo_fatias:.4f} segundos")
+    
+    print("\nObservações:")
+    print("- Na árvore, cada operação desce O(log n) níveis e altera uma única folha")
+    print("- A lista nativa desloca em média n/2 referências por inserção ou remoção no meio;")
+    print("  com memmove isso é rápido para n pequeno, mas cresce linearmente")
+    print("- A lista encadeada percorre O(n) nós até a posição (omitida para n grande)")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE LISTA BASEADA EM ÁRVORE")
+    print("=" * 50)
+    
+    demonstrar_lista_arvore()
+    comparar_desempenho()
@@ -0,0 +1,224 @@
+"""
+Exemplo de Lista Encadeada Compacta (encadeada por índices)
+
+Este arquivo demonstra:
+1. Uma lista encadeada que guarda valores e ligações em arrays paralelos
+2. Reaproveitamento de posições livres através de uma cadeia interna de posições livres
+3. Comparação de memória e de tempo de percurso com a lista encadeada de nós
+"""
+
+import time
+import tracemalloc
+from array import array
+
+from exemplo_lista import ListaEncadeada
+
+
+NULO = -1  # Índice usado no lugar de "None" para indicar ausência de próximo
+
+
+class ListaEncadeadaCompacta:
+    """
+    Lista encadeada em que os "nós" são posições de dois arrays paralelos:
+    valores[i] guarda o dado e proximos[i] guarda o índice do próximo nó.
+    Não existe um objeto Python por elemento, apenas números em memória contígua.
+    Como usa array.array, os valores precisam ser numéricos (tipo 'q' ou 'd').
+    """
+    def __init__(self, tipo='q'):
+        self.valores = array(tipo)
+        self.proximos = array('q')
+        self.inicio = NULO
+        self.fim = NULO
+        self.livre = NULO  # Primeira posição livre (cadeia de posições livres)
+        self.tamanho = 0
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.inicio == NULO
+    
+    def _alocar(self, dado):
+        """Retorna o índice de uma posição para o novo nó, reaproveitando posições livres."""
+        if self.livre != NULO:
+            indice = self.livre
+            self.livre = self.proximos[indice]
+            self.valores[indice] = dado
+            self.proximos[indice] = NULO
+            return indice
+        
+        # Nenhuma posição livre: cresce os arrays (O(1) amortizado)
+        self.valores.append(dado)
+        self.proximos.append(NULO)
+        return len(self.valores) - 1
+    
+    def _liberar(self, indice):
+        """Coloca a posição no início da cadeia de posições livres."""
+        self.proximos[indice] = self.livre
+        self.livre = indice
+    
+    def inserir_inicio(self, dado):
+        """Insere um elemento no início da lista - O(1)."""
+        indice = self._alocar(dado)
+        self.proximos[indice] = self.inicio
+        self.inicio = indice
+        if self.fim == NULO:
+            self.fim = indice
+        self.tamanho += 1
+    
+    def inserir_fim(self, dado):
+        """Insere um elemento no fim da lista - O(1), pois guarda o índice do último nó."""
+        indice = self._alocar(dado)
+        if self.fim == NULO:
+            self.inicio = indice
+        else:
+            self.proximos[self.fim] = indice
+        self.fim = indice
+        self.tamanho += 1
+    
+    def remover(self, dado):
+        """Remove a primeira ocorrência do valor especificado - O(n)."""
+        valores = self.valores
+        proximos = self.proximos
+        anterior = NULO
+        atual = self.inicio
+        
+        while atual != NULO and valores[atual] != dado:
+            anterior = atual
+            atual = proximos[atual]
+        
+        if atual == NULO:
+            return False
+        
+        if anterior == NULO:
+            self.inicio = proximos[atual]
+        else:
+            proximos[anterior] = proximos[atual]
+        if atual == self.fim:
+            self.fim = anterior
+        
+        self._liberar(atual)
+        self.tamanho -= 1
+        return True
+    
+    def buscar(self, dado):
+        """Busca um elemento na lista e retorna sua posição, ou -1 - O(n)."""
+        posicao = 0
+        for valor in self:
+            if valor == dado:
+                return posicao
+            posicao += 1
+        return -1
+    
+    def __iter__(self):
+        valores = self.valores
+        proximos = self.proximos
+        atual = self.inicio
+        while atual != NULO:
+            yield valores[atual]
+            atual = proximos[atual]
+    
+    def bytes_usados(self):
+        """Retorna os bytes ocupados pelos dois arrays (incluindo posições livres)."""
+        return (self.valores.buffer_info()[1] * self.valores.itemsize +
+                self.proximos.buffer_info()[1] * self.proximos.itemsize)
+    
+    def imprimir(self):
+        """Imprime todos os elementos da lista."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        
+        print(" -> ".join(str(valor) for valor in self))
+
+
+def demonstrar_lista_compacta():
+    """Demonstra as operações da lista encadeada compacta."""
+    print("\n1. LISTA ENCADEADA COMPACTA")
+    print("-" * 50)
+    
+    lista = ListaEncadeadaCompacta()
+    for valor in [20, 30, 40]:
+        lista.inserir_fim(valor)
+    lista.inserir_inicio(10)
+    print("Após inserir 10, 20, 30, 40: ", end="")
+    lista.imprimir()
+    print(f"Arrays internos -> valores: {list(lista.valores)} | proximos: {list(lista.proximos)}")
+    
+    lista.remover(20)
+    print("\nApós remover(20): ", end="")
+    lista.imprimir()
+    print(f"Posição livre: {lista.livre}")
+    
+    lista.inserir_fim(50)
+    print("\nApós inserir_fim(50) (reaproveita a posição livre): ", end="")
+    lista.imprimir()
+    print(f"Arrays internos -> valores: {list(lista.valores)} | proximos: {list(lista.proximos)}")
+    print(f"Posição do valor 40: {lista.buscar(40)}")
+
+
+def medir_memoria(construir):
+    """Retorna os bytes alocados durante a construção de uma estrutura."""
+    tracemalloc.start()
+    estrutura = construir()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return estrutura, memoria
+
+
+def comparar_com_lista_de_nos(tamanho=200000):
+    """Compara memória e tempo de percurso com a lista encadeada de objetos No."""
+    print("\n2. COMPARAÇÃO COM A LISTA ENCADEADA DE NÓS")
+    print("-" * 50)
+    
+    def construir_nos():
+        lista = ListaEncadeada()
+        for i in range(tamanho):
+            lista.inserir_inicio(i * 1000)  # Valores grandes: cada int é um objeto
+        return lista
+    
+    def construir_compacta():
+        lista = ListaEncadeadaCompacta()
+        for i in range(tamanho):
+            lista.inserir_inicio(i * 1000)
+        return lista
+    
+    lista_nos, memoria_nos = medir_memoria(construir_nos)
+    lista_compacta, memoria_compacta = medir_memoria(construir_compacta)
+    
+    print(f"Memória para {tamanho} elementos:")
+    print(f"Lista de nós:    {memoria_nos / tamanho:.1f} bytes por elemento")
+    print(f"Lista compacta:  {memoria_compacta / tamanho:.1f} bytes por elemento")
+    print(f"A lista compacta usa {memoria_nos / memoria_compacta:.1f}x menos memória")
+    print(f"Bytes dos arrays internos (bytes_usados): {lista_compacta.bytes_usados()}")
+    
+    inicio = time.perf_counter()
+    total = 0
+    atual = lista_nos.inicio
+    while atual:
+        total += atual.dado
+        atual = atual.proximo
+    tempo_nos = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    total_compacta = 0
+    for valor in lista_compacta:
+        total_compacta += valor
+    tempo_compacta = time.perf_counter() - inicio
+    
+    print("\nPercurso completo (soma dos valores):")
+    print(f"Lista de nós:    {tempo_nos:.4f} segundos")
+    print(f"Lista compacta:  {tempo_compacta:.4f} segundos")
+    
+    print("\nObservações:")
+    print("- Cada elemento ocupa apenas 16 bytes (8 do valor + 8 do índice do próximo)")
+    print("- Posições removidas são reaproveitadas, então o array não cresce sem necessidade")
+    print("- Em Python puro, o percurso ainda cria um int por leitura do array;")
+    print("  o maior ganho é de memória e de trabalho para o garbage collector")
+    print("- A restrição é que os valores precisam ser numéricos")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE LISTA ENCADEADA COMPACTA")
+    print("=" * 50)
+    
+    demonstrar_lista_compacta()
+    comparar_com_lista_de_nos()
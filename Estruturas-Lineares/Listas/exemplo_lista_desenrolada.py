@@ -0,0 +1,280 @@
+"""
+Exemplo de Lista Encadeada Desenrolada (Unrolled Linked List)
+
+Este arquivo demonstra:
+1. Uma lista encadeada em que cada nó guarda um pequeno bloco de elementos
+2. Divisão e junção automáticas dos blocos
+3. Comparação de desempenho com a lista encadeada simples e com a lista nativa
+"""
+
+import time
+import random
+
+from exemplo_lista import ListaEncadeada
+
+
+class NoBloco:
+    """Nó da lista desenrolada: guarda até 'capacidade' elementos em uma lista Python."""
+    def __init__(self):
+        self.itens = []
+        self.proximo = None
+    
+    def __str__(self):
+        return str(self.itens)
+
+
+class ListaDesenrolada:
+    """
+    Lista encadeada desenrolada.
+    Cada nó guarda um bloco de até 'capacidade' elementos. Operações por posição
+    pulam blocos inteiros (um ponteiro para cada 'capacidade' elementos) e só
+    percorrem elementos dentro de um único bloco.
+    Blocos cheios são divididos ao meio; blocos com menos da metade da capacidade
+    são juntados com o bloco seguinte.
+    """
+    def __init__(self, capacidade=64):
+        if capacidade < 2:
+            raise ValueError("A capacidade do bloco deve ser pelo menos 2")
+        self.capacidade = capacidade
+        self.inicio = None
+        self.fim = None
+        self.tamanho = 0
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.tamanho == 0
+    
+    def _localizar(self, posicao):
+        """Retorna (anterior, bloco, deslocamento) do bloco que contém a posição."""
+        anterior = None
+        bloco = self.inicio
+        while posicao >= len(bloco.itens) and bloco.proximo is not None:
+            posicao -= len(bloco.itens)
+            anterior = bloco
+            bloco = bloco.proximo
+        return anterior, bloco, posicao
+    
+    def _dividir(self, bloco):
+        """Divide um bloco cheio em dois blocos com metade dos elementos cada."""
+        novo = NoBloco()
+        meio = len(bloco.itens) // 2
+        novo.itens = bloco.itens[meio:]
+        del bloco.itens[meio:]
+        novo.proximo = bloco.proximo
+        bloco.proximo = novo
+        if self.fim is bloco:
+            self.fim = novo
+    
+    def _equilibrar(self, anterior, bloco):
+        """Junta ou redistribui blocos que ficaram com menos da metade da capacidade."""
+        if not bloco.itens:
+            # Bloco vazio: remove da cadeia
+            if anterior is None:
+                self.inicio = bloco.proximo
+            else:
+                anterior.proximo = bloco.proximo
+            if self.fim is bloco:
+                self.fim = anterior
+            return
+        
+        seguinte = bloco.proximo
+        if len(bloco.itens) >= self.capacidade // 2 or seguinte is None:
+            return
+        
+        if len(bloco.itens) + len(seguinte.itens) <= self.capacidade:
+            # Junta o bloco seguinte neste
+            bloco.itens.extend(seguinte.itens)
+            bloco.proximo = seguinte.proximo
+            if self.fim is seguinte:
+                self.fim = bloco
+        else:
+            # Pega emprestados elementos do bloco seguinte
+            faltam = self.capacidade // 2 - len(bloco.itens)
+            bloco.itens.extend(seguinte.itens[:faltam])
+            del seguinte.itens[:faltam]
+    
+    def inserir_posicao(self, posicao, dado):
+        """Insere um elemento em uma posição específica - O(n / capacidade + capacidade)."""
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        if self.inicio is None:
+            self.inicio = self.fim = NoBloco()
+        
+        if posicao == self.tamanho:
+            bloco = self.fim
+            bloco.itens.append(dado)
+        else:
+            _, bloco, deslocamento = self._localizar(posicao)
+            bloco.itens.insert(deslocamento, dado)
+        
+        if len(bloco.itens) > self.capacidade:
+            self._dividir(bloco)
+        self.tamanho += 1
+    
+    def inserir_inicio(self, dado):
+        """Insere um elemento no início da lista."""
+        self.inserir_posicao(0, dado)
+    
+    def inserir_fim(self, dado):
+        """Insere um elemento no fim da lista - O(1), pois guarda o último bloco."""
+        self.inserir_posicao(self.tamanho, dado)
+    
+    def remover_posicao(self, posicao):
+        """Remove o elemento em uma posição específica."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        anterior, bloco, deslocamento = self._localizar(posicao)
+        valor = bloco.itens.pop(deslocamento)
+        self.tamanho -= 1
+        self._equilibrar(anterior, bloco)
+        return valor
+    
+    def remover_inicio(self):
+        """Remove o elemento no início da lista."""
+        return self.remover_posicao(0)
+    
+    def remover_fim(self):
+        """Remove o elemento no fim da lista."""
+        return self.remover_posicao(self.tamanho - 1)
+    
+    def obter(self, posicao):
+        """Recupera o elemento em uma posição específica, pulando blocos inteiros."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        bloco = self.inicio
+        while posicao >= len(bloco.itens):
+            posicao -= len(bloco.itens)
+            bloco = bloco.proximo
+        return bloco.itens[posicao]
+    
+    def buscar(self, dado):
+        """Busca um elemento na lista - O(n), mas com a busca em cada bloco feita em C."""
+        base = 0
+        bloco = self.inicio
+        while bloco is not None:
+            if dado in bloco.itens:
+                return base + bloco.itens.index(dado)
+            base += len(bloco.itens)
+            bloco = bloco.proximo
+        return -1
+    
+    def __iter__(self):
+        bloco = self.inicio
+        while bloco is not None:
+            yield from bloco.itens
+            bloco = bloco.proximo
+    
+    def quantidade_blocos(self):
+        """Retorna o número de blocos na cadeia."""
+        quantidade = 0
+        bloco = self.inicio
+        while bloco is not None:
+            quantidade += 1
+            bloco = bloco.proximo
+        return quantidade
+    
+    def imprimir(self):
+        """Imprime os elementos, separando os blocos com '|'."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        
+        blocos = []
+        bloco = self.inicio
+        while bloco is not None:
+            blocos.append(" -> ".join(str(item) for item in bloco.itens))
+            bloco = bloco.proximo
+        print(" | ".join(blocos))
+
+
+def demonstrar_lista_desenrolada():
+    """Demonstra as operações da lista desenrolada com blocos pequenos."""
+    print("\n1. LISTA ENCADEADA DESENROLADA")
+    print("-" * 50)
+    
+    lista = ListaDesenrolada(capacidade=4)
+    print("Lista desenrolada criada com capacidade 4 por bloco")
+    
+    print("\nInserindo de 1 a 10 no fim:")
+    for i in range(1, 11):
+        lista.inserir_fim(i)
+    lista.imprimir()
+    print(f"Blocos: {lista.quantidade_blocos()}")
+    
+    lista.inserir_posicao(2, 99)
+    print("\nApós inserir_posicao(2, 99): ", end="")
+    lista.imprimir()
+    
+    print(f"\nValor na posição 7: {lista.obter(7)}")
+    print(f"Posição do valor 9: {lista.buscar(9)}")
+    
+    print("\nRemovendo as posições 0, 0 e 0:")
+    for _ in range(3):
+        lista.remover_posicao(0)
+    lista.imprimir()
+    print(f"Blocos após a junção: {lista.quantidade_blocos()}")
+
+
+def comparar_desempenho(tamanho=20000, operacoes=2000):
+    """Compara uma carga mista de inserções e acessos por posição."""
+    print("\n2. COMPARAÇÃO DE DESEMPENHO (INSERÇÕES E ACESSOS NO MEIO)")
+    print("-" * 50)
+    
+    gerador = random.Random(42)
+    posicoes = [gerador.randrange(tamanho) for _ in range(operacoes)]
+    
+    def executar(inserir_fim, inserir_posicao, obter):
+        for i in range(tamanho):
+            inserir_fim(i)
+        inicio = time.perf_counter()
+        for i, posicao in enumerate(posicoes):
+            if i % 2 == 0:
+                inserir_posicao(posicao, i)
+            else:
+                obter(posicao)
+        return time.perf_counter() - inicio
+    
+    nativa = []
+    tempo_nativa = executar(nativa.append, nativa.insert, nativa.__getitem__)
+    
+    desenrolada = ListaDesenrolada()
+    tempo_desenrolada = executar(desenrolada.inserir_fim, desenrolada.inserir_posicao,
+                                 desenrolada.obter)
+    
+    encadeada = ListaEncadeada()
+    for i in range(tamanho):
+        encadeada.inserir_fim(i)
+    inicio = time.perf_counter()
+    for i, posicao in enumerate(posicoes):
+        if i % 2 == 0:
+            encadeada.inserir_posicao(posicao, i)
+        else:
+            encadeada.obter(posicao)
+    tempo_encadeada = time.perf_counter() - inicio
+    
+    print(f"{operacoes} operações (metade inserções, metade acessos) em {tamanho} elementos:")
+    print(f"Lista nativa:        {tempo_nativa:.4f} segundos")
+    print(f"Lista desenrolada:   {tempo_desenrolada:.4f} segundos")
+    print(f"Lista encadeada:     {tempo_encadeada:.4f} segundos")
+    print(f"A lista desenrolada foi {tempo_encadeada / tempo_desenrolada:.1f}x mais rápida "
+          f"que a lista encadeada simples")
+    
+    print("\nObservações:")
+    print("- Cada salto de ponteiro avança um bloco inteiro em vez de um elemento")
+    print("- Dentro do bloco, inserir e remover deslocam no máximo 'capacidade' elementos")
+    print("- A lista nativa continua melhor para acesso aleatório puro, mas a desenrolada")
+    print("  não precisa deslocar a lista inteira a cada inserção no meio")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE LISTA ENCADEADA DESENROLADA")
+    print("=" * 50)
+    
+    demonstrar_lista_desenrolada()
+    comparar_desempenho()
@@ -0,0 +1,274 @@
+"""
+Exemplo de Lista Duplamente Encadeada
+
+Este arquivo demonstra:
+1. Implementação de uma lista duplamente encadeada com referência para o último nó
+2. Remoção no fim em O(1) e acesso por posição a partir da extremidade mais próxima
+3. Comparação com a lista encadeada simples e com collections.deque
+"""
+
+import time
+import random
+from collections import deque
+
+from exemplo_lista import ListaEncadeada
+
+
+class NoDuplo:
+    """Nó com referências para o próximo e para o anterior."""
+    def __init__(self, dado):
+        self.dado = dado
+        self.anterior = None
+        self.proximo = None
+    
+    def __str__(self):
+        return str(self.dado)
+
+
+class ListaDuplamenteEncadeada:
+    """
+    Implementação de uma lista duplamente encadeada.
+    Tem os mesmos métodos da ListaEncadeada, mas guarda o último nó e a
+    referência para o nó anterior, o que torna inserções e remoções nas duas
+    extremidades O(1) e permite percorrer a lista a partir do fim.
+    """
+    def __init__(self):
+        self.inicio = None
+        self.fim = None
+        self.tamanho = 0
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.inicio is None
+    
+    def _no_na_posicao(self, posicao):
+        """Retorna o nó da posição, partindo da extremidade mais próxima - O(n/2)."""
+        if posicao < self.tamanho // 2:
+            atual = self.inicio
+            for _ in range(posicao):
+                atual = atual.proximo
+        else:
+            atual = self.fim
+            for _ in range(self.tamanho - 1 - posicao):
+                atual = atual.anterior
+        return atual
+    
+    def inserir_inicio(self, dado):
+        """Insere um elemento no início da lista - O(1)."""
+        novo_no = NoDuplo(dado)
+        novo_no.proximo = self.inicio
+        if self.inicio is None:
+            self.fim = novo_no
+        else:
+            self.inicio.anterior = novo_no
+        self.inicio = novo_no
+        self.tamanho += 1
+    
+    def inserir_fim(self, dado):
+        """Insere um elemento no fim da lista - O(1)."""
+        novo_no = NoDuplo(dado)
+        novo_no.anterior = self.fim
+        if self.fim is None:
+            self.inicio = novo_no
+        else:
+            self.fim.proximo = novo_no
+        self.fim = novo_no
+        self.tamanho += 1
+    
+    def inserir_posicao(self, posicao, dado):
+        """Insere um elemento em uma posição específica - O(min(i, n - i))."""
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        if posicao == 0:
+            self.inserir_inicio(dado)
+            return
+        if posicao == self.tamanho:
+            self.inserir_fim(dado)
+            return
+        
+        seguinte = self._no_na_posicao(posicao)
+        novo_no = NoDuplo(dado)
+        novo_no.anterior = seguinte.anterior
+        novo_no.proximo = seguinte
+        seguinte.anterior.proximo = novo_no
+        seguinte.anterior = novo_no
+        self.tamanho += 1
+    
+    def _desligar(self, no):
+        """Remove o nó da cadeia e retorna seu dado - O(1)."""
+        if no.anterior is None:
+            self.inicio = no.proximo
+        else:
+            no.anterior.proximo = no.proximo
+        if no.proximo is None:
+            self.fim = no.anterior
+        else:
+            no.proximo.anterior = no.anterior
+        no.anterior = no.proximo = None
+        self.tamanho -= 1
+        return no.dado
+    
+    def remover_inicio(self):
+        """Remove o elemento no início da lista - O(1)."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        return self._desligar(self.inicio)
+    
+    def remover_fim(self):
+        """Remove o elemento no fim da lista - O(1)."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        return self._desligar(self.fim)
+    
+    def remover_posicao(self, posicao):
+        """Remove o elemento em uma posição específica - O(min(i, n - i))."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        return self._desligar(self._no_na_posicao(posicao))
+    
+    def buscar(self, dado):
+        """Busca um elemento na lista - O(n)."""
+        atual = self.inicio
+        posicao = 0
+        
+        while atual:
+            if atual.dado == dado:
+                return posicao
+            atual = atual.proximo
+            posicao += 1
+        
+        return -1  # Não encontrado
+    
+    def obter(self, posicao):
+        """Recupera o elemento em uma posição específica - O(min(i, n - i))."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        return self._no_na_posicao(posicao).dado
+    
+    def __iter__(self):
+        atual = self.inicio
+        while atual:
+            yield atual.dado
+            atual = atual.proximo
+    
+    def imprimir(self):
+        """Imprime todos os elementos da lista."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        
+        atual = self.inicio
+        elementos = []
+        while atual:
+            elementos.append(str(atual.dado))
+            atual = atual.proximo
+        
+        print(" <-> ".join(elementos))
+    
+    def imprimir_reverso(self):
+        """Imprime os elementos do fim para o início, usando as referências 'anterior'."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        
+        atual = self.fim
+        elementos = []
+        while atual:
+            elementos.append(str(atual.dado))
+            atual = atual.anterior
+        
+        print(" <-> ".join(elementos))
+
+
+def demonstrar_lista_dupla():
+    """Demonstra as operações com a lista duplamente encadeada."""
+    print("\n1. LISTA DUPLAMENTE ENCADEADA")
+    print("-" * 50)
+    
+    lista = ListaDuplamenteEncadeada()
+    for valor in [20, 30, 40]:
+        lista.inserir_fim(valor)
+    lista.inserir_inicio(10)
+    lista.inserir_posicao(3, 35)
+    print("Lista: ", end="")
+    lista.imprimir()
+    print("Reverso: ", end="")
+    lista.imprimir_reverso()
+    
+    print(f"\nValor na posição 3 (percorrido a partir do fim): {lista.obter(3)}")
+    
+    valor = lista.remover_fim()
+    print(f"Valor removido do fim em O(1): {valor}")
+    valor = lista.remover_posicao(1)
+    print(f"Valor removido da posição 1: {valor}")
+    print("Lista: ", end="")
+    lista.imprimir()
+
+
+def comparar_desempenho(tamanho=5000, operacoes=20000):
+    """Compara uma carga de deque (operações nas duas pontas) e acessos perto do fim."""
+    print("\n2. COMPARAÇÃO DE DESEMPENHO")
+    print("-" * 50)
+    
+    gerador = random.Random(7)
+    escolhas = [gerador.randrange(4) for _ in range(operacoes)]
+    
+    def executar(inserir_inicio, inserir_fim, remover_inicio, remover_fim):
+        for i in range(tamanho):
+            inserir_fim(i)
+        inicio = time.perf_counter()
+        for i, escolha in enumerate(escolhas):
+            if escolha == 0:
+                inserir_inicio(i)
+            elif escolha == 1:
+                inserir_fim(i)
+            elif escolha == 2:
+                remover_inicio()
+            else:
+                remover_fim()
+        return time.perf_counter() - inicio
+    
+    dupla = ListaDuplamenteEncadeada()
+    tempo_dupla = executar(dupla.inserir_inicio, dupla.inserir_fim,
+                           dupla.remover_inicio, dupla.remover_fim)
+    fila_dupla = deque()
+    tempo_deque = executar(fila_dupla.appendleft, fila_dupla.append,
+                           fila_dupla.popleft, fila_dupla.pop)
+    simples = ListaEncadeada()
+    tempo_simples = executar(simples.inserir_inicio, simples.inserir_fim,
+                             simples.remover_inicio, simples.remover_fim)
+    
+    print(f"{operacoes} operações aleatórias nas duas pontas, com cerca de {tamanho} elementos:")
+    print(f"Lista duplamente encadeada: {tempo_dupla:.4f} segundos")
+    print(f"Lista encadeada simples:    {tempo_simples:.4f} segundos")
+    print(f"collections.deque:          {tempo_deque:.4f} segundos")
+    
+    print("\nAcesso às últimas 10 posições, 1000 vezes:")
+    inicio = time.perf_counter()
+    for i in range(1000):
+        dupla.obter(dupla.tamanho - 1 - i % 10)
+    tempo_dupla = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for i in range(1000):
+        simples.obter(simples.tamanho - 1 - i % 10)
+    tempo_simples = time.perf_counter() - inicio
+    print(f"Lista duplamente encadeada: {tempo_dupla:.4f} segundos")
+    print(f"Lista encadeada simples:    {tempo_simples:.4f} segundos")
+    
+    print("\nObservações:")
+    print("- remover_fim é O(1) porque o penúltimo nó é alcançado pela referência 'anterior'")
+    print("- Acessos por posição começam pela extremidade mais próxima")
+    print("- O custo é uma referência a mais por nó")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE LISTA DUPLAMENTE ENCADEADA")
+    print("=" * 50)
+    
+    demonstrar_lista_dupla()
+    comparar_desempenho()
@@ -0,0 +1,333 @@
+"""
+Exemplo de Lista Ordenada com Sublistas Segmentadas
+
+Este arquivo demonstra:
+1. Um contêiner que mantém os elementos sempre em ordem, com inserção por busca binária
+2. Consultas por intervalo e estatísticas de ordem (rank e k-ésimo elemento)
+3. Comparação com list.insert + bisect em listas com milhões de elementos
+"""
+
+import time
+import random
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+
+
+class ListaOrdenada:
+    """
+    Lista que mantém os elementos em ordem crescente.
+    Em vez de um único array (em que inserir no meio desloca até n elementos), os
+    elementos ficam em várias sublistas ordenadas de no máximo 2 * 'carga'
+    elementos, e uma lista auxiliar guarda o maior elemento de cada sublista.
+    Inserir é uma busca binária para achar a sublista, outra para achar a posição
+    dentro dela, e um deslocamento de no máximo 2 * 'carga' referências.
+    Para rank e selecionar, uma árvore de Fenwick guarda os tamanhos das sublistas.
+    Para ordenar por outro critério, insira tuplas (chave, valor).
+    """
+    def __init__(self, iteravel=(), carga=1000):
+        if carga < 4:
+            raise ValueError("A carga deve ser pelo menos 4")
+        self.carga = carga
+        self._listas = []
+        self._maximos = []
+        self._arvore = None  # Árvore de Fenwick com os tamanhos das sublistas (None = desatualizada)
+        self.tamanho = 0
+        self.atualizar(iteravel)
+    
+    def __len__(self):
+        return self.tamanho
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.tamanho == 0
+    
+    def _reconstruir(self, valores_ordenados):
+        """Redistribui os valores já ordenados em sublistas de 'carga' elementos - O(n)."""
+        carga = self.carga
+        self._listas = [valores_ordenados[i:i + carga]
+                        for i in range(0, len(valores_ordenados), carga)]
+        self._maximos = [sublista[-1] for sublista in self._listas]
+        self._arvore = None
+        self.tamanho = len(valores_ordenados)
+    
+    def _construir_arvore(self):
+        """Monta a árvore de Fenwick sobre os tamanhos das sublistas - O(m)."""
+        arvore = [0] + [len(sublista) for sublista in self._listas]
+        for i in range(1, len(arvore)):
+            pai = i + (i & -i)
+            if pai < len(arvore):
+                arvore[pai] += arvore[i]
+        self._arvore = arvore
+    
+    def _ajustar_arvore(self, indice, delta):
+        """Soma delta ao tamanho da sublista 'indice' na árvore, se ela estiver montada."""
+        arvore = self._arvore
+        if arvore is None:
+            return
+        i = indice + 1
+        while i < len(arvore):
+            arvore[i] += delta
+            i += i & -i
+    
+    def _elementos_antes(self, indice):
+        """Quantidade de elementos nas sublistas anteriores à sublista 'indice' - O(log m)."""
+        if self._arvore is None:
+            self._construir_arvore()
+        arvore = self._arvore
+        total = 0
+        i = indice
+        while i > 0:
+            total += arvore[i]
+            i -= i & -i
+        return total
+    
+    def _localizar_posicao(self, posicao):
+        """Converte uma posição global em (sublista, deslocamento) - O(log m)."""
+        if self._arvore is None:
+            self._construir_arvore()
+        arvore = self._arvore
+        indice = 0
+        passo = 1 << (len(arvore).bit_length() - 1)
+        while passo:
+            seguinte = indice + passo
+            if seguinte < len(arvore) and arvore[seguinte] <= posicao:
+                indice = seguinte
+                posicao -= arvore[seguinte]
+            passo >>= 1
+        return indice, posicao
+    
+    def adicionar(self, valor):
+        """Insere um valor mantendo a ordem - O(log n + carga)."""
+        if not self._listas:
+            self._listas.append([valor])
+            self._maximos.append(valor)
+            self._arvore = None
+            self.tamanho = 1
+            return
+        
+        indice = bisect_right(self._maximos, valor)
+        if indice == len(self._maximos):
+            # Maior que todos: vai para o fim da última sublista
+            indice -= 1
+            self._listas[indice].append(valor)
+            self._maximos[indice] = valor
+        else:
+            insort(self._listas[indice], valor)
+        self.tamanho += 1
+        
+        sublista = self._listas[indice]
+        if len(sublista) > 2 * self.carga:
+            # Sublista cheia: divide ao meio
+            metade = sublista[self.carga:]
+            del sublista[self.carga:]
+            self._listas.insert(indice + 1, metade)
+            self._maximos[indice] = sublista[-1]
+            self._maximos.insert(indice + 1, metade[-1])
+            self._arvore = None
+        else:
+            self._ajustar_arvore(indice, 1)
+    
+    def atualizar(self, iteravel):
+        """
+        Insere todos os valores do iterável.
+        Se forem muitos em relação ao tamanho atual, tudo é reordenado de uma vez
+        (O((n + k) log(n + k)), com o sort em C); caso contrário, são inseridos um a um.
+        """
+        valores = list(iteravel)
+        if not valores:
+            return
+        if len(valores) * 4 >= self.tamanho:
+            valores.extend(chain.from_iterable(self._listas))
+            valores.sort()
+            self._reconstruir(valores)
+        else:
+            for valor in valores:
+                self.adicionar(valor)
+    
+    def _remover_na_sublista(self, indice, deslocamento):
+        """Remove o elemento indicado e junta a sublista à vizinha se ela ficar pequena."""
+        sublista = self._listas[indice]
+        valor = sublista.pop(deslocamento)
+        self.tamanho -= 1
+        
+        if not sublista:
+            del self._listas[indice]
+            del self._maximos[indice]
+            self._arvore = None
+        elif len(sublista) < self.carga // 2 and len(self._listas) > 1:
+            # Sublista pequena demais: junta com a vizinha (dividindo de novo se passar do limite)
+            if indice == 0:
+                indice = 1
+            anterior = self._listas[indice - 1]
+            anterior.extend(self._listas[indice])
+            del self._listas[indice]
+            del self._maximos[indice]
+            if len(anterior) > 2 * self.carga:
+                metade = anterior[len(anterior) // 2:]
+                del anterior[len(anterior) // 2:]
+                self._listas.insert(indice, metade)
+                self._maximos.insert(indice, metade[-1])
+            self._maximos[indice - 1] = anterior[-1]
+            self._arvore = None
+        else:
+            self._maximos[indice] = sublista[-1]
+            self._ajustar_arvore(indice, -1)
+        return valor
+    
+    def remover(self, valor):
+        """Remove uma ocorrência do valor - O(log n + carga)."""
+        indice = bisect_left(self._maximos, valor)
+        if indice < len(self._maximos):
+            sublista = self._listas[indice]
+            deslocamento = bisect_left(sublista, valor)
+            if sublista[deslocamento] == valor:
+                self._remover_na_sublista(indice, deslocamento)
+                return
+        raise ValueError("Valor não encontrado")
+    
+    def remover_posicao(self, posicao=-1):
+        """Remove e retorna o elemento na posição (por padrão, o maior) - O(log n + carga)."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        if posicao < 0:
+            posicao += self.tamanho
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        if posicao == 0:
+            return self._remover_na_sublista(0, 0)
+        if posicao == self.tamanho - 1:
+            return self._remover_na_sublista(len(self._listas) - 1, len(self._listas[-1]) - 1)
+        return self._remover_na_sublista(*self._localizar_posicao(posicao))
+    
+    def __contains__(self, valor):
+        indice = bisect_left(self._maximos, valor)
+        if indice == len(self._maximos):
+            return False
+        sublista = self._listas[indice]
+        return sublista[bisect_left(sublista, valor)] == valor
+    
+    def rank(self, valor):
+        """Retorna quantos elementos são menores que o valor - O(log n)."""
+        indice = bisect_left(self._maximos, valor)
+        if indice == len(self._maximos):
+            return self.tamanho
+        return self._elementos_antes(indice) + bisect_left(self._listas[indice], valor)
+    
+    def selecionar(self, k):
+        """Retorna o k-ésimo menor elemento (k começa em 0) - O(log n)."""
+        if k < 0:
+            k += self.tamanho
+        if k < 0 or k >= self.tamanho:
+            raise IndexError("Posição inválida")
+        indice, deslocamento = self._localizar_posicao(k)
+        return self._listas[indice][deslocamento]
+    
+    def __getitem__(self, posicao):
+        return self.selecionar(posicao)
+    
+    def intervalo(self, minimo, maximo):
+        """Percorre, em ordem, os elementos x com minimo <= x <= maximo - O(log n + k)."""
+        indice = bisect_left(self._maximos, minimo)
+        if indice == len(self._maximos):
+            return
+        deslocamento = bisect_left(self._listas[indice], minimo)
+        for sublista in self._listas[indice:]:
+            if sublista[-1] <= maximo:
+                # A sublista inteira (a partir do deslocamento) está no intervalo
+                yield from sublista[deslocamento:]
+            else:
+                fim = bisect_right(sublista, maximo)
+                yield from sublista[deslocamento:fim]
+                return
+            deslocamento = 0
+    
+    def __iter__(self):
+        return chain.from_iterable(self._listas)
+    
+    def imprimir(self):
+        """Imprime todos os elementos da lista."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        print(" -> ".join(str(valor) for valor in self))
+
+
+def demonstrar_lista_ordenada():
+    """Demonstra inserções, intervalos e estatísticas de ordem."""
+    print("\n1. LISTA ORDENADA")
+    print("-" * 50)
+    
+    lista = ListaOrdenada([42, 7, 19, 88, 3], carga=4)
+    print("Lista criada a partir de [42, 7, 19, 88, 3]: ", end="")
+    lista.imprimir()
+    
+    for valor in [50, 1, 19, 65, 30]:
+        lista.adicionar(valor)
+    print("Após adicionar 50, 1, 19, 65 e 30: ", end="")
+    lista.imprimir()
+    
+    print(f"\nElementos entre 10 e 60: {list(lista.intervalo(10, 60))}")
+    print(f"Quantos elementos são menores que 30 (rank): {lista.rank(30)}")
+    print(f"Terceiro menor elemento (selecionar(2)): {lista.selecionar(2)}")
+    print(f"Mediana: {lista[len(lista) // 2]}")
+    
+    lista.remover(19)
+    print("\nApós remover(19): ", end="")
+    lista.imprimir()
+    print(f"Maior elemento removido com remover_posicao(): {lista.remover_posicao()}")
+    
+    print("\nComo fila de prioridade, com tuplas (prioridade, chegada, nome):")
+    fila = ListaOrdenada()
+    fila.atualizar([(2, 1, "Ana"), (1, 2, "Bruno"), (3, 3, "Carla"), (1, 4, "Davi")])
+    while not fila.esta_vazia():
+        prioridade, chegada, nome = fila.remover_posicao(0)
+        print(f"Atendendo {nome} (prioridade {prioridade}, chegada {chegada})")
+
+
+def comparar_desempenho(tamanhos=(10**5, 10**6, 3 * 10**6), insercoes=20000):
+    """Compara inserções aleatórias com list.insert + bisect (insort)."""
+    print("\n2. COMPARAÇÃO COM list.insert + bisect")
+    print("-" * 50)
+    print(f"{insercoes} inserções aleatórias em uma lista que já tem n elementos:\n")
+    print(f"{'n':>10} | {'ListaOrdenada (s)':>17} | {'insort (s)':>10}")
+    
+    gerador = random.Random(42)
+    for tamanho in tamanhos:
+        base = sorted(gerador.random() for _ in range(tamanho))
+        novos = [gerador.random() for _ in range(insercoes)]
+        
+        ordenada = ListaOrdenada(base)
+        inicio = time.perf_counter()
+        for valor in novos:
+            ordenada.adicionar(valor)
+        tempo_ordenada = time.perf_counter() - inicio
+        
+        nativa = list(base)
+        inicio = time.perf_counter()
+        for valor in novos:
+            insort(nativa, valor)
+        tempo_nativa = time.perf_counter() - inicio
+        
+        print(f"{tamanho:>10} | {tempo_ordenada:>17.4f} | {tempo_nativa:>10.4f}")
+    
+    inicio = time.perf_counter()
+    for i in range(insercoes):
+        ordenada.rank(novos[i])
+        ordenada.selecionar(i * 97 % len(ordenada))
+    tempo_consultas = time.perf_counter() - inicio
+    print(f"\n{insercoes} pares rank + selecionar em {len(ordenada)} elementos: "
+          f"{tempo_consultas:.4f} segundos")
+    
+    print("\nObservações:")
+    print("- insort encontra a posição em O(log n), mas desloca em média n/2 referências")
+    print("- Na ListaOrdenada o deslocamento fica limitado ao tamanho de uma sublista")
+    print("- rank e selecionar usam a árvore de Fenwick sobre os tamanhos das sublistas")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE LISTA ORDENADA")
+    print("=" * 50)
+    
+    demonstrar_lista_ordenada()
+    comparar_desempenho()
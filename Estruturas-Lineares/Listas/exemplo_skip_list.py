@@ -0,0 +1,355 @@
+"""
+Exemplo de Skip List Indexável
+
+Este arquivo demonstra:
+1. Uma skip list em que cada ligação guarda sua largura (quantos elementos ela pula)
+2. Acesso, inserção e remoção por posição em O(log n) esperado
+3. Modo ordenado, com busca por valor em O(log n) esperado
+4. Comparação com a lista encadeada simples e com a lista nativa
+"""
+
+import time
+import random
+
+from exemplo_lista import ListaEncadeada
+
+
+NIVEL_MAXIMO = 32
+PROBABILIDADE = 0.5  # Chance de um nó subir para o nível seguinte
+
+
+class NoSkip:
+    """
+    Nó da skip list. Para cada nível guarda o próximo nó naquele nível e a
+    largura da ligação (quantas posições do nível mais baixo ela atravessa).
+    """
+    def __init__(self, dado, altura):
+        self.dado = dado
+        self.proximos = [None] * altura
+        self.larguras = [1] * altura
+    
+    def __str__(self):
+        return str(self.dado)
+
+
+class SkipListIndexavel:
+    """
+    Skip list indexável.
+    No modo posicional (padrão) se comporta como uma lista: obter, inserir_posicao e
+    remover_posicao em O(log n) esperado. No modo ordenado (ordenada=True), inserir
+    mantém os elementos em ordem e buscar localiza um valor em O(log n) esperado.
+    A 'semente' torna a escolha das alturas dos nós reproduzível.
+    """
+    def __init__(self, ordenada=False, semente=None):
+        self.ordenada = ordenada
+        self.aleatorio = random.Random(semente)
+        self.cabeca = NoSkip(None, NIVEL_MAXIMO)
+        self.nivel = 1  # Quantidade de níveis em uso
+        self.tamanho = 0
+    
+    def esta_vazia(self):
+        """Verifica se a lista está vazia."""
+        return self.tamanho == 0
+    
+    def _sortear_altura(self):
+        altura = 1
+        while altura < NIVEL_MAXIMO and self.aleatorio.random() < PROBABILIDADE:
+            altura += 1
+        return altura
+    
+    def _predecessores_por_posicao(self, posicao):
+        """
+        Para cada nível, retorna o último nó antes da posição e a posição desse nó
+        (a cabeça conta como posição -1).
+        """
+        anteriores = [None] * self.nivel
+        posicoes = [0] * self.nivel
+        no = self.cabeca
+        percorrido = -1
+        for nivel in range(self.nivel - 1, -1, -1):
+            while (no.proximos[nivel] is not None and
+                   percorrido + no.larguras[nivel] < posicao):
+                percorrido += no.larguras[nivel]
+                no = no.proximos[nivel]
+            anteriores[nivel] = no
+            posicoes[nivel] = percorrido
+        return anteriores, posicoes
+    
+    def _predecessores_por_valor(self, dado):
+        """Como _predecessores_por_posicao, mas para o último nó com valor <= dado."""
+        anteriores = [None] * self.nivel
+        posicoes = [0] * self.nivel
+        no = self.cabeca
+        percorrido = -1
+        for nivel in range(self.nivel - 1, -1, -1):
+            while (no.proximos[nivel] is not None and
+                   no.proximos[nivel].dado <= dado):
+                percorrido += no.larguras[nivel]
+                no = no.proximos[nivel]
+            anteriores[nivel] = no
+            posicoes[nivel] = percorrido
+        return anteriores, posicoes
+    
+    def _ligar(self, anteriores, posicoes, posicao, dado):
+        """Cria o nó na posição, ajustando as ligações e larguras de todos os níveis."""
+        altura = self._sortear_altura()
+        if altura > self.nivel:
+            for nivel in range(self.nivel, altura):
+                # Nível novo: a ligação da cabeça vai até o fim da lista
+                self.cabeca.proximos[nivel] = None
+                self.cabeca.larguras[nivel] = self.tamanho + 1
+                anteriores.append(self.cabeca)
+                posicoes.append(-1)
+            self.nivel = altura
+        
+        novo_no = NoSkip(dado, altura)
+        for nivel in range(altura):
+            anterior = anteriores[nivel]
+            distancia = posicao - posicoes[nivel]  # Do anterior até o novo nó
+            novo_no.proximos[nivel] = anterior.proximos[nivel]
+            novo_no.larguras[nivel] = anterior.larguras[nivel] - distancia + 1
+            anterior.proximos[nivel] = novo_no
+            anterior.larguras[nivel] = distancia
+        
+        # Ligações acima da altura do novo nó passam a pular um elemento a mais
+        for nivel in range(altura, self.nivel):
+            anteriores[nivel].larguras[nivel] += 1
+        
+        self.tamanho += 1
+    
+    def inserir_posicao(self, posicao, dado):
+        """Insere um elemento em uma posição específica - O(log n) esperado."""
+        if self.ordenada:
+            raise Exception("Em uma skip list ordenada, use inserir(dado)")
+        if posicao < 0 or posicao > self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        anteriores, posicoes = self._predecessores_por_posicao(posicao)
+        self._ligar(anteriores, posicoes, posicao, dado)
+    
+    def inserir_inicio(self, dado):
+        """Insere um elemento no início da lista."""
+        self.inserir_posicao(0, dado)
+    
+    def inserir_fim(self, dado):
+        """Insere um elemento no fim da lista."""
+        self.inserir_posicao(self.tamanho, dado)
+    
+    def inserir(self, dado):
+        """Modo ordenado: insere o elemento mantendo a ordem - O(log n) esperado."""
+        if not self.ordenada:
+            raise Exception("Em uma skip list posicional, use inserir_posicao")
+        
+        anteriores, posicoes = self._predecessores_por_valor(dado)
+        self._ligar(anteriores, posicoes, posicoes[0] + 1, dado)
+    
+    def remover_posicao(self, posicao):
+        """Remove o elemento em uma posição específica - O(log n) esperado."""
+        if self.esta_vazia():
+            raise Exception("Lista vazia")
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        anteriores, _ = self._predecessores_por_posicao(posicao)
+        alvo = anteriores[0].proximos[0]
+        for nivel in range(self.nivel):
+            anterior = anteriores[nivel]
+            if anterior.proximos[nivel] is alvo:
+                anterior.larguras[nivel] += alvo.larguras[nivel] - 1
+                anterior.proximos[nivel] = alvo.proximos[nivel]
+            else:
+                anterior.larguras[nivel] -= 1
+        
+        while self.nivel > 1 and self.cabeca.proximos[self.nivel - 1] is None:
+            self.nivel -= 1
+        
+        self.tamanho -= 1
+        return alvo.dado
+    
+    def remover_inicio(self):
+        """Remove o elemento no início da lista."""
+        return self.remover_posicao(0)
+    
+    def remover_fim(self):
+        """Remove o elemento no fim da lista."""
+        return self.remover_posicao(self.tamanho - 1)
+    
+    def remover(self, dado):
+        """Remove uma ocorrência do valor; no modo ordenado, em O(log n) esperado."""
+        posicao = self.buscar(dado)
+        if posicao == -1:
+            return False
+        self.remover_posicao(posicao)
+        return True
+    
+    def obter(self, posicao):
+        """Recupera o elemento em uma posição específica - O(log n) esperado."""
+        if posicao < 0 or posicao >= self.tamanho:
+            raise IndexError("Posição inválida")
+        
+        no = self.cabeca
+        percorrido = -1
+        for nivel in range(self.nivel - 1, -1, -1):
+            while (no.proximos[nivel] is not None and
+                   percorrido + no.larguras[nivel] <= posicao):
+                percorrido += no.larguras[nivel]
+                no = no.proximos[nivel]
+            if percorrido == posicao:
+                break
+        return no.dado
+    
+    def buscar(self, dado):
+        """
+        Busca um elemento e retorna sua posição, ou -1.
+        Modo ordenado: O(log n) esperado. Modo posicional: O(n).
+        """
+        if not self.ordenada:
+            posicao = 0
+            for valor in self:
+                if valor == dado:
+                    return posicao
+                posicao += 1
+            return -1
+        
+        no = self.cabeca
+        percorrido = -1
+        for nivel in range(self.nivel - 1, -1, -1):
+            while (no.proximos[nivel] is not None and
+                   no.proximos[nivel].dado < dado):
+                percorrido += no.larguras[nivel]
+                no = no.proximos[nivel]
+        candidato = no.proximos[0]
+        if candidato is not None and candidato.dado == dado:
+            return percorrido + 1
+        return -1
+    
+    @classmethod
+    def de_iteravel(cls, iteravel, ordenada=False, semente=None):
+        """Constrói a skip list em O(n), ligando os nós de cada nível da esquerda para a direita."""
+        lista = cls(ordenada, semente)
+        valores = sorted(iteravel) if ordenada else iteravel
+        cabeca = lista.cabeca
+        ultimos = [cabeca] * NIVEL_MAXIMO
+        posicoes_ultimos = [-1] * NIVEL_MAXIMO
+        posicao = -1
+        for dado in valores:
+            posicao += 1
+            altura = lista._sortear_altura()
+            novo_no = NoSkip(dado, altura)
+            for nivel in range(altura):
+                ultimos[nivel].proximos[nivel] = novo_no
+                ultimos[nivel].larguras[nivel] = posicao - posicoes_ultimos[nivel]
+                ultimos[nivel] = novo_no
+                posicoes_ultimos[nivel] = posicao
+            if altura > lista.nivel:
+                lista.nivel = altura
+        
+        lista.tamanho = posicao + 1
+        for nivel in range(lista.nivel):
+            # A última ligação de cada nível vai até o fim da lista
+            ultimos[nivel].larguras[nivel] = lista.tamanho - posicoes_ultimos[nivel]
+        return lista
+    
+    def __iter__(self):
+        no = self.cabeca.proximos[0]
+        while no is not None:
+            yield no.dado
+            no = no.proximos[0]
+    
+    def imprimir(self):
+        """Imprime todos os elementos da lista."""
+        if self.esta_vazia():
+            print("Lista vazia")
+            return
+        
+        print(" -> ".join(str(valor) for valor in self))
+    
+    def imprimir_niveis(self):
+        """Imprime os elementos presentes em cada nível, do mais alto para o mais baixo."""
+        for nivel in range(self.nivel - 1, -1, -1):
+            elementos = []
+            no = self.cabeca.proximos[nivel]
+            while no is not None:
+                elementos.append(str(no.dado))
+                no = no.proximos[nivel]
+            print(f"Nível {nivel}: " + " -> ".join(elementos))
+
+
+def demonstrar_skip_list():
+    """Demonstra as operações da skip list nos dois modos."""
+    print("\n1. SKIP LIST INDEXÁVEL (MODO POSICIONAL)")
+    print("-" * 50)
+    
+    lista = SkipListIndexavel(semente=3)
+    for valor in [10, 20, 30, 40, 50, 60]:
+        lista.inserir_fim(valor)
+    lista.inserir_posicao(2, 25)
+    print("Lista: ", end="")
+    lista.imprimir()
+    lista.imprimir_niveis()
+    print(f"Valor na posição 4: {lista.obter(4)}")
+    print(f"Removido da posição 0: {lista.remover_posicao(0)}")
+    print("Lista: ", end="")
+    lista.imprimir()
+    
+    print("\n2. SKIP LIST INDEXÁVEL (MODO ORDENADO)")
+    print("-" * 50)
+    
+    ordenada = SkipListIndexavel(ordenada=True, semente=3)
+    for valor in [42, 7, 19, 88, 3, 61]:
+        ordenada.inserir(valor)
+    print("Lista: ", end="")
+    ordenada.imprimir()
+    print(f"Posição do valor 61: {ordenada.buscar(61)}")
+    print(f"Posição do valor 50: {ordenada.buscar(50)}")
+    print(f"Terceiro menor valor (obter(2)): {ordenada.obter(2)}")
+
+
+def comparar_desempenho(tamanhos=(10000, 100000, 1000000), operacoes=2000):
+    """Compara acesso e inserção por posição em diferentes tamanhos."""
+    print("\n3. COMPARAÇÃO DE DESEMPENHO")
+    print("-" * 50)
+    print("Tempo médio por operação (metade obter, metade inserir_posicao), em microssegundos\n")
+    print(f"{'Tamanho':>10} | {'Skip list':>10} | {'Lista nativa':>12} | {'Lista encadeada':>15}")
+    
+    for tamanho in tamanhos:
+        gerador = random.Random(tamanho)
+        posicoes = [gerador.randrange(tamanho) for _ in range(operacoes)]
+        
+        def medir(obter, inserir_posicao, quantidade):
+            inicio = time.perf_counter()
+            for i in range(quantidade):
+                if i % 2 == 0:
+                    obter(posicoes[i])
+                else:
+                    inserir_posicao(posicoes[i], i)
+            return (time.perf_counter() - inicio) / quantidade * 1e6
+        
+        skip = SkipListIndexavel.de_iteravel(range(tamanho), semente=1)
+        tempo_skip = medir(skip.obter, skip.inserir_posicao, operacoes)
+        
+        nativa = list(range(tamanho))
+        tempo_nativa = medir(nativa.__getitem__, nativa.insert, operacoes)
+        
+        # A lista encadeada é O(n) por operação: mede menos operações nos tamanhos grandes
+        encadeada = ListaEncadeada.de_iteravel(range(tamanho))
+        quantidade = max(10, min(operacoes, 10 ** 7 // tamanho))
+        tempo_encadeada = medir(encadeada.obter, encadeada.inserir_posicao, quantidade)
+        del skip, nativa, encadeada
+        
+        print(f"{tamanho:>10} | {tempo_skip:>10.2f} | {tempo_nativa:>12.2f} | "
+              f"{tempo_encadeada:>15.2f}")
+    
+    print("\nObservações:")
+    print("- Cada nível pula em média o dobro de elementos do nível abaixo")
+    print("- As larguras das ligações permitem contar posições sem percorrer todos os nós")
+    print("- A lista nativa faz acesso em O(1), mas inserir no meio desloca O(n) referências")
+    print("- Com a mesma semente, as alturas dos nós (e os tempos) são reproduzíveis")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE SKIP LIST INDEXÁVEL")
+    print("=" * 50)
+    
+    demonstrar_skip_list()
+    comparar_desempenho()
@@ -0,0 +1,464 @@
+"""
+Exemplo de Compilação e Avaliação de Expressões com Pilhas
+
+As funções infixa_para_posfixa e avaliar_posfixa (exemplo_pilha.py) trabalham um
+caractere por vez: não aceitam números com vários dígitos, decimais, menos unário
+nem variáveis. Este arquivo separa o processo em três etapas:
+
+1. Tokenizador: transforma o texto em uma lista de tokens
+2. Compilador (algoritmo shunting-yard): gera um programa pós-fixo compacto, com
+   um array de códigos de operação e um array de argumentos
+3. Avaliador: executa o programa com uma pilha de valores pré-alocada
+
+Como a mesma fórmula costuma ser avaliada muitas vezes com valores diferentes,
+ela é compilada uma única vez e o programa é executado quantas vezes for preciso.
+Um cache LRU guarda os programas já compilados, e avaliar(expressao, **variaveis)
+usa esse cache.
+"""
+
+import re
+import time
+import random
+from array import array
+from collections import OrderedDict
+
+
+# Códigos de operação do programa pós-fixo
+EMPILHAR_CONSTANTE = 0
+EMPILHAR_VARIAVEL = 1
+SOMAR = 2
+SUBTRAIR = 3
+MULTIPLICAR = 4
+DIVIDIR = 5
+POTENCIA = 6
+NEGAR = 7
+
+# Operador -> (precedência, associativo à direita, código de operação)
+OPERADORES = {
+    '+': (1, False, SOMAR),
+    '-': (1, False, SUBTRAIR),
+    '*': (2, False, MULTIPLICAR),
+    '/': (2, False, DIVIDIR),
+    'neg': (3, True, NEGAR),  # Menos unário: -2^2 = -(2^2)
+    '^': (4, True, POTENCIA),
+}
+
+SIMBOLOS = {SOMAR: '+', SUBTRAIR: '-', MULTIPLICAR: '*', DIVIDIR: '/',
+            POTENCIA: '^', NEGAR: 'neg'}
+
+PADRAO_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<numero>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)
+      | (?P<nome>[A-Za-z_]\w*)
+      | (?P<simbolo>\*\*|[-+*/^()])
+    )""", re.VERBOSE)
+
+
+def tokenizar(expressao):
+    """
+    Converte o texto da expressão em uma lista de tokens (tipo, valor).
+    Tipos: 'numero', 'nome', 'operador', '(' e ')'. O '-' que aparece no início,
+    depois de outro operador ou depois de '(' é o menos unário ('neg').
+    """
+    tokens = []
+    posicao = 0
+    expressao = expressao.rstrip()
+    while posicao < len(expressao):
+        encontrado = PADRAO_TOKEN.match(expressao, posicao)
+        if encontrado is None:
+            posicao_erro = len(expressao) - len(expressao[posicao:].lstrip())
+            raise ValueError(f"Caractere inválido na posição {posicao_erro}: "
+                             f"'{expressao[posicao_erro]}'")
+        posicao = encontrado.end()
+        
+        if encontrado.group("numero"):
+            texto = encontrado.group("numero")
+            if any(c in texto for c in ".eE"):
+                tokens.append(("numero", float(texto)))
+            else:
+                tokens.append(("numero", int(texto)))
+        elif encontrado.group("nome"):
+            tokens.append(("nome", encontrado.group("nome")))
+        else:
+            simbolo = encontrado.group("simbolo")
+            if simbolo == '**':
+                simbolo = '^'
+            if simbolo in '()':
+                tokens.append((simbolo, simbolo))
+                continue
+            espera_operando = not tokens or tokens[-1][0] in ("operador", "(")
+            if espera_operando:
+                if simbolo == '-':
+                    tokens.append(("operador", "neg"))
+                elif simbolo == '+':
+                    continue  # Mais unário não tem efeito
+                else:
+                    raise ValueError(f"Operador '{simbolo}' sem operando à esquerda")
+            else:
+                tokens.append(("operador", simbolo))
+    return tokens
+
+
+class ProgramaPosfixo:
+    """
+    Programa pós-fixo compilado.
+    'codigos' é um array de bytes com os códigos de operação e 'argumentos' guarda,
+    para cada instrução, o índice da constante ou da variável que ela empilha.
+    'profundidade' é o maior tamanho que a pilha de valores atinge, calculado na
+    compilação, o que permite pré-alocar a pilha do avaliador.
+    """
+    def __init__(self, codigos, argumentos, constantes, variaveis, profundidade):
+        self.codigos = codigos
+        self.argumentos = argumentos
+        self.constantes = constantes
+        self.variaveis = variaveis
+        self.profundidade = profundidade
+    
+    def __len__(self):
+        return len(self.codigos)
+    
+    def posfixa(self):
+        """Retorna o programa em notação pós-fixa legível."""
+        partes = []
+        for codigo, argumento in zip(self.codigos, self.argumentos):
+            if codigo == EMPILHAR_CONSTANTE:
+                partes.append(str(self.constantes[argumento]))
+            elif codigo == EMPILHAR_VARIAVEL:
+                partes.append(self.variaveis[argumento])
+            else:
+                partes.append(SIMBOLOS[codigo])
+        return " ".join(partes)
+    
+    def executar(self, *valores):
+        """
+        Avalia o programa. Os valores das variáveis são passados na ordem de
+        'self.variaveis' (a ordem em que aparecem na expressão).
+        """
+        if len(valores) != len(self.variaveis):
+            raise ValueError(f"O programa espera {len(self.variaveis)} valores: "
+                             f"{', '.join(self.variaveis)}")
+        
+        constantes = self.constantes
+        pilha = [0] * self.profundidade  # Pilha de valores pré-alocada
+        topo = -1
+        for codigo, argumento in zip(self.codigos, self.argumentos):
+            if codigo == EMPILHAR_CONSTANTE:
+                topo += 1
+                pilha[topo] = constantes[argumento]
+            elif codigo == EMPILHAR_VARIAVEL:
+                topo += 1
+                pilha[topo] = valores[argumento]
+            elif codigo == NEGAR:
+                pilha[topo] = -pilha[topo]
+            else:
+                b = pilha[topo]
+                topo -= 1
+                a = pilha[topo]
+                if codigo == SOMAR:
+                    pilha[topo] = a + b
+                elif codigo == SUBTRAIR:
+                    pilha[topo] = a - b
+                elif codigo == MULTIPLICAR:
+                    pilha[topo] = a * b
+                elif codigo == DIVIDIR:
+                    pilha[topo] = a / b
+                else:
+                    pilha[topo] = a ** b
+        return pilha[0]
+    
+    def avaliar(self, **variaveis):
+        """Avalia o programa com os valores das variáveis passados por nome."""
+        try:
+            valores = [variaveis[nome] for nome in self.variaveis]
+        except KeyError as erro:
+            raise ValueError(f"Variável sem valor: {erro.args[0]}") from None
+        return self.executar(*valores)
+
+
+def compilar(expressao):
+    """
+    Compila uma expressão infixa em um ProgramaPosfixo com o algoritmo
+    shunting-yard: operandos vão direto para a saída e operadores esperam em uma
+    pilha até que apareça um operador de precedência menor (ou igual, se o
+    operador for associativo à esquerda) ou um ')'.
+    """
+    return _compilar_tokens(tokenizar(expressao))
+
+
+def _compilar_tokens(tokens):
+    """Compila uma lista de tokens já produzida por tokenizar."""
+    codigos = array('B')
+    argumentos = array('l')
+    constantes = []
+    variaveis = []
+    indice_constante = {}
+    indice_variavel = {}
+    pilha = []  # Operadores e '(' pendentes
+    profundidade = 0
+    maior_profundidade = 0
+    
+    def emitir(codigo, argumento=0):
+        nonlocal profundidade, maior_profundidade
+        codigos.append(codigo)
+        argumentos.append(argumento)
+        if codigo in (EMPILHAR_CONSTANTE, EMPILHAR_VARIAVEL):
+            profundidade += 1
+            maior_profundidade = max(maior_profundidade, profundidade)
+        elif codigo != NEGAR:
+            profundidade -= 1
+        if profundidade < 1:
+            raise ValueError("Expressão inválida")
+    
+    def emitir_operador(operador):
+        emitir(OPERADORES[operador][2])
+    
+    anterior = None
+    for tipo, valor in tokens:
+        if tipo in ("numero", "nome", "(") and anterior in ("numero", "nome", ")"):
+            raise ValueError("Expressão inválida: falta um operador entre dois operandos")
+        
+        if tipo == "numero":
+            # O tipo faz parte da chave: 10 == 10.0 em Python, mas 10 ** 20 e
+            # 10.0 ** 20 dão resultados de tipos diferentes
+            chave = (type(valor), valor)
+            if chave not in indice_constante:
+                indice_constante[chave] = len(constantes)
+                constantes.append(valor)
+            emitir(EMPILHAR_CONSTANTE, indice_constante[chave])
+        elif tipo == "nome":
+            if valor not in indice_variavel:
+                indice_variavel[valor] = len(variaveis)
+                variaveis.append(valor)
+            emitir(EMPILHAR_VARIAVEL, indice_variavel[valor])
+        elif tipo == "(":
+            pilha.append(valor)
+        elif tipo == ")":
+            while pilha and pilha[-1] != '(':
+                emitir_operador(pilha.pop())
+            if not pilha:
+                raise ValueError("Parênteses desbalanceados")
+            pilha.pop()
+        elif valor == 'neg':
+            pilha.append(valor)  # Operador prefixo: não tem operando à esquerda para fechar
+        else:
+            precedencia, direita, _ = OPERADORES[valor]
+            while pilha and pilha[-1] != '(':
+                precedencia_topo = OPERADORES[pilha[-1]][0]
+                if precedencia_topo > precedencia or (precedencia_topo == precedencia
+                                                      and not direita):
+                    emitir_operador(pilha.pop())
+                else:
+                    break
+            pilha.append(valor)
+        anterior = tipo
+    
+    while pilha:
+        operador = pilha.pop()
+        if operador == '(':
+            raise ValueError("Parênteses desbalanceados")
+        emitir_operador(operador)
+    
+    if profundidade != 1:
+        raise ValueError("Expressão inválida")
+    return ProgramaPosfixo(codigos, argumentos, constantes, tuple(variaveis),
+                           maior_profundidade)
+
+
+class CacheExpressoes:
+    """
+    Cache LRU (menos usado recentemente) de programas compilados.
+    A chave é a sequência de tokens da expressão, então textos que só diferem na
+    escrita ("a+b", "a + b", "a ** 2" e "a ^ 2") usam o mesmo programa. No máximo
+    'capacidade' programas ficam guardados: quando o cache enche, o programa
+    usado há mais tempo é descartado.
+    Para não tokenizar o texto a cada consulta, um segundo dicionário (também com
+    no máximo 'capacidade' entradas) liga cada texto já visto à sua chave.
+    """
+    def __init__(self, capacidade=1024):
+        if capacidade < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1")
+        self.capacidade = capacidade
+        self.programas = OrderedDict()  # Do menos para o mais recentemente usado
+        self.chaves = {}  # Texto -> chave de tokens, na ordem em que foram vistos
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+    
+    def __len__(self):
+        return len(self.programas)
+    
+    def obter(self, expressao):
+        """Retorna o programa da expressão, compilando-o apenas se não estiver no cache."""
+        chave = self.chaves.get(expressao)
+        tokens = None
+        if chave is None:
+            tokens = tokenizar(expressao)
+            # O tipo do valor entra na chave para que '10' e '10.0' não se confundam
+            chave = tuple((tipo, type(valor), valor) for tipo, valor in tokens)
+        
+        programa = self.programas.get(chave)
+        if programa is not None:
+            self.acertos += 1
+            self.programas.move_to_end(chave)
+        else:
+            self.falhas += 1
+            programa = _compilar_tokens(tokens if tokens is not None else tokenizar(expressao))
+            self.programas[chave] = programa
+            if len(self.programas) > self.capacidade:
+                self.programas.popitem(last=False)
+                self.descartes += 1
+        
+        if tokens is not None:
+            if len(self.chaves) >= self.capacidade:
+                del self.chaves[next(iter(self.chaves))]  # Descarta o texto mais antigo
+            self.chaves[expressao] = chave
+        return programa
+    
+    def limpar(self):
+        """Remove todos os programas e zera os contadores."""
+        self.programas.clear()
+        self.chaves.clear()
+        self.acertos = self.falhas = self.descartes = 0
+    
+    def taxa_acerto(self):
+        """Retorna a fração de consultas atendidas pelo cache."""
+        total = self.acertos + self.falhas
+        if total == 0:
+            return 0.0
+        return self.acertos / total
+
+
+cache_padrao = CacheExpressoes()
+
+
+def avaliar(expressao, **variaveis):
+    """
+    Avalia uma expressão com os valores das variáveis passados por nome.
+    A expressão só é compilada na primeira vez; depois o programa vem do cache.
+    Exemplo: avaliar("preco * (1 - desconto)", preco=50, desconto=0.2) -> 40.0
+    """
+    return cache_padrao.obter(expressao).avaliar(**variaveis)
+
+
+def demonstrar_compilador():
+    """Mostra a tokenização, a compilação e a avaliação de algumas expressões."""
+    print("\n1. TOKENIZADOR, COMPILADOR E AVALIADOR")
+    print("-" * 50)
+    
+    print(f"Tokens de '-3.5 * (x + 12)': {tokenizar('-3.5 * (x + 12)')}")
+    
+    exemplos = [
+        ("12 + 30 * 2", ()),
+        ("(1.5 + 2.5) * -4", ()),
+        ("2 ^ 3 ^ 2", ()),
+        ("-2 ^ 2", ()),
+        ("preco * quantidade * (1 - desconto)", (19.9, 3, 0.1)),
+        ("a * x ^ 2 + b * x + c", (2, 3, 1, 4)),
+    ]
+    for expressao, valores in exemplos:
+        programa = compilar(expressao)
+        resultado = programa.executar(*valores)
+        print(f"\nExpressão: {expressao}")
+        print(f"Pós-fixa:  {programa.posfixa()}")
+        if programa.variaveis:
+            atribuicoes = ", ".join(f"{nome}={valor}"
+                                    for nome, valor in zip(programa.variaveis, valores))
+            print(f"Variáveis: {atribuicoes}")
+        print(f"Resultado: {resultado}")
+    
+    print("\nO operador ^ é associativo à direita: 2 ^ 3 ^ 2 = 2 ^ (3 ^ 2) = 512")
+    
+    for invalida in ["2 +", "(1 + 2", "3 $ 4", "2 3"]:
+        try:
+            compilar(invalida)
+        except ValueError as erro:
+            print(f"Erro em '{invalida}': {erro}")
+
+
+def comparar_compilacao(avaliacoes=100000):
+    """Compara compilar a cada avaliação com compilar uma vez e executar o programa."""
+    print("\n2. COMPILAR UMA VEZ, AVALIAR MUITAS VEZES")
+    print("-" * 50)
+    
+    expressao = "a * x ^ 2 + b * x + c - (x - 1) / (a + 2)"
+    valores = [(1.5, i * 0.001, 2.0, -1.0) for i in range(avaliacoes)]
+    
+    inicio = time.perf_counter()
+    for a, x, b, c in valores:
+        compilar(expressao).executar(a, x, b, c)
+    tempo_recompilando = time.perf_counter() - inicio
+    
+    programa = compilar(expressao)
+    inicio = time.perf_counter()
+    for a, x, b, c in valores:
+        programa.executar(a, x, b, c)
+    tempo_compilado = time.perf_counter() - inicio
+    
+    # Referência: a mesma fórmula compilada pelo próprio Python
+    codigo = compile(expressao.replace("^", "**"), "<formula>", "eval")
+    inicio = time.perf_counter()
+    for a, x, b, c in valores:
+        eval(codigo, {}, {"a": a, "x": x, "b": b, "c": c})
+    tempo_python = time.perf_counter() - inicio
+    
+    print(f"Fórmula: {expressao}")
+    print(f"{avaliacoes} avaliações:")
+    print(f"Compilando a cada avaliação:           {tempo_recompilando:.4f} segundos")
+    print(f"Compilando uma vez (ProgramaPosfixo):  {tempo_compilado:.4f} segundos")
+    print(f"Referência: compile/eval do Python:    {tempo_python:.4f} segundos")
+    print(f"Compilar uma vez foi {tempo_recompilando / tempo_compilado:.1f}x mais rápido")
+    
+    print("\nObservações:")
+    print("- Tokenizar e converter a expressão custa mais do que avaliá-la")
+    print("- O programa pós-fixo é avaliado com uma única pilha pré-alocada")
+    print("- O avaliador roda em Python puro; o eval do Python usa a máquina virtual em C")
+
+
+def comparar_cache(formulas=2000, avaliacoes=200000):
+    """Simula um motor de regras que avalia milhares de fórmulas distintas repetidamente."""
+    print("\n3. CACHE LRU DE EXPRESSÕES COMPILADAS")
+    print("-" * 50)
+    
+    print(f"avaliar('preco * (1 - desconto)', preco=50, desconto=0.2) = "
+          f"{avaliar('preco * (1 - desconto)', preco=50, desconto=0.2)}")
+    print(f"avaliar('preco*(1-desconto)', preco=80, desconto=0.5) = "
+          f"{avaliar('preco*(1-desconto)', preco=80, desconto=0.5)} "
+          f"(mesmo programa: {cache_padrao.acertos} acerto)")
+    
+    textos = [f"a * x ^ {k % 4 + 1} + b * {k} - c / (x + {k + 1})" for k in range(formulas)]
+    gerador = random.Random(42)
+    # Algumas fórmulas são muito mais usadas do que outras, como em um motor de regras real
+    escolhas = [textos[min(int(gerador.expovariate(1 / (formulas / 4))), formulas - 1)]
+                for _ in range(avaliacoes)]
+    variaveis = {"a": 1.5, "b": 2.0, "c": 3.0, "x": 0.5}
+    
+    print(f"\n{avaliacoes} avaliações de {formulas} fórmulas distintas:")
+    inicio = time.perf_counter()
+    for texto in escolhas:
+        compilar(texto).avaliar(**variaveis)
+    tempo_sem_cache = time.perf_counter() - inicio
+    print(f"{'Sem cache':>24}: {tempo_sem_cache:.4f} segundos")
+    
+    for capacidade in (formulas * 2, formulas // 4):
+        cache = CacheExpressoes(capacidade)
+        inicio = time.perf_counter()
+        for texto in escolhas:
+            cache.obter(texto).avaliar(**variaveis)
+        tempo = time.perf_counter() - inicio
+        print(f"{f'Cache de {capacidade}':>24}: {tempo:.4f} segundos | "
+              f"acertos {cache.taxa_acerto() * 100:.1f}% | "
+              f"falhas {cache.falhas} | descartes {cache.descartes}")
+    
+    print("\nObservações:")
+    print("- Com o cache, cada fórmula distinta é compilada uma vez (enquanto permanecer nele)")
+    print("- Um cache menor que o conjunto de fórmulas em uso ainda aproveita as mais frequentes,")
+    print("  mas os descartes mostram quantas recompilações foram necessárias")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE COMPILAÇÃO DE EXPRESSÕES")
+    print("=" * 50)
+    
+    demonstrar_compilador()
+    comparar_compilacao()
+    comparar_cache()
@@ -0,0 +1,313 @@
+"""
+Exemplo de Verificação de Parênteses em Fluxo e em Paralelo
+
+verificar_parenteses_balanceados (exemplo_pilha.py) precisa da expressão inteira
+em uma única string. Para arquivos de vários gigabytes, este arquivo:
+
+1. Resume cada bloco do texto em (fechamentos sem par, aberturas sem par), usando
+   uma pilha apenas para os símbolos do próprio bloco
+2. Combina os resumos da esquerda para a direita; a combinação é associativa,
+   então o resultado não depende de onde os blocos foram cortados
+3. Usa isso em dois modos: um verificador que recebe os blocos em sequência e
+   mantém o estado entre eles, e um modo paralelo em que os blocos são resumidos
+   em processos auxiliares
+
+Nos dois modos, a posição informada é a do primeiro erro que a verificação
+caractere a caractere encontraria.
+"""
+
+import os
+import random
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from exemplo_pilha import verificar_parenteses_balanceados
+
+
+PARES = {')': '(', ']': '[', '}': '{'}
+ABERTURAS = '([{'
+PADRAO_TEXTO = re.compile(r"[()\[\]{}]")
+PADRAO_BYTES = re.compile(rb"[()\[\]{}]")
+NAO_SIMBOLOS = bytes(range(256)).translate(None, b"()[]{}")
+TAMANHO_PEDACO = 4096
+
+
+class ResumoParenteses:
+    """
+    Resumo de um trecho do texto.
+    'fechamentos' são os símbolos de fechamento sem abertura dentro do trecho e
+    'aberturas' são as aberturas ainda não fechadas, ambos como (símbolo, posição).
+    'erro' guarda (posição, mensagem) do primeiro fechamento incompatível com a
+    abertura correspondente; a partir dele, o resto do trecho não é analisado.
+    """
+    
+    def __init__(self):
+        self.fechamentos = []
+        self.aberturas = []
+        self.erro = None
+    
+    def _registrar_erro(self, posicao, mensagem):
+        if self.erro is None or posicao < self.erro[0]:
+            self.erro = (posicao, mensagem)
+    
+    def combinar(self, outro):
+        """
+        Junta ao resumo atual o resumo do trecho imediatamente seguinte.
+        Os fechamentos sem par do trecho seguinte consomem as aberturas pendentes
+        deste trecho, do topo para a base, exatamente como a pilha faria.
+        """
+        if outro.erro is not None:
+            self._registrar_erro(*outro.erro)
+        
+        aberturas = self.aberturas
+        for simbolo, posicao in outro.fechamentos:
+            if not aberturas:
+                self.fechamentos.append((simbolo, posicao))
+                continue
+            abertura, posicao_abertura = aberturas.pop()
+            if abertura != PARES[simbolo]:
+                self._registrar_erro(posicao, f"'{simbolo}' na posição {posicao} não fecha "
+                                              f"'{abertura}' aberto na posição {posicao_abertura}")
+                break
+        aberturas.extend(outro.aberturas)
+        return self
+    
+    def resultado(self):
+        """Retorna (balanceado, posição do erro, mensagem); sem erro, (True, None, None)."""
+        candidatos = []
+        if self.erro is not None:
+            candidatos.append(self.erro)
+        if self.fechamentos:
+            simbolo, posicao = self.fechamentos[0]
+            candidatos.append((posicao, f"'{simbolo}' na posição {posicao} "
+                                        f"não tem abertura correspondente"))
+        if candidatos:
+            posicao, mensagem = min(candidatos)
+            return False, posicao, mensagem
+        if self.aberturas:
+            simbolo, posicao = self.aberturas[0]
+            return False, posicao, f"'{simbolo}' aberto na posição {posicao} nunca foi fechado"
+        return True, None, None
+
+
+def _filtrar(trecho):
+    """Retorna, como str, apenas os símbolos de parênteses do trecho (str ou bytes)."""
+    if isinstance(trecho, bytes):
+        return trecho.translate(None, NAO_SIMBOLOS).decode("ascii")
+    return "".join(PADRAO_TEXTO.findall(trecho))
+
+
+def _localizar(bloco, indices):
+    """
+    Converte índices na sequência de símbolos do bloco em posições no próprio bloco.
+    O bloco é percorrido em pedaços: os símbolos de cada pedaço são contados em C e
+    só os pedaços que contêm algum dos índices pedidos são examinados um a um.
+    """
+    padrao = PADRAO_BYTES if isinstance(bloco, bytes) else PADRAO_TEXTO
+    pendentes = sorted(set(indices))
+    posicoes = {}
+    proximo = 0
+    anteriores = 0  # Símbolos nos pedaços já percorridos
+    for inicio in range(0, len(bloco), TAMANHO_PEDACO):
+        if proximo == len(pendentes):
+            break
+        pedaco = bloco[inicio:inicio + TAMANHO_PEDACO]
+        quantidade = len(_filtrar(pedaco))
+        if pendentes[proximo] < anteriores + quantidade:
+            locais = [encontrado.start() for encontrado in padrao.finditer(pedaco)]
+            while proximo < len(pendentes) and pendentes[proximo] < anteriores + quantidade:
+                indice = pendentes[proximo]
+                posicoes[indice] = inicio + locais[indice - anteriores]
+                proximo += 1
+        anteriores += quantidade
+    return posicoes
+
+
+def resumir_bloco(bloco, inicio=0):
+    """
+    Resume um bloco (str ou bytes) cujo primeiro caractere está na posição 'inicio'.
+    A pilha percorre só a sequência de símbolos extraída em C; a posição de cada
+    símbolo no bloco é calculada depois, e apenas para os que ficaram sem par.
+    """
+    simbolos = _filtrar(bloco)
+    pilha = []
+    fechamentos = []
+    conflito = None
+    for indice, simbolo in enumerate(simbolos):
+        if simbolo in ABERTURAS:
+            pilha.append(indice)
+        elif not pilha:
+            fechamentos.append(indice)
+        else:
+            topo = pilha.pop()
+            if simbolos[topo] != PARES[simbolo]:
+                conflito = (indice, topo)
+                break
+    
+    posicoes = _localizar(bloco, fechamentos + pilha + list(conflito or ()))
+    resumo = ResumoParenteses()
+    resumo.fechamentos = [(simbolos[i], inicio + posicoes[i]) for i in fechamentos]
+    resumo.aberturas = [(simbolos[i], inicio + posicoes[i]) for i in pilha]
+    if conflito is not None:
+        indice, topo = conflito
+        posicao = inicio + posicoes[indice]
+        resumo.erro = (posicao, f"'{simbolos[indice]}' na posição {posicao} não fecha "
+                                f"'{simbolos[topo]}' aberto na posição {inicio + posicoes[topo]}")
+    return resumo
+
+
+class VerificadorParenteses:
+    """
+    Verificador que recebe o texto em blocos, na ordem, mantendo o estado da pilha
+    entre um bloco e outro. Pode ser interrompido e retomado a qualquer momento.
+    """
+    
+    def __init__(self):
+        self.resumo = ResumoParenteses()
+        self.posicao = 0  # Posição do próximo caractere a ser recebido
+    
+    def erro_definitivo(self):
+        """Indica se já há um erro que nenhum texto posterior pode corrigir."""
+        return self.resumo.erro is not None or bool(self.resumo.fechamentos)
+    
+    def alimentar(self, bloco):
+        """Processa o próximo bloco do texto."""
+        if not self.erro_definitivo():
+            self.resumo.combinar(resumir_bloco(bloco, self.posicao))
+        self.posicao += len(bloco)
+    
+    def finalizar(self):
+        """Retorna (balanceado, posição do erro, mensagem) para o texto recebido até aqui."""
+        return self.resumo.resultado()
+
+
+def ler_blocos(caminho, tamanho_bloco=1 << 20):
+    """Lê o arquivo em blocos de bytes (os símbolos verificados ocupam um byte cada)."""
+    with open(caminho, "rb") as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            yield bloco
+
+
+def verificar_arquivo(caminho, processos=None, tamanho_bloco=1 << 20):
+    """
+    Verifica o arquivo inteiro sem carregá-lo na memória.
+    Sem 'processos', usa o VerificadorParenteses e para no primeiro erro definitivo.
+    Com 'processos', cada bloco é resumido em um processo auxiliar e os resumos são
+    combinados na ordem; no máximo 2 blocos por processo ficam pendentes de cada vez.
+    """
+    if not processos:
+        verificador = VerificadorParenteses()
+        for bloco in ler_blocos(caminho, tamanho_bloco):
+            verificador.alimentar(bloco)
+            if verificador.erro_definitivo():
+                break
+        return verificador.finalizar()
+    
+    resumo = ResumoParenteses()
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = []
+        inicio = 0
+        for bloco in ler_blocos(caminho, tamanho_bloco):
+            pendentes.append(executor.submit(resumir_bloco, bloco, inicio))
+            inicio += len(bloco)
+            if len(pendentes) >= 2 * processos:
+                resumo.combinar(pendentes.pop(0).result())
+        for futuro in pendentes:
+            resumo.combinar(futuro.result())
+    return resumo.resultado()
+
+
+def demonstrar_verificador():
+    """Mostra que o resultado não depende de onde o texto é cortado em blocos."""
+    print("\n1. VERIFICAÇÃO EM BLOCOS")
+    print("-" * 50)
+    
+    expressoes = ["{ [ ( ) ] ( ) }", "( [ ) ]", "( ( ( ) )", "[ ] ) (", "x = {a: [1, (2)]}"]
+    for expressao in expressoes:
+        print(f"\nExpressão: {expressao}")
+        print(f"verificar_parenteses_balanceados: {verificar_parenteses_balanceados(expressao)}")
+        for tamanho in (1, 3, len(expressao)):
+            verificador = VerificadorParenteses()
+            for i in range(0, len(expressao), tamanho):
+                verificador.alimentar(expressao[i:i + tamanho])
+            balanceado, posicao, mensagem = verificador.finalizar()
+            texto = "balanceado" if balanceado else mensagem
+            print(f"  blocos de {tamanho:>2} caracteres: {texto}")
+
+
+def gerar_arquivo(caminho, tamanho_mb, semente=42):
+    """Gera um arquivo no estilo JSON, com estruturas aninhadas e balanceadas."""
+    gerador = random.Random(semente)
+    limite = tamanho_mb * 1024 * 1024
+    escritos = 0
+    with open(caminho, "w") as arquivo:
+        while escritos < limite:
+            partes = []
+            for i in range(2000):
+                profundidade = gerador.randint(1, 6)
+                partes.append('{"id": %d, "v": ' % i + "[" * profundidade +
+                              "1, 2, (3)" + "]" * profundidade + "}\n")
+            texto = "".join(partes)
+            arquivo.write(texto)
+            escritos += len(texto)
+
+
+def medir_vazao(tamanho_mb=64, processos=None):
+    """Compara a função original, o verificador em fluxo e o modo paralelo."""
+    print(f"\n2. VAZÃO COM UM ARQUIVO DE {tamanho_mb} MB")
+    print("-" * 50)
+    
+    processos = processos or os.cpu_count()
+    descritor, caminho = tempfile.mkstemp(suffix=".txt")
+    os.close(descritor)
+    try:
+        gerar_arquivo(caminho, tamanho_mb)
+        with open(caminho, "ab") as arquivo:
+            arquivo.write(b"{[}\n")  # Um erro no fim do arquivo
+        tamanho_real = os.path.getsize(caminho) / (1024 * 1024)
+        
+        with open(caminho) as arquivo:
+            texto = arquivo.read()
+        inicio = time.perf_counter()
+        resultado_original = verificar_parenteses_balanceados(texto)
+        tempo_original = time.perf_counter() - inicio
+        del texto
+        
+        inicio = time.perf_counter()
+        resultado_fluxo = verificar_arquivo(caminho)
+        tempo_fluxo = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        resultado_paralelo = verificar_arquivo(caminho, processos=processos)
+        tempo_paralelo = time.perf_counter() - inicio
+    finally:
+        os.remove(caminho)
+    
+    print(f"Original (string inteira na memória): {tempo_original:.2f} s "
+          f"({tamanho_real / tempo_original:.1f} MB/s) -> {resultado_original}")
+    print(f"Em fluxo: {tempo_fluxo:.2f} s ({tamanho_real / tempo_fluxo:.1f} MB/s) "
+          f"-> {resultado_fluxo[2]}")
+    print(f"Paralelo ({processos} processos): {tempo_paralelo:.2f} s "
+          f"({tamanho_real / tempo_paralelo:.1f} MB/s) -> {resultado_paralelo[2]}")
+    print(f"Mesmo erro nos dois modos: {resultado_fluxo == resultado_paralelo}")
+    
+    print("\nObservações:")
+    print("- Em fluxo, a memória usada depende do tamanho do bloco e da profundidade")
+    print("  de aninhamento, não do tamanho do arquivo")
+    print("- A função original só diz se há erro; os novos modos dizem onde ele está")
+    print("- Os dois modos separam os símbolos do resto do texto em C e só percorrem em")
+    print("  Python os parênteses, o que compensa mesmo em textos com muitos símbolos")
+    print("- O ganho do modo paralelo depende do número de núcleos disponíveis")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE VERIFICAÇÃO DE PARÊNTESES EM FLUXO E EM PARALELO")
+    print("=" * 70)
+    
+    demonstrar_verificador()
+    medir_vazao()
@@ -6,10 +6,13 @@ Este arquivo demonstra:
 2. Implementação de uma pilha usando lista encadeada
 3. Uso de collections.deque como pilha
 4. Aplicações práticas: verificação de parênteses balanceados, conversão de expressões e calculadora
+5. Pool de nós para reaproveitar os nós da pilha encadeada
 """
 
+import gc
 import time
 from collections import deque
+from contextlib import contextmanager
 
 
 class PilhaLista:
@@ -43,6 +46,25 @@ class PilhaLista:
         return len(self.itens)
 
 
+# Cópia idêntica em Listas/exemplo_lista.py: altere as duas juntas
+@contextmanager
+def gc_suspenso():
+    """
+    Suspende o garbage collector cíclico durante a construção de estruturas grandes.
+    Objetos criados nesse período só são percorridos a partir da primeira coleta
+    depois do bloco. Para tirá-los também das coletas seguintes, a aplicação pode
+    chamar gc.freeze(), mas ele move para a geração permanente todos os objetos
+    do processo, e não apenas a estrutura construída.
+    """
+    estava_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if estava_ativo:
+            gc.enable()
+
+
 class No:
     """Nó para a pilha baseada em lista encadeada."""
     
@@ -51,12 +73,63 @@ class No:
         self.proximo = None
 
 
+class PoolNos:
+    """
+    Pool de nós (free-list) que reaproveita os nós removidos da pilha.
+    Um mesmo pool pode ser compartilhado por várias estruturas.
+    """
+    
+    def __init__(self, limite=1000):
+        self.limite = limite  # Quantidade máxima de nós livres guardados
+        self.livres = None
+        self.quantidade_livres = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+    
+    def alocar(self, valor):
+        """Retorna um nó reaproveitado do pool ou, se ele estiver vazio, um nó novo."""
+        no = self.livres
+        if no is None:
+            self.falhas += 1
+            return No(valor)
+        
+        self.livres = no.proximo
+        self.quantidade_livres -= 1
+        self.acertos += 1
+        no.valor = valor
+        no.proximo = None
+        return no
+    
+    def liberar(self, no):
+        """Devolve ao pool um nó que já foi desligado da estrutura."""
+        no.valor = None
+        if self.quantidade_livres >= self.limite:
+            self.descartes += 1
+            return
+        
+        no.proximo = self.livres
+        self.livres = no
+        self.quantidade_livres += 1
+    
+    def taxa_acerto(self):
+        """Retorna a fração de alocações atendidas pelo pool."""
+        total = self.acertos + self.falhas
+        if total == 0:
+            return 0.0
+        return self.acertos / total
+
+
 class PilhaEncadeada:
-    """Implementação de uma pilha usando lista encadeada."""
+    """
+    Implementação de uma pilha usando lista encadeada.
+    Opcionalmente recebe um PoolNos para reaproveitar os nós desempilhados.
+    """
     
-    def __init__(self):
+    def __init__(self, pool=None):
         self.topo_no = None
         self._tamanho = 0
+        self.pool = pool
     
     def esta_vazia(self):
         """Verifica se a pilha está vazia."""
@@ -64,7 +137,10 @@ class PilhaEncadeada:
     
     def empilhar(self, item):
         """Adiciona um item ao topo da pilha."""
-        novo_no = No(item)
+        if self.pool is None:
+            novo_no = No(item)
+        else:
+            novo_no = self.pool.alocar(item)
         novo_no.proximo = self.topo_no
         self.topo_no = novo_no
         self._tamanho += 1
@@ -74,8 +150,11 @@ class PilhaEncadeada:
         if self.esta_vazia():
             raise Exception("Pilha vazia")
         
-        valor = self.topo_no.valor
-        self.topo_no = self.topo_no.proximo
+        removido = self.topo_no
+        valor = removido.valor
+        self.topo_no = removido.proximo
+        if self.pool is not None:
+            self.pool.liberar(removido)
         self._tamanho -= 1
         return valor
     
@@ -88,6 +167,46 @@ class PilhaEncadeada:
     def tamanho(self):
         """Retorna o número de itens na pilha."""
         return self._tamanho
+    
+    @classmethod
+    def de_iteravel(cls, iteravel, pool=None):
+        """Constrói uma pilha empilhando os itens do iterável (o último fica no topo)."""
+        pilha = cls(pool)
+        pilha.estender(iteravel)
+        return pilha
+    
+    def estender(self, iteravel):
+        """
+        Empilha todos os itens do iterável com o garbage collector suspenso.
+        Se o iterável levantar uma exceção no meio, os itens lidos até ali ficam na pilha.
+        """
+        topo_no = self.topo_no
+        quantidade = 0
+        try:
+            with gc_suspenso():
+                for item in iteravel:
+                    if self.pool is None:
+                        novo_no = No(item)
+                    else:
+                        novo_no = self.pool.alocar(item)
+                    novo_no.proximo = topo_no
+                    topo_no = novo_no
+                    quantidade += 1
+        finally:
+            self.topo_no = topo_no
+            self._tamanho += quantidade
+    
+    def limpar(self):
+        """Esvazia a pilha desligando os nós um a um, sem destruição em cascata."""
+        atual = self.topo_no
+        self.topo_no = None
+        self._tamanho = 0
+        while atual is not None:
+            proximo = atual.proximo
+            atual.proximo = None
+            if self.pool is not None:
+                self.pool.liberar(atual)
+            atual = proximo
 
 
 def demonstrar_pilha_lista():
@@ -240,6 +359,8 @@ def infixa_para_posfixa(expressao):
     """
     Converte uma expressão infixa para notação pós-fixa (polonesa reversa).
     Exemplo: "A + B * C" -> "A B C * +"
+    Trabalha um caractere por vez; para números com vários dígitos, decimais,
+    menos unário e variáveis, veja exemplo_expressoes.py.
     """
     # Definindo a precedência dos operadores
     precedencia = {'+': 1, '-': 1, '*': 2, '/': 2, '^': 3}
@@ -269,10 +390,13 @@ def infixa_para_posfixa(expressao):
                 pilha.pop()
         
         # Se for um operador
+        # (o '^' é associativo à direita: 2^3^2 = 2^(3^2), então só desempilha
+        # operadores de precedência estritamente maior)
         else:
             while pilha and pilha[-1] != '(' and (
                     pilha[-1] not in precedencia or
-                    precedencia.get(token, 0) <= precedencia.get(pilha[-1], 0)):
+                    precedencia.get(token, 0) < precedencia.get(pilha[-1], 0) or
+                    (token != '^' and precedencia.get(token, 0) == precedencia.get(pilha[-1], 0))):
                 resultado.append(pilha.pop())
             pilha.append(token)
     
@@ -333,7 +457,8 @@ def aplicacao_calculadora():
         "5 * 2 + 1",
         "( 5 + 3 ) * 2",
         "5 + 3 * 2",
-        "( 7 - 2 ) * 3 + 4"
+        "( 7 - 2 ) * 3 + 4",
+        "2 ^ 3 ^ 2"
     ]
     
     print("Conversão de notação infixa para pós-fixa:")
@@ -423,6 +548,88 @@ def simulacao_chamadas_funcao():
     print("- Se a pilha ficar muito grande, você pode ter um 'stack overflow'")
 
 
+def comparar_pool_nos(operacoes=1000000):
+    """Compara a PilhaEncadeada com e sem pool de nós em milhões de empilhar/desempilhar."""
+    print("\n7. PILHA ENCADEADA COM POOL DE NÓS")
+    print("-" * 50)
+    
+    def executar_churn(pilha):
+        inicio = time.perf_counter()
+        for i in range(operacoes):
+            pilha.empilhar(i)
+            pilha.empilhar(i)
+            pilha.desempilhar()
+            pilha.desempilhar()
+        return time.perf_counter() - inicio
+    
+    tempo_sem_pool = executar_churn(PilhaEncadeada())
+    pool = PoolNos(limite=64)
+    tempo_com_pool = executar_churn(PilhaEncadeada(pool=pool))
+    
+    print(f"{operacoes} ciclos de empilhar/empilhar/desempilhar/desempilhar:")
+    print(f"Sem pool: {tempo_sem_pool:.3f} segundos")
+    print(f"Com pool: {tempo_com_pool:.3f} segundos")
+    print(f"Taxa de acerto do pool: {pool.taxa_acerto() * 100:.2f}% "
+          f"({pool.acertos} acertos, {pool.falhas} falhas, {pool.descartes} descartes)")
+    
+    print("\nObservações:")
+    print("- Com o pool, os nós desempilhados são reaproveitados nos próximos empilhamentos")
+    print("- O limite do pool controla quanta memória fica reservada após picos de uso")
+
+
+def comparar_construcao_em_lote(tamanho=1000000):
+    """Mede o tempo e as pausas do garbage collector ao construir pilhas encadeadas grandes."""
+    print("\n8. CONSTRUÇÃO EM LOTE E PAUSAS DO GARBAGE COLLECTOR")
+    print("-" * 50)
+    
+    pausas = []
+    
+    def registrar_pausa(fase, info):
+        # Chamado pelo gc no início e no fim de cada coleta
+        if fase == "start":
+            registrar_pausa.inicio = time.perf_counter()
+        else:
+            pausas.append(time.perf_counter() - registrar_pausa.inicio)
+    
+    def medir(operacao):
+        pausas.clear()
+        gc.collect()
+        gc.callbacks.append(registrar_pausa)
+        try:
+            inicio = time.perf_counter()
+            resultado = operacao()
+            tempo = time.perf_counter() - inicio
+        finally:
+            gc.callbacks.remove(registrar_pausa)
+        return resultado, tempo, len(pausas), max(pausas, default=0.0)
+    
+    def construir_um_a_um():
+        pilha = PilhaEncadeada()
+        for i in range(tamanho):
+            pilha.empilhar(i)
+        return pilha
+    
+    def construir_em_lote():
+        return PilhaEncadeada.de_iteravel(range(tamanho))
+    
+    print(f"Construindo pilhas com {tamanho} itens:")
+    pilha, tempo, coletas, maior = medir(construir_um_a_um)
+    print(f"Um a um (empilhar):        {tempo:.3f} s | {coletas} coletas do GC | "
+          f"maior pausa: {maior * 1000:.1f} ms")
+    pilha.limpar()
+    
+    pilha, tempo, coletas, maior = medir(construir_em_lote)
+    print(f"Em lote (de_iteravel):     {tempo:.3f} s | {coletas} coletas do GC | "
+          f"maior pausa: {maior * 1000:.1f} ms")
+    pilha.limpar()
+    
+    print("\nObservações:")
+    print("- Como na ListaEncadeada (exemplo_lista.py), cada nó é um objeto rastreado pelo")
+    print("  GC, e as coletas durante a construção percorrem a cadeia que não para de crescer")
+    print("- estender() suspende o GC durante a construção; a primeira coleta depois disso")
+    print("  ainda percorre os nós novos uma vez")
+
+
 if __name__ == "__main__":
     print("DEMONSTRAÇÃO DE PILHAS EM PYTHON")
     print("=" * 50)
@@ -433,3 +640,5 @@ if __name__ == "__main__":
     aplicacao_verificar_parenteses()
     aplicacao_calculadora()
     simulacao_chamadas_funcao()
+    comparar_pool_nos()
+    comparar_construcao_em_lote()
@@ -0,0 +1,321 @@
+"""
+Exemplo de Pilha com Agregados em O(1) e Fila para Janelas Deslizantes
+
+Este arquivo demonstra:
+1. Uma pilha que guarda, junto de cada item, o agregado (mínimo, máximo, soma ou
+   qualquer operação associativa) de todos os itens daquele nível para baixo
+2. Uma versão especializada que mantém mínimo, máximo e soma ao mesmo tempo
+3. Uma fila feita com duas pilhas agregadas, que responde o agregado dos itens na
+   fila em O(1) amortizado: a base para agregados em janelas deslizantes
+4. Comparação com a varredura de toda a PilhaLista a cada consulta
+
+Com a PilhaLista, saber o mínimo dos itens exige percorrer self.itens: O(n) por
+consulta. Como uma pilha só muda no topo, o agregado de cada nível pode ser
+calculado uma única vez, no momento em que o item é empilhado, e continua válido
+até ele ser desempilhado.
+"""
+
+import random
+import time
+from math import gcd
+from operator import add
+
+from exemplo_pilha import PilhaLista
+
+
+class PilhaAgregada:
+    """
+    Pilha que responde em O(1) o agregado de todos os itens empilhados.
+    'operacao' deve ser associativa, como min, max, soma ou concatenação. Cada item
+    passa por 'mapear' antes de ser agregado (por padrão, o próprio item) e 'neutro'
+    é o valor retornado por agregado() com a pilha vazia.
+    Por padrão, o agregado combina os itens da base para o topo; com do_topo=True,
+    do topo para a base, o que importa para operações não comutativas.
+    """
+    
+    def __init__(self, operacao, neutro=None, mapear=None, do_topo=False):
+        self.operacao = operacao
+        self.neutro = neutro
+        self.mapear = mapear
+        self.do_topo = do_topo
+        self.itens = []
+        self.agregados = []  # agregados[i]: agregado dos itens de 0 até i
+    
+    def esta_vazia(self):
+        """Verifica se a pilha está vazia."""
+        return len(self.itens) == 0
+    
+    def empilhar(self, item):
+        """Adiciona um item ao topo da pilha e calcula o agregado do novo nível."""
+        valor = item if self.mapear is None else self.mapear(item)
+        if self.agregados:
+            if self.do_topo:
+                valor = self.operacao(valor, self.agregados[-1])
+            else:
+                valor = self.operacao(self.agregados[-1], valor)
+        self.itens.append(item)
+        self.agregados.append(valor)
+    
+    def desempilhar(self):
+        """Remove e retorna o item do topo; o agregado do nível de baixo volta a valer."""
+        if self.esta_vazia():
+            raise Exception("Pilha vazia")
+        self.agregados.pop()
+        return self.itens.pop()
+    
+    def topo(self):
+        """Retorna o item do topo sem removê-lo."""
+        if self.esta_vazia():
+            raise Exception("Pilha vazia")
+        return self.itens[-1]
+    
+    def tamanho(self):
+        """Retorna o número de itens na pilha."""
+        return len(self.itens)
+    
+    def agregado(self):
+        """Retorna o agregado de todos os itens da pilha em O(1)."""
+        if not self.agregados:
+            if self.neutro is None:
+                raise Exception("Pilha vazia")
+            return self.neutro
+        return self.agregados[-1]
+
+
+class PilhaMinMaxSoma:
+    """
+    Pilha que mantém mínimo, máximo e soma de cada nível em listas paralelas.
+    Faz o mesmo que três PilhaAgregada, mas sem chamar funções por item empilhado.
+    A soma de cada nível é guardada, e não recalculada ao desempilhar, então não
+    acumula erros de arredondamento com números de ponto flutuante.
+    """
+    
+    def __init__(self):
+        self.itens = []
+        self.minimos = []
+        self.maximos = []
+        self.somas = []
+    
+    def esta_vazia(self):
+        """Verifica se a pilha está vazia."""
+        return len(self.itens) == 0
+    
+    def empilhar(self, item):
+        """Adiciona um item ao topo da pilha."""
+        if self.itens:
+            minimo = self.minimos[-1]
+            maximo = self.maximos[-1]
+            self.minimos.append(item if item < minimo else minimo)
+            self.maximos.append(item if item > maximo else maximo)
+            self.somas.append(self.somas[-1] + item)
+        else:
+            self.minimos.append(item)
+            self.maximos.append(item)
+            self.somas.append(item)
+        self.itens.append(item)
+    
+    def desempilhar(self):
+        """Remove e retorna o item do topo da pilha."""
+        if self.esta_vazia():
+            raise Exception("Pilha vazia")
+        self.minimos.pop()
+        self.maximos.pop()
+        self.somas.pop()
+        return self.itens.pop()
+    
+    def topo(self):
+        """Retorna o item do topo sem removê-lo."""
+        if self.esta_vazia():
+            raise Exception("Pilha vazia")
+        return self.itens[-1]
+    
+    def tamanho(self):
+        """Retorna o número de itens na pilha."""
+        return len(self.itens)
+    
+    def minimo(self):
+        """Retorna o menor item da pilha em O(1)."""
+        if self.esta_vazia():
+            raise Exception("Pilha vazia")
+        return self.minimos[-1]
+    
+    def maximo(self):
+        """Retorna o maior item da pilha em O(1)."""
+        if self.esta_vazia():
+            raise Exception("Pilha vazia")
+        return self.maximos[-1]
+    
+    def soma(self):
+        """Retorna a soma dos itens da pilha em O(1)."""
+        return self.somas[-1] if self.somas else 0
+
+
+class FilaAgregada:
+    """
+    Fila feita com duas PilhaAgregada, com agregado dos itens em O(1) amortizado.
+    Os itens entram na pilha de entrada; quando a pilha de saída esvazia, todos os
+    itens da entrada são transferidos para ela, invertendo a ordem. Cada item é
+    transferido uma única vez, então cada operação custa O(1) amortizado.
+    A pilha de saída agrega do topo para a base, de modo que o agregado da fila
+    respeita a ordem de chegada mesmo em operações não comutativas.
+    """
+    
+    def __init__(self, operacao, neutro=None, mapear=None):
+        self.operacao = operacao
+        self.neutro = neutro
+        self.entrada = PilhaAgregada(operacao, neutro, mapear)
+        self.saida = PilhaAgregada(operacao, neutro, mapear, do_topo=True)
+    
+    def esta_vazia(self):
+        """Verifica se a fila está vazia."""
+        return self.entrada.esta_vazia() and self.saida.esta_vazia()
+    
+    def enfileirar(self, item):
+        """Adiciona um item ao fim da fila."""
+        self.entrada.empilhar(item)
+    
+    def _transferir(self):
+        """Move todos os itens da entrada para a saída, se a saída estiver vazia."""
+        if self.saida.esta_vazia():
+            while not self.entrada.esta_vazia():
+                self.saida.empilhar(self.entrada.desempilhar())
+    
+    def desenfileirar(self):
+        """Remove e retorna o item do início da fila."""
+        if self.esta_vazia():
+            raise Exception("Fila vazia")
+        self._transferir()
+        return self.saida.desempilhar()
+    
+    def frente(self):
+        """Retorna o item do início da fila sem removê-lo."""
+        if self.esta_vazia():
+            raise Exception("Fila vazia")
+        self._transferir()
+        return self.saida.topo()
+    
+    def tamanho(self):
+        """Retorna o número de itens na fila."""
+        return self.entrada.tamanho() + self.saida.tamanho()
+    
+    def agregado(self):
+        """Retorna o agregado dos itens da fila, do mais antigo para o mais novo."""
+        if self.saida.esta_vazia():
+            if self.entrada.esta_vazia() and self.neutro is None:
+                raise Exception("Fila vazia")
+            return self.entrada.agregado()
+        if self.entrada.esta_vazia():
+            return self.saida.agregado()
+        return self.operacao(self.saida.agregado(), self.entrada.agregado())
+
+
+def janela_deslizante(valores, largura, operacao, neutro=None, mapear=None):
+    """
+    Gera o agregado de cada janela de 'largura' valores consecutivos, em O(1)
+    amortizado por janela, independentemente da largura.
+    """
+    if largura < 1:
+        raise ValueError("A largura da janela deve ser pelo menos 1")
+    fila = FilaAgregada(operacao, neutro, mapear)
+    for valor in valores:
+        fila.enfileirar(valor)
+        if fila.tamanho() > largura:
+            fila.desenfileirar()
+        if fila.tamanho() == largura:
+            yield fila.agregado()
+
+
+def demonstrar_pilha_agregada():
+    """Mostra os agregados acompanhando os empilhamentos e desempilhamentos."""
+    print("\n1. PILHA COM MÍNIMO, MÁXIMO E SOMA")
+    print("-" * 50)
+    
+    pilha = PilhaMinMaxSoma()
+    for valor in [5, 3, 8, 1, 9]:
+        pilha.empilhar(valor)
+        print(f"Empilhado {valor}: mínimo={pilha.minimo()}, máximo={pilha.maximo()}, "
+              f"soma={pilha.soma()}")
+    while pilha.tamanho() > 1:
+        valor = pilha.desempilhar()
+        print(f"Desempilhado {valor}: mínimo={pilha.minimo()}, máximo={pilha.maximo()}, "
+              f"soma={pilha.soma()}")
+    
+    print("\nQualquer operação associativa serve, por exemplo o máximo divisor comum:")
+    pilha = PilhaAgregada(gcd, neutro=0)
+    for valor in [84, 126, 210, 35]:
+        pilha.empilhar(valor)
+        print(f"Empilhado {valor}: mdc da pilha = {pilha.agregado()}")
+
+
+def demonstrar_fila_agregada():
+    """Mostra agregados em janelas deslizantes, inclusive com operação não comutativa."""
+    print("\n2. FILA COM DUAS PILHAS E JANELAS DESLIZANTES")
+    print("-" * 50)
+    
+    temperaturas = [21, 23, 19, 25, 30, 28, 22, 20, 26]
+    print(f"Temperaturas: {temperaturas}")
+    print(f"Máxima de cada janela de 3: {list(janela_deslizante(temperaturas, 3, max))}")
+    print(f"Soma de cada janela de 3: {list(janela_deslizante(temperaturas, 3, add, 0))}")
+    
+    # A concatenação não é comutativa: a ordem das letras mostra que o agregado
+    # segue a ordem de chegada, mesmo com os itens divididos entre as duas pilhas
+    print(f"Concatenação em janelas de 3: {list(janela_deslizante('abcdef', 3, add, ''))}")
+
+
+def comparar_desempenho(operacoes=20000, linhas=200000, largura=1000):
+    """Compara consultas de agregado na PilhaLista (varredura) e nas estruturas agregadas."""
+    print("\n3. COMPARAÇÃO DE DESEMPENHO")
+    print("-" * 50)
+    
+    gerador = random.Random(42)
+    sequencia = [gerador.random() for _ in range(operacoes)]
+    
+    # Empilha e desempilha ao acaso, consultando o mínimo a cada passo
+    def executar(pilha, consultar):
+        inicio = time.perf_counter()
+        for valor in sequencia:
+            if valor < 0.6 or pilha.esta_vazia():
+                pilha.empilhar(valor)
+            else:
+                pilha.desempilhar()
+            consultar(pilha)
+        return time.perf_counter() - inicio
+    
+    tempo_lista = executar(PilhaLista(), lambda pilha: min(pilha.itens))
+    tempo_agregada = executar(PilhaMinMaxSoma(), lambda pilha: pilha.minimo())
+    print(f"{operacoes} operações ao acaso com consulta do mínimo a cada passo:")
+    print(f"PilhaLista + min(itens): {tempo_lista:.4f} segundos")
+    print(f"PilhaMinMaxSoma.minimo(): {tempo_agregada:.4f} segundos "
+          f"({tempo_lista / tempo_agregada:.1f}x mais rápido)")
+    
+    valores = [gerador.random() for _ in range(linhas)]
+    inicio = time.perf_counter()
+    ingenuo = [max(valores[i:i + largura]) for i in range(linhas - largura + 1)]
+    tempo_ingenuo = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    com_fila = list(janela_deslizante(valores, largura, max))
+    tempo_fila = time.perf_counter() - inicio
+    
+    print(f"\nMáximo em janelas de {largura} sobre {linhas} valores:")
+    print(f"Recalculando cada janela: {tempo_ingenuo:.4f} segundos")
+    print(f"FilaAgregada: {tempo_fila:.4f} segundos "
+          f"({tempo_ingenuo / tempo_fila:.1f}x mais rápido)")
+    print(f"Resultados iguais: {ingenuo == com_fila}")
+    
+    print("\nObservações:")
+    print("- A consulta na PilhaLista fica mais lenta à medida que a pilha cresce;")
+    print("  na pilha agregada, o custo não depende do tamanho")
+    print("- A pilha agregada guarda um valor extra por nível para cada agregado")
+    print("- O custo da FilaAgregada não depende da largura da janela, mas cada item")
+    print("  passa por duas pilhas em Python; com janelas de poucas dezenas de itens,")
+    print("  recalcular cada janela com max(), implementado em C, ainda é mais rápido")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE PILHA COM AGREGADOS")
+    print("=" * 50)
+    
+    demonstrar_pilha_agregada()
+    demonstrar_fila_agregada()
+    comparar_desempenho()
@@ -0,0 +1,339 @@
+"""
+Exemplo de Pilha Concorrente (Segura para Várias Threads)
+
+A PilhaLista e a PilhaEncadeada não protegem o seu estado: duas threads que
+desempilham ao mesmo tempo podem ver a pilha com um item e as duas tentarem
+removê-lo. Este arquivo demonstra:
+1. Uma pilha protegida por uma trava (lock), com desempilhar bloqueante (espera
+   até haver um item, com tempo limite opcional) e não bloqueante
+2. Operações em lote, que empilham ou desempilham vários itens com uma única
+   aquisição da trava
+3. Um array de eliminação: quando a trava está ocupada, um empilhamento e um
+   desempilhamento simultâneos podem se encontrar em uma posição do array e trocar
+   o item diretamente, sem tocar no topo compartilhado
+4. Uma pilha de tarefas (LIFO) compartilhada por várias threads trabalhadoras
+5. Um teste de contenção de 1 a N threads, indicando se o Python em uso tem o GIL
+"""
+
+import os
+import random
+import sys
+import sysconfig
+import threading
+import time
+from queue import LifoQueue
+
+
+VAZIO, OFERTA, ACEITA = 0, 1, 2
+
+
+class PilhaConcorrente:
+    """
+    Pilha segura para várias threads, baseada em uma lista protegida por uma trava.
+    Uma Condition associada à mesma trava acorda as threads que esperam um item.
+    """
+    
+    def __init__(self):
+        self.itens = []
+        self._trava = threading.Lock()
+        self._tem_itens = threading.Condition(self._trava)
+    
+    def esta_vazia(self):
+        """Verifica se a pilha está vazia (o resultado pode mudar logo em seguida)."""
+        with self._trava:
+            return len(self.itens) == 0
+    
+    def tamanho(self):
+        """Retorna o número de itens na pilha (o resultado pode mudar logo em seguida)."""
+        with self._trava:
+            return len(self.itens)
+    
+    def topo(self):
+        """Retorna o item do topo sem removê-lo."""
+        with self._trava:
+            if not self.itens:
+                raise Exception("Pilha vazia")
+            return self.itens[-1]
+    
+    def empilhar(self, item):
+        """Adiciona um item ao topo da pilha e acorda uma thread que esteja esperando."""
+        with self._trava:
+            self.itens.append(item)
+            self._tem_itens.notify()
+    
+    def empilhar_muitos(self, itens):
+        """Empilha todos os itens com uma única aquisição da trava (o último fica no topo)."""
+        itens = list(itens)
+        with self._trava:
+            self.itens.extend(itens)
+            self._tem_itens.notify(len(itens))
+    
+    def _esperar_itens(self, bloquear, timeout):
+        """Com a trava adquirida, espera haver itens ou levanta 'Pilha vazia'."""
+        if not self.itens:
+            if not bloquear or not self._tem_itens.wait_for(lambda: self.itens, timeout):
+                raise Exception("Pilha vazia")
+    
+    def desempilhar(self, bloquear=True, timeout=None):
+        """
+        Remove e retorna o item do topo da pilha.
+        Com bloquear=True, espera até haver um item (no máximo 'timeout' segundos,
+        se informado); com bloquear=False, levanta a exceção imediatamente.
+        """
+        with self._trava:
+            self._esperar_itens(bloquear, timeout)
+            return self.itens.pop()
+    
+    def desempilhar_muitos(self, quantidade, bloquear=True, timeout=None):
+        """
+        Remove até 'quantidade' itens do topo com uma única aquisição da trava e os
+        retorna em uma lista, na ordem em que foram empilhados. Espera como
+        desempilhar apenas se a pilha estiver vazia.
+        """
+        if quantidade < 1:
+            raise ValueError("A quantidade deve ser pelo menos 1")
+        with self._trava:
+            self._esperar_itens(bloquear, timeout)
+            removidos = self.itens[-quantidade:]
+            del self.itens[-quantidade:]
+            return removidos
+
+
+class Troca:
+    """Posição do array de eliminação, onde um empilhamento oferece o seu item."""
+    
+    def __init__(self):
+        self.trava = threading.Lock()
+        self.estado = VAZIO
+        self.item = None
+        self.aceita = None  # threading.Event da oferta atual
+        self.eliminacoes = 0  # Pares que se encontraram nesta posição
+
+
+class PilhaEliminacao(PilhaConcorrente):
+    """
+    PilhaConcorrente com array de eliminação (elimination backoff).
+    Empilhar e desempilhar primeiro tentam adquirir a trava sem esperar. Se ela
+    estiver ocupada, empilhar oferece o item em uma posição sorteada do array e
+    espera 'espera' segundos por um desempilhamento; desempilhar procura uma oferta
+    em uma posição sorteada. Um par que se encontra se cancela: o item passa de
+    uma thread para a outra e a pilha compartilhada nem é tocada. Sem encontro,
+    as duas operações voltam para a trava.
+    """
+    
+    def __init__(self, posicoes=4, espera=0.0005):
+        super().__init__()
+        self.trocas = [Troca() for _ in range(posicoes)]
+        self.espera = espera
+    
+    def _oferecer(self, item):
+        """Oferece o item no array de eliminação; retorna True se alguém o aceitou."""
+        troca = random.choice(self.trocas)
+        with troca.trava:
+            if troca.estado != VAZIO:
+                return False
+            troca.estado = OFERTA
+            troca.item = item
+            troca.aceita = aceita = threading.Event()
+        aceita.wait(self.espera)
+        with troca.trava:
+            # A aceitação pode ter acontecido logo depois do fim da espera
+            aceito = troca.estado == ACEITA
+            troca.estado = VAZIO
+            troca.item = None
+            return aceito
+    
+    def _aceitar(self):
+        """Procura uma oferta no array de eliminação; retorna (encontrou, item)."""
+        troca = random.choice(self.trocas)
+        with troca.trava:
+            if troca.estado != OFERTA:
+                return False, None
+            item = troca.item
+            troca.estado = ACEITA
+            troca.aceita.set()
+            troca.eliminacoes += 1
+            return True, item
+    
+    def eliminacoes(self):
+        """Retorna quantos pares empilhar/desempilhar se cancelaram no array."""
+        return sum(troca.eliminacoes for troca in self.trocas)
+    
+    def empilhar(self, item):
+        """Adiciona um item ao topo, ou o entrega direto a um desempilhamento simultâneo."""
+        if self._trava.acquire(blocking=False):
+            try:
+                self.itens.append(item)
+                self._tem_itens.notify()
+            finally:
+                self._trava.release()
+            return
+        if not self._oferecer(item):
+            super().empilhar(item)
+    
+    def desempilhar(self, bloquear=True, timeout=None):
+        """Remove e retorna o item do topo, ou recebe um item de um empilhamento simultâneo."""
+        if self._trava.acquire(blocking=False):
+            try:
+                if self.itens:
+                    return self.itens.pop()
+            finally:
+                self._trava.release()
+        else:
+            encontrou, item = self._aceitar()
+            if encontrou:
+                return item
+        return super().desempilhar(bloquear, timeout)
+
+
+def gil_desativado():
+    """Indica se o interpretador em uso roda sem o GIL (build free-threaded, 3.13+)."""
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return False
+    return not sys._is_gil_enabled()
+
+
+def demonstrar_pilha_tarefas(trabalhadoras=4, tarefas=20):
+    """Várias threads consomem tarefas de uma pilha compartilhada (ordem LIFO)."""
+    print("\n1. PILHA DE TAREFAS COMPARTILHADA")
+    print("-" * 50)
+    
+    pilha = PilhaConcorrente()
+    resultados = []
+    trava_resultados = threading.Lock()
+    pendentes = tarefas
+    
+    def trabalhar(nome):
+        nonlocal pendentes
+        while True:
+            tarefa = pilha.desempilhar()  # Espera até haver uma tarefa
+            if tarefa is None:  # Sinal de parada
+                return
+            with trava_resultados:
+                resultados.append((nome, tarefa, tarefa * tarefa))
+                pendentes -= 1
+                ultima = pendentes == 0
+            if ultima:
+                # Na pilha, um sinal de parada empilhado antes do fim ficaria acima das
+                # tarefas restantes; por isso ele só entra quando todas foram concluídas
+                pilha.empilhar_muitos([None] * trabalhadoras)
+    
+    threads = [threading.Thread(target=trabalhar, args=(f"T{i}",)) for i in range(trabalhadoras)]
+    for thread in threads:
+        thread.start()
+    
+    if tarefas == 0:
+        pilha.empilhar_muitos([None] * trabalhadoras)
+    pilha.empilhar_muitos(range(tarefas))
+    print(f"{tarefas} tarefas empilhadas de uma vez para {trabalhadoras} threads")
+    for thread in threads:
+        thread.join()
+    
+    print(f"Tarefas processadas: {len(resultados)}")
+    print(f"Primeiras processadas (as últimas empilhadas): "
+          f"{[tarefa for _, tarefa, _ in resultados[:5]]}")
+    por_thread = {}
+    for nome, _, _ in resultados:
+        por_thread[nome] = por_thread.get(nome, 0) + 1
+    print(f"Tarefas por thread: {por_thread}")
+    
+    vazia = PilhaConcorrente()
+    try:
+        vazia.desempilhar(bloquear=False)
+    except Exception as erro:
+        print(f"\ndesempilhar(bloquear=False) na pilha vazia: {erro}")
+    inicio = time.perf_counter()
+    try:
+        vazia.desempilhar(timeout=0.1)
+    except Exception as erro:
+        print(f"desempilhar(timeout=0.1): {erro} após {time.perf_counter() - inicio:.2f} s")
+    
+    lote = PilhaConcorrente()
+    lote.empilhar_muitos("abcdef")
+    print(f"desempilhar_muitos(4) de 'abcdef': {lote.desempilhar_muitos(4)} | "
+          f"restam {lote.tamanho()}")
+
+
+class _PilhaLifoQueue(LifoQueue):
+    """LifoQueue da biblioteca padrão com os nomes de métodos das pilhas do repositório."""
+    
+    empilhar = LifoQueue.put
+    desempilhar = LifoQueue.get
+
+
+def teste_contencao(operacoes=200000, maximo_threads=None):
+    """
+    Divide um total fixo de pares empilhar/desempilhar entre 1 a N threads e mede
+    a vazão de cada implementação.
+    """
+    print("\n2. TESTE DE CONTENÇÃO")
+    print("-" * 50)
+    
+    maximo_threads = maximo_threads or max(4, os.cpu_count() or 1)
+    print(f"Python {sys.version.split()[0]} | núcleos: {os.cpu_count()} | "
+          f"GIL desativado: {gil_desativado()}")
+    
+    estruturas = {
+        "PilhaConcorrente": PilhaConcorrente,
+        "PilhaEliminacao": PilhaEliminacao,
+        "queue.LifoQueue": _PilhaLifoQueue,
+    }
+    quantidades = []
+    threads = 1
+    while threads < maximo_threads:
+        quantidades.append(threads)
+        threads *= 2
+    quantidades.append(maximo_threads)
+    
+    print(f"{operacoes} pares empilhar/desempilhar divididos entre as threads "
+          f"(milhares de operações por segundo):")
+    print(f"{'Threads':>8} | " + " | ".join(f"{nome:>16}" for nome in estruturas))
+    eliminacoes = {}
+    for quantidade in quantidades:
+        celulas = []
+        for nome, construir in estruturas.items():
+            pilha = construir()
+            por_thread = operacoes // quantidade
+            largada = threading.Barrier(quantidade + 1)
+            
+            def trabalhar():
+                empilhar = pilha.empilhar
+                desempilhar = pilha.desempilhar
+                largada.wait()
+                for i in range(por_thread):
+                    empilhar(i)
+                    desempilhar()
+            
+            grupo = [threading.Thread(target=trabalhar) for _ in range(quantidade)]
+            for thread in grupo:
+                thread.start()
+            largada.wait()
+            inicio = time.perf_counter()
+            for thread in grupo:
+                thread.join()
+            tempo = time.perf_counter() - inicio
+            celulas.append(f"{2 * por_thread * quantidade / tempo / 1000:>16.0f}")
+            if isinstance(pilha, PilhaEliminacao):
+                eliminacoes[quantidade] = pilha.eliminacoes()
+        print(f"{quantidade:>8} | " + " | ".join(celulas))
+    
+    print(f"\nPares eliminados no array (por número de threads): {eliminacoes}")
+    
+    print("\nObservações:")
+    print("- Com o GIL, só uma thread executa código Python por vez: a vazão não cresce")
+    print("  com o número de threads, e a trava raramente está ocupada quando uma thread")
+    print("  tenta adquiri-la, então o array de eliminação quase não é usado")
+    print("- O array de eliminação foi pensado para muitos núcleos disputando o topo ao")
+    print("  mesmo tempo, como em um build free-threaded; com o GIL, a diferença entre")
+    print("  PilhaConcorrente e PilhaEliminacao fica dentro da variação entre execuções")
+    print("- A queue.LifoQueue é mais lenta porque também controla capacidade máxima e")
+    print("  tarefas pendentes (task_done/join) a cada operação")
+    print("- As operações em lote dividem o custo de uma aquisição da trava entre vários itens")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE PILHA CONCORRENTE")
+    print("=" * 50)
+    
+    demonstrar_pilha_tarefas()
+    teste_contencao()
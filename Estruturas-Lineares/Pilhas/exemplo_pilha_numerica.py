@@ -0,0 +1,293 @@
+"""
+Exemplo de Pilha Numérica Tipada com array.array
+
+Este arquivo demonstra:
+1. Uma pilha de números guardados diretamente em um array.array ('d' para float,
+   'q' para inteiros de 64 bits), com capacidade pré-alocada
+2. Operações em lote (empilhar_muitos e desempilhar_muitos) que copiam blocos
+   inteiros de memória de uma vez
+3. Acesso ao conteúdo pelo protocolo de buffer (memoryview), o que permite ao
+   NumPy enxergar a pilha sem copiar os dados
+4. Comparação de memória e de tempo com a PilhaLista
+
+Em uma lista Python, cada número é um objeto separado (24 bytes para um float,
+28 ou mais para um int), e a lista guarda uma referência de 8 bytes para cada um.
+No array.array, cada número ocupa só os seus 8 bytes, lado a lado na memória.
+"""
+
+import time
+import tracemalloc
+from array import array
+
+import numpy as np
+
+from exemplo_pilha import PilhaLista
+
+
+TIPOS_NUMERICOS = "bBhHiIlLqQfd"
+
+
+class PilhaNumerica:
+    """
+    Pilha de números de um único tipo, guardados em um array.array.
+    O array é alocado com 'capacidade' posições e só é substituído por um maior
+    (com o dobro do tamanho) quando enche; as posições acima do topo ficam
+    reservadas para os próximos empilhamentos.
+    """
+    
+    def __init__(self, tipo="d", capacidade=1024):
+        if tipo not in TIPOS_NUMERICOS:
+            raise ValueError(f"Tipo numérico inválido: {tipo!r}")
+        if capacidade < 1:
+            raise ValueError("A capacidade deve ser pelo menos 1")
+        self.tipo = tipo
+        self._dados = array(tipo, bytes(capacidade * array(tipo).itemsize))
+        self._tamanho = 0
+    
+    def esta_vazia(self):
+        """Verifica se a pilha está vazia."""
+        return self._tamanho == 0
+    
+    def capacidade(self):
+        """Retorna quantos números cabem no array atual sem realocação."""
+        return len(self._dados)
+    
+    def _garantir_capacidade(self, necessaria):
+        """
+        Troca o array por um novo, com pelo menos 'necessaria' posições.
+        Um array novo é criado em vez de redimensionar o atual porque um array com
+        memoryview ativa não pode mudar de tamanho; as visões antigas continuam
+        válidas, mas deixam de acompanhar a pilha.
+        """
+        capacidade = len(self._dados)
+        if necessaria <= capacidade:
+            return
+        while capacidade < necessaria:
+            capacidade *= 2
+        novo = array(self.tipo, bytes(capacidade * self._dados.itemsize))
+        novo[:self._tamanho] = self._dados[:self._tamanho]
+        self._dados = novo
+    
+    def empilhar(self, valor):
+        """Adiciona um número ao topo da pilha."""
+        tamanho = self._tamanho
+        if tamanho == len(self._dados):
+            self._garantir_capacidade(tamanho + 1)
+        self._dados[tamanho] = valor
+        self._tamanho = tamanho + 1
+    
+    def desempilhar(self):
+        """Remove e retorna o número do topo da pilha."""
+        if self._tamanho == 0:
+            raise Exception("Pilha vazia")
+        self._tamanho -= 1
+        return self._dados[self._tamanho]
+    
+    def topo(self):
+        """Retorna o número do topo sem removê-lo."""
+        if self._tamanho == 0:
+            raise Exception("Pilha vazia")
+        return self._dados[self._tamanho - 1]
+    
+    def tamanho(self):
+        """Retorna o número de itens na pilha."""
+        return self._tamanho
+    
+    def empilhar_muitos(self, valores):
+        """
+        Empilha todos os valores, o último ficando no topo.
+        Se 'valores' for um array.array do mesmo tipo, a cópia é feita de uma vez,
+        bloco a bloco de memória; outros iteráveis são convertidos antes.
+        """
+        if not isinstance(valores, array) or valores.typecode != self.tipo:
+            valores = array(self.tipo, valores)
+        quantidade = len(valores)
+        self._garantir_capacidade(self._tamanho + quantidade)
+        self._dados[self._tamanho:self._tamanho + quantidade] = valores
+        self._tamanho += quantidade
+    
+    def desempilhar_muitos(self, quantidade):
+        """
+        Remove os 'quantidade' números do topo e os retorna em um array.array, na
+        ordem em que foram empilhados: empilhar_muitos com o resultado desfaz a remoção.
+        """
+        if quantidade < 0 or quantidade > self._tamanho:
+            raise IndexError("Quantidade inválida")
+        inicio = self._tamanho - quantidade
+        removidos = self._dados[inicio:self._tamanho]
+        self._tamanho = inicio
+        return removidos
+    
+    def memoria(self):
+        """
+        Retorna uma memoryview dos números da pilha (da base para o topo), sem cópia.
+        A visão enxerga os dados atuais do array: alterações feitas por ela mudam a
+        pilha, e ela continua válida até a próxima realocação.
+        A memoryview informa o formato dos itens, então np.asarray(pilha.memoria())
+        cria um array NumPy do tipo certo sem copiar. np.frombuffer ignora esse
+        formato e assume float64, a menos que o dtype seja passado.
+        """
+        return memoryview(self._dados)[:self._tamanho]
+    
+    def __buffer__(self, flags):
+        """Protocolo de buffer (Python 3.12+): permite memoryview(pilha) e np.asarray(pilha)."""
+        return self.memoria()
+
+
+def demonstrar_pilha_numerica():
+    """Demonstra as operações individuais, em lote e a visão pelo NumPy."""
+    print("\n1. PILHA NUMÉRICA")
+    print("-" * 50)
+    
+    pilha = PilhaNumerica("d", capacidade=4)
+    for valor in [1.5, 2.5, 3.5]:
+        pilha.empilhar(valor)
+    print(f"Empilhados 1.5, 2.5 e 3.5 | topo: {pilha.topo()} | "
+          f"capacidade: {pilha.capacidade()}")
+    
+    pilha.empilhar_muitos([4.0, 5.0, 6.0])
+    print(f"empilhar_muitos([4.0, 5.0, 6.0]) | tamanho: {pilha.tamanho()} | "
+          f"capacidade: {pilha.capacidade()}")
+    
+    visao = np.asarray(pilha.memoria())
+    print(f"Visão NumPy sem cópia: {visao} | soma: {visao.sum()}")
+    visao[0] = 100.0
+    print(f"Alterando a visão, a base da pilha muda: {pilha.memoria()[0]}")
+    
+    removidos = pilha.desempilhar_muitos(2)
+    print(f"desempilhar_muitos(2): {removidos.tolist()} | topo: {pilha.topo()}")
+    print(f"desempilhar(): {pilha.desempilhar()} | tamanho: {pilha.tamanho()}")
+    
+    inteiros = PilhaNumerica("q")
+    inteiros.empilhar_muitos(range(5))
+    print(f"Pilha de inteiros ('q'): {inteiros.memoria().tolist()} | "
+          f"np.asarray: dtype {np.asarray(inteiros.memoria()).dtype}")
+    try:
+        inteiros.empilhar(2 ** 63)
+    except OverflowError as erro:
+        print(f"Empilhar 2^63 em 'q': OverflowError ({erro})")
+
+
+def avaliar_posfixa_numerica(tokens):
+    """
+    Variante de avaliar_posfixa (exemplo_pilha.py) que recebe uma lista de tokens
+    já separados e usa uma PilhaNumerica de floats no lugar de uma lista.
+    """
+    pilha = PilhaNumerica("d", capacidade=64)
+    for token in tokens:
+        if token in ('+', '-', '*', '/', '^'):
+            if pilha.tamanho() < 2:
+                raise ValueError("Expressão inválida")
+            b = pilha.desempilhar()
+            a = pilha.desempilhar()
+            if token == '+':
+                pilha.empilhar(a + b)
+            elif token == '-':
+                pilha.empilhar(a - b)
+            elif token == '*':
+                pilha.empilhar(a * b)
+            elif token == '/':
+                pilha.empilhar(a / b)
+            else:
+                pilha.empilhar(a ** b)
+        else:
+            pilha.empilhar(float(token))
+    if pilha.tamanho() != 1:
+        raise ValueError("Expressão inválida")
+    return pilha.desempilhar()
+
+
+def comparar_desempenho(quantidade=1000000):
+    """Compara memória, transferência em lote e operações individuais com a PilhaLista."""
+    print("\n2. COMPARAÇÃO COM A PILHALISTA")
+    print("-" * 50)
+    
+    origem_lista = [i * 0.5 for i in range(quantidade)]
+    origem_array = array("d", origem_lista)
+    
+    # Memória para guardar os números (na lista, os floats são objetos separados)
+    tracemalloc.start()
+    pilha_lista = PilhaLista()
+    pilha_lista.itens.extend(i * 0.5 for i in range(quantidade))
+    memoria_lista = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del pilha_lista
+    
+    tracemalloc.start()
+    pilha_numerica = PilhaNumerica("d", capacidade=quantidade)
+    pilha_numerica.empilhar_muitos(origem_array)
+    memoria_numerica = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del pilha_numerica
+    
+    print(f"Memória para {quantidade} floats:")
+    print(f"{'PilhaLista':>15}: {memoria_lista / 1024 / 1024:.1f} MB")
+    print(f"{'PilhaNumerica':>15}: {memoria_numerica / 1024 / 1024:.1f} MB")
+    
+    def medir(funcao, repeticoes=5):
+        melhor = float("inf")
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao()
+            melhor = min(melhor, time.perf_counter() - inicio)
+        return melhor
+    
+    def lote_lista():
+        pilha = PilhaLista()
+        pilha.itens.extend(origem_lista)
+        removidos = pilha.itens[-quantidade // 2:]
+        del pilha.itens[-quantidade // 2:]
+        return removidos
+    
+    def lote_numerica():
+        pilha = PilhaNumerica("d")
+        pilha.empilhar_muitos(origem_array)
+        return pilha.desempilhar_muitos(quantidade // 2)
+    
+    def individual_lista():
+        pilha = PilhaLista()
+        for valor in origem_lista:
+            pilha.empilhar(valor)
+        while not pilha.esta_vazia():
+            pilha.desempilhar()
+    
+    def individual_numerica():
+        pilha = PilhaNumerica("d")
+        for valor in origem_lista:
+            pilha.empilhar(valor)
+        while not pilha.esta_vazia():
+            pilha.desempilhar()
+    
+    print(f"\nEmpilhar {quantidade} e desempilhar metade em lote:")
+    print(f"{'PilhaLista':>15}: {medir(lote_lista):.4f} segundos (extend e fatia)")
+    print(f"{'PilhaNumerica':>15}: {medir(lote_numerica):.4f} segundos")
+    
+    print(f"\nEmpilhar e desempilhar {quantidade} um a um:")
+    print(f"{'PilhaLista':>15}: {medir(individual_lista, 1):.4f} segundos")
+    print(f"{'PilhaNumerica':>15}: {medir(individual_numerica, 1):.4f} segundos")
+    
+    pilha_numerica = PilhaNumerica("d")
+    pilha_numerica.empilhar_muitos(origem_array)
+    tempo_lista = medir(lambda: np.asarray(origem_lista).sum())
+    tempo_visao = medir(lambda: np.asarray(pilha_numerica.memoria()).sum())
+    print("\nSoma com NumPy de todos os itens da pilha:")
+    print(f"{'PilhaLista':>15}: {tempo_lista:.4f} segundos (np.asarray copia e desembrulha)")
+    print(f"{'PilhaNumerica':>15}: {tempo_visao:.4f} segundos (np.asarray da memoryview, sem cópia)")
+    
+    tokens = "3 4 + 2 * 7 /".split()
+    print(f"\navaliar_posfixa_numerica({' '.join(tokens)}) = {avaliar_posfixa_numerica(tokens)}")
+    
+    print("\nObservações:")
+    print("- Os números ocupam 8 bytes cada, sem um objeto Python por valor")
+    print("- As operações em lote e a visão pelo NumPy copiam ou leem blocos de memória")
+    print("  contínuos, sem passar pelos valores um a um")
+    print("- Um a um, a PilhaNumerica é mais lenta: cada valor lido do array vira um")
+    print("  objeto Python novo, e append/pop da lista são implementados em C")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE PILHA NUMÉRICA")
+    print("=" * 50)
+    
+    demonstrar_pilha_numerica()
+    comparar_desempenho()
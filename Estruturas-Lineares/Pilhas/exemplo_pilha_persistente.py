@@ -0,0 +1,248 @@
+"""
+Exemplo de Pilha Persistente (Imutável) com Compartilhamento de Estrutura
+
+Este arquivo demonstra:
+1. Uma pilha imutável: empilhar e desempilhar retornam uma nova versão da pilha
+   e a versão antiga continua válida
+2. Compartilhamento de estrutura: a nova versão reaproveita todos os nós da antiga,
+   então guardar uma cópia (snapshot) de qualquer versão custa O(1)
+3. Um histórico de desfazer (undo) em que cada versão da pilha é um snapshot
+4. Comparação com a cópia de PilhaLista.itens a cada snapshot
+
+Com a PilhaLista, guardar o estado da pilha exige copiar self.itens: O(n) em tempo
+e em memória por snapshot. Na pilha persistente, os nós nunca são alterados depois
+de criados, então várias versões podem apontar para os mesmos nós com segurança.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from exemplo_pilha import PilhaLista, gc_suspenso
+
+
+class PilhaPersistente:
+    """
+    Pilha imutável baseada em lista encadeada.
+    Cada nó é uma tupla (valor, nó de baixo, tamanho até aqui), e cada versão da
+    pilha guarda apenas uma referência ao nó do topo.
+    """
+    
+    def __init__(self, no=None):
+        self._no = no
+    
+    def esta_vazia(self):
+        """Verifica se a pilha está vazia."""
+        return self._no is None
+    
+    def empilhar(self, item):
+        """Retorna uma nova pilha com o item no topo. A pilha atual não muda. O(1)."""
+        no = self._no
+        return PilhaPersistente((item, no, 1 if no is None else no[2] + 1))
+    
+    def desempilhar(self):
+        """Retorna uma nova pilha sem o item do topo. A pilha atual não muda. O(1)."""
+        if self._no is None:
+            raise Exception("Pilha vazia")
+        return PilhaPersistente(self._no[1])
+    
+    def topo(self):
+        """Retorna o item do topo."""
+        if self._no is None:
+            raise Exception("Pilha vazia")
+        return self._no[0]
+    
+    def tamanho(self):
+        """Retorna o número de itens na pilha. O(1), pois cada nó guarda o tamanho."""
+        return 0 if self._no is None else self._no[2]
+    
+    def compartilha_com(self, outra):
+        """Retorna quantos nós da base as duas versões têm em comum (os mesmos objetos)."""
+        a, b = self._no, outra._no
+        tamanho_a, tamanho_b = self.tamanho(), outra.tamanho()
+        while tamanho_a > tamanho_b:
+            a = a[1]
+            tamanho_a -= 1
+        while tamanho_b > tamanho_a:
+            b = b[1]
+            tamanho_b -= 1
+        while a is not b:
+            a, b = a[1], b[1]
+            tamanho_a -= 1
+        return tamanho_a
+    
+    def __iter__(self):
+        """Percorre os itens do topo para a base."""
+        no = self._no
+        while no is not None:
+            yield no[0]
+            no = no[1]
+    
+    @classmethod
+    def de_iteravel(cls, iteravel):
+        """Constrói uma pilha empilhando os itens do iterável (o último fica no topo)."""
+        no = None
+        tamanho = 0
+        for item in iteravel:
+            tamanho += 1
+            no = (item, no, tamanho)
+        return cls(no)
+
+
+class HistoricoDesfazer:
+    """
+    Histórico de versões de uma PilhaPersistente para desfazer e refazer operações.
+    Cada versão guardada é um snapshot completo, mas custa apenas uma referência.
+    """
+    
+    def __init__(self, pilha=None):
+        self.versoes = [pilha if pilha is not None else PilhaPersistente()]
+        self.atual = 0
+    
+    def pilha(self):
+        """Retorna a versão atual da pilha."""
+        return self.versoes[self.atual]
+    
+    def registrar(self, nova):
+        """Registra uma nova versão; as versões que poderiam ser refeitas são descartadas."""
+        del self.versoes[self.atual + 1:]
+        self.versoes.append(nova)
+        self.atual += 1
+    
+    def desfazer(self):
+        """Volta para a versão anterior."""
+        if self.atual == 0:
+            raise Exception("Nada para desfazer")
+        self.atual -= 1
+        return self.pilha()
+    
+    def refazer(self):
+        """Avança para a versão seguinte, se ela não tiver sido descartada."""
+        if self.atual == len(self.versoes) - 1:
+            raise Exception("Nada para refazer")
+        self.atual += 1
+        return self.pilha()
+
+
+def demonstrar_pilha_persistente():
+    """Mostra que as versões antigas continuam válidas e compartilham seus nós."""
+    print("\n1. PILHA PERSISTENTE")
+    print("-" * 50)
+    
+    base = PilhaPersistente.de_iteravel([1, 2, 3])
+    com_quatro = base.empilhar(4)
+    com_cinco = base.empilhar(5)
+    sem_topo = base.desempilhar()
+    
+    print(f"base:          {list(base)} (topo à esquerda)")
+    print(f"base + 4:      {list(com_quatro)}")
+    print(f"base + 5:      {list(com_cinco)}")
+    print(f"base - topo:   {list(sem_topo)}")
+    print(f"'base + 4' e 'base + 5' compartilham {com_quatro.compartilha_com(com_cinco)} nós")
+    print(f"'base + 4' e 'base - topo' compartilham {com_quatro.compartilha_com(sem_topo)} nós")
+
+
+def demonstrar_desfazer():
+    """Usa o histórico de versões como pilha de chamadas com desfazer e refazer."""
+    print("\n2. DESFAZER E REFAZER")
+    print("-" * 50)
+    
+    historico = HistoricoDesfazer()
+    for chamada in ["main", "fatorial(3)", "fatorial(2)", "fatorial(1)"]:
+        historico.registrar(historico.pilha().empilhar(chamada))
+        print(f"Chamada {chamada:<12} -> pilha: {list(historico.pilha())}")
+    
+    historico.registrar(historico.pilha().desempilhar())
+    print(f"Retorno              -> pilha: {list(historico.pilha())}")
+    
+    historico.desfazer()
+    print(f"Desfazer             -> pilha: {list(historico.pilha())}")
+    historico.desfazer()
+    print(f"Desfazer             -> pilha: {list(historico.pilha())}")
+    historico.refazer()
+    print(f"Refazer              -> pilha: {list(historico.pilha())}")
+    print(f"Versões guardadas: {len(historico.versoes)}")
+
+
+def _gerar_operacoes(quantidade, profundidade, semente=42):
+    """Sequência de empilhar (True) e desempilhar (False) oscilando em torno da profundidade."""
+    gerador = random.Random(semente)
+    operacoes = []
+    tamanho = 0
+    for _ in range(quantidade):
+        chance = 0.6 if tamanho < profundidade else 0.4
+        empilhar = tamanho == 0 or gerador.random() < chance
+        operacoes.append(empilhar)
+        tamanho += 1 if empilhar else -1
+    return operacoes
+
+
+def comparar_snapshots(quantidade=1000000, profundidade=1000):
+    """Guarda um snapshot após cada operação: pilha persistente x cópia da lista."""
+    print("\n3. UM SNAPSHOT POR OPERAÇÃO")
+    print("-" * 50)
+    
+    operacoes = _gerar_operacoes(quantidade, profundidade)
+    
+    # Pilha persistente: cada snapshot é a própria versão, guardada em uma lista
+    with gc_suspenso():
+        inicio = time.perf_counter()
+        pilha = PilhaPersistente()
+        snapshots = []
+        guardar = snapshots.append
+        for i, empilhar in enumerate(operacoes):
+            pilha = pilha.empilhar(i) if empilhar else pilha.desempilhar()
+            guardar(pilha)
+        tempo_persistente = time.perf_counter() - inicio
+    del snapshots, pilha
+    
+    tracemalloc.start()
+    pilha = PilhaPersistente()
+    snapshots = []
+    for i, empilhar in enumerate(operacoes):
+        pilha = pilha.empilhar(i) if empilhar else pilha.desempilhar()
+        snapshots.append(pilha)
+    memoria_persistente = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del snapshots, pilha
+    
+    # PilhaLista: cada snapshot é uma cópia de itens. Guardar todas as cópias não
+    # caberia na memória, então elas são descartadas e o espaço que ocupariam é somado
+    with gc_suspenso():
+        inicio = time.perf_counter()
+        pilha = PilhaLista()
+        memoria_copias = 0
+        for i, empilhar in enumerate(operacoes):
+            if empilhar:
+                pilha.empilhar(i)
+            else:
+                pilha.desempilhar()
+            copia = pilha.itens.copy()
+            memoria_copias += sys.getsizeof(copia)
+        tempo_copia = time.perf_counter() - inicio
+    
+    print(f"{quantidade} operações, com a pilha oscilando em torno de {profundidade} itens:")
+    print(f"{'PilhaPersistente':>26}: {tempo_persistente:.3f} segundos | "
+          f"{memoria_persistente / 1024 / 1024:.1f} MB para guardar todos os snapshots")
+    print(f"{'PilhaLista + cópia':>26}: {tempo_copia:.3f} segundos | "
+          f"{memoria_copias / 1024 / 1024 / 1024:.1f} GB para guardar todos os snapshots "
+          f"(estimado)")
+    print(f"Tempo: {tempo_copia / tempo_persistente:.1f}x menor | Memória: "
+          f"{memoria_copias / memoria_persistente:.0f}x menor")
+    
+    print("\nObservações:")
+    print("- Na pilha persistente, cada operação cria no máximo um nó e um objeto de versão,")
+    print("  não importa quantas versões existam nem o tamanho da pilha")
+    print("- A cópia da lista custa proporcionalmente ao tamanho da pilha; com poucas")
+    print("  dezenas de itens, copiar pode ser tão rápido quanto criar a nova versão")
+    print("- Sem snapshots, a PilhaLista continua mais rápida: append e pop não alocam objetos")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE PILHA PERSISTENTE")
+    print("=" * 50)
+    
+    demonstrar_pilha_persistente()
+    demonstrar_desfazer()
+    comparar_snapshots()
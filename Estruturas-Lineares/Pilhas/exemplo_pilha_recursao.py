@@ -0,0 +1,327 @@
+"""
+Exemplo de Motor de Recursão com Pilha Explícita (Trampolim)
+
+simulacao_chamadas_funcao (exemplo_pilha.py) mostra como a pilha de chamadas
+funciona. Este arquivo usa a mesma ideia para executar funções recursivas de
+verdade:
+1. A função recursiva é escrita como um gerador: em vez de chamar a si mesma, ela
+   entrega (yield) a chamada ao motor e recebe o resultado de volta
+2. O motor guarda os quadros (frames) em uma pilha deste repositório, na memória
+   comum do programa, então a profundidade não é limitada pelo limite de recursão
+   do Python, apenas pela memória disponível
+3. Uma tabela de memorização opcional evita repetir chamadas com os mesmos argumentos
+4. Um perfil registra a profundidade máxima e o número de quadros por função
+
+Exemplo:
+
+    @recursiva
+    def fatorial(n):
+        if n <= 1:
+            return 1
+        return n * (yield fatorial(n - 1))
+    
+    MotorRecursao().executar(fatorial(5))  # 120
+"""
+
+import inspect
+import sys
+import time
+from functools import lru_cache
+
+from exemplo_pilha import PilhaLista
+from exemplo_pilha_segmentada import PilhaSegmentada
+
+
+AUSENTE = object()  # Marca de chamada ainda não memorizada
+
+
+def recursiva(funcao):
+    """
+    Decorador para funções recursivas escritas como geradores.
+    Chamar a função decorada não executa nada: retorna a chamada (função, argumentos),
+    que deve ser entregue ao motor com yield ou passada para MotorRecursao.executar.
+    """
+    if not inspect.isgeneratorfunction(funcao):
+        raise ValueError(f"A função {funcao.__name__} deve ser um gerador (usar yield)")
+    
+    def chamada(*argumentos):
+        return funcao, argumentos
+    
+    chamada.__name__ = funcao.__name__
+    chamada.__doc__ = funcao.__doc__
+    return chamada
+
+
+class MotorRecursao:
+    """
+    Executa chamadas recursivas com uma pilha explícita de quadros.
+    Cada quadro é (gerador, chamada). O gerador do topo roda até entregar uma nova
+    chamada, que vira um novo quadro, ou até retornar, quando o valor retornado é
+    enviado ao gerador do quadro de baixo.
+    'pilha_classe' pode ser qualquer pilha do repositório com empilhar e
+    desempilhar. Com memorizar=True, o resultado de cada chamada é guardado em uma
+    tabela, consultada antes de criar um novo quadro. Com perfilar=True, o número
+    de quadros criados por função também é registrado.
+    """
+    
+    def __init__(self, pilha_classe=PilhaLista, memorizar=False, perfilar=False):
+        self.pilha_classe = pilha_classe
+        self.memoria = {} if memorizar else None
+        self.perfilar = perfilar
+        self.quadros = 0  # Quadros (chamadas efetivamente executadas)
+        self.profundidade_maxima = 0
+        self.acertos_memoria = 0
+        self.quadros_por_funcao = {}
+    
+    def executar(self, chamada):
+        """Executa a chamada até o fim e retorna o seu resultado."""
+        memoria = self.memoria
+        if memoria is not None and chamada in memoria:
+            self.acertos_memoria += 1
+            return memoria[chamada]
+        
+        # O quadro em execução fica em variáveis locais; a pilha guarda apenas os
+        # quadros suspensos, à espera do resultado de uma chamada
+        pilha = self.pilha_classe()
+        empilhar = pilha.empilhar
+        desempilhar = pilha.desempilhar
+        consultar = memoria.get if memoria is not None else None
+        perfilar = self.perfilar
+        gerador = chamada[0](*chamada[1])
+        profundidade = 1
+        profundidade_maxima = self.profundidade_maxima
+        quadros = 1
+        acertos = 0
+        if perfilar:
+            self._registrar(chamada[0])
+        
+        valor = None
+        erro = None
+        while True:
+            try:
+                if erro is None:
+                    proxima = gerador.send(valor)
+                else:
+                    # Uma exceção sobe para o quadro de baixo, como na recursão comum
+                    excecao, erro = erro, None
+                    proxima = gerador.throw(excecao)
+            except StopIteration as fim:
+                valor = fim.value
+                if consultar is not None:
+                    memoria[chamada] = valor
+            except BaseException as excecao:
+                erro = excecao
+            else:
+                # O gerador entregou uma nova chamada
+                if consultar is not None:
+                    valor = consultar(proxima, AUSENTE)
+                    if valor is not AUSENTE:
+                        acertos += 1
+                        continue
+                empilhar((gerador, chamada))
+                chamada = proxima
+                gerador = proxima[0](*proxima[1])
+                valor = None
+                quadros += 1
+                profundidade += 1
+                if profundidade > profundidade_maxima:
+                    profundidade_maxima = profundidade
+                if perfilar:
+                    self._registrar(proxima[0])
+                continue
+            
+            # O quadro em execução terminou (com valor ou com exceção)
+            profundidade -= 1
+            if profundidade == 0:
+                break
+            gerador, chamada = desempilhar()
+        
+        self.quadros += quadros
+        self.acertos_memoria += acertos
+        self.profundidade_maxima = profundidade_maxima
+        if erro is not None:
+            raise erro
+        return valor
+    
+    def _registrar(self, funcao):
+        nome = funcao.__name__
+        self.quadros_por_funcao[nome] = self.quadros_por_funcao.get(nome, 0) + 1
+    
+    def perfil(self):
+        """Retorna um resumo das execuções feitas por este motor."""
+        return {
+            "quadros": self.quadros,
+            "profundidade_maxima": self.profundidade_maxima,
+            "acertos_memoria": self.acertos_memoria,
+            "quadros_por_funcao": dict(self.quadros_por_funcao),
+        }
+    
+    def limpar_memoria(self):
+        """Esvazia a tabela de memorização, se houver."""
+        if self.memoria is not None:
+            self.memoria.clear()
+
+
+# Funções de exemplo, escritas como geradores
+
+@recursiva
+def fatorial(n):
+    """Fatorial de n."""
+    if n <= 1:
+        return 1
+    return n * (yield fatorial(n - 1))
+
+
+@recursiva
+def fibonacci(n):
+    """n-ésimo número de Fibonacci, com duas chamadas recursivas."""
+    if n < 2:
+        return n
+    return (yield fibonacci(n - 1)) + (yield fibonacci(n - 2))
+
+
+@recursiva
+def altura(arvore):
+    """Altura de uma árvore representada por tuplas (valor, esquerda, direita)."""
+    if arvore is None:
+        return 0
+    _, esquerda, direita = arvore
+    return 1 + max((yield altura(esquerda)), (yield altura(direita)))
+
+
+@recursiva
+def soma_inversos(n):
+    """Soma 1/n + 1/(n-1) + ... + 1/0: falha no fundo da recursão."""
+    return 1 / n + (yield soma_inversos(n - 1))
+
+
+# Versões com recursão nativa, para comparação
+
+def fatorial_nativo(n):
+    if n <= 1:
+        return 1
+    return n * fatorial_nativo(n - 1)
+
+
+def fibonacci_nativo(n):
+    if n < 2:
+        return n
+    return fibonacci_nativo(n - 1) + fibonacci_nativo(n - 2)
+
+
+@lru_cache(maxsize=None)
+def fibonacci_nativo_cache(n):
+    if n < 2:
+        return n
+    return fibonacci_nativo_cache(n - 1) + fibonacci_nativo_cache(n - 2)
+
+
+def altura_nativa(arvore):
+    if arvore is None:
+        return 0
+    _, esquerda, direita = arvore
+    return 1 + max(altura_nativa(esquerda), altura_nativa(direita))
+
+
+def _arvore_degenerada(altura_total):
+    """Árvore em que cada nó só tem filho à esquerda: uma lista disfarçada de árvore."""
+    arvore = None
+    for valor in range(altura_total):
+        arvore = (valor, arvore, None)
+    return arvore
+
+
+def demonstrar_motor():
+    """Executa as funções de exemplo e mostra o perfil e a memorização."""
+    print("\n1. MOTOR DE RECURSÃO")
+    print("-" * 50)
+    
+    motor = MotorRecursao(perfilar=True)
+    print(f"fatorial(10) = {motor.executar(fatorial(10))}")
+    print(f"fibonacci(15) = {motor.executar(fibonacci(15))}")
+    print(f"Perfil: {motor.perfil()}")
+    
+    motor = MotorRecursao(memorizar=True, perfilar=True)
+    print(f"\nCom memorização: fibonacci(80) = {motor.executar(fibonacci(80))}")
+    print(f"Perfil: {motor.perfil()}")
+    
+    try:
+        MotorRecursao().executar(soma_inversos(5))
+    except ZeroDivisionError as erro:
+        print(f"\nsoma_inversos(5): a exceção do último quadro sobe por todos os outros "
+              f"até quem chamou: ZeroDivisionError({erro})")
+
+
+def demonstrar_profundidade(profundidade=200000):
+    """Compara a recursão nativa e o motor em uma recursão muito profunda."""
+    print("\n2. RECURSÃO PROFUNDA")
+    print("-" * 50)
+    
+    arvore = _arvore_degenerada(profundidade)
+    print(f"Árvore degenerada com altura {profundidade} "
+          f"(limite de recursão do Python: {sys.getrecursionlimit()})")
+    try:
+        altura_nativa(arvore)
+    except RecursionError:
+        print("Recursão nativa: RecursionError")
+    
+    for pilha_classe in (PilhaLista, PilhaSegmentada):
+        motor = MotorRecursao(pilha_classe)
+        inicio = time.perf_counter()
+        resultado = motor.executar(altura(arvore))
+        tempo = time.perf_counter() - inicio
+        print(f"Motor com {pilha_classe.__name__}: altura = {resultado} em {tempo:.3f} segundos "
+              f"(profundidade máxima: {motor.perfil()['profundidade_maxima']})")
+
+
+def comparar_desempenho(n=22):
+    """Mede o custo por chamada do motor em relação à recursão nativa."""
+    print("\n3. CUSTO POR CHAMADA")
+    print("-" * 50)
+    
+    inicio = time.perf_counter()
+    esperado = fibonacci_nativo(n)
+    tempo_nativo = time.perf_counter() - inicio
+    
+    motor = MotorRecursao()
+    inicio = time.perf_counter()
+    resultado = motor.executar(fibonacci(n))
+    tempo_motor = time.perf_counter() - inicio
+    chamadas = motor.perfil()["quadros"]
+    
+    print(f"fibonacci({n}) sem memorização: {chamadas} chamadas")
+    print(f"Recursão nativa: {tempo_nativo:.4f} segundos "
+          f"({tempo_nativo / chamadas * 1e9:.0f} ns por chamada)")
+    print(f"Motor:           {tempo_motor:.4f} segundos "
+          f"({tempo_motor / chamadas * 1e9:.0f} ns por chamada)")
+    print(f"Resultados iguais: {esperado == resultado}")
+    
+    inicio = time.perf_counter()
+    fibonacci_nativo_cache(300)
+    tempo_cache = time.perf_counter() - inicio
+    
+    motor = MotorRecursao(memorizar=True)
+    inicio = time.perf_counter()
+    motor.executar(fibonacci(300))
+    tempo_memoria = time.perf_counter() - inicio
+    print("\nfibonacci(300) com memorização:")
+    print(f"Recursão nativa + lru_cache: {tempo_cache * 1e3:.3f} ms")
+    print(f"Motor com memorizar=True:    {tempo_memoria * 1e3:.3f} ms")
+    
+    print("\nObservações:")
+    print("- O motor troca a profundidade limitada por um custo maior por chamada: cada")
+    print("  chamada cria um gerador e passa pelo laço do motor, enquanto a chamada nativa")
+    print("  de função é otimizada pelo próprio interpretador")
+    print("- A vantagem do motor é executar recursões de qualquer profundidade sem")
+    print("  RecursionError e sem alterar sys.setrecursionlimit")
+    print("- Com memorização, o número de chamadas cai de exponencial para linear, como")
+    print("  com lru_cache, mas sem o limite de profundidade")
+
+
+if __name__ == "__main__":
+    print("DEMONSTRAÇÃO DE MOTOR DE RECURSÃO COM PILHA EXPLÍCITA")
+    print("=" * 60)
+    
+    demonstrar_motor()
+    demonstrar_profundidade()
+    comparar_desempenho()